@@ -0,0 +1,354 @@
+"""Compiled, memory-mapped dataset indexes
+
+A compiled index holds the same data as a mirdata JSON index. Instead of
+parsing the whole JSON file, a reader memory-maps the file and resolves
+one track or multitrack at a time with a binary search over a sorted key
+table.
+
+File layout (all integers little-endian):
+
+- header: magic, format version, number of sections, size and mtime_ns of
+  the source JSON, and the offset/length of a JSON blob holding every
+  top-level field that is not a section (e.g. ``version``, ``metadata``)
+- section directory: one (name, table offset, number of entries,
+  sorted keys offset, key width) record per section (``tracks``,
+  ``multitracks``)
+- per section, an entry table in the original index order, where each
+  entry is (key offset, key length, value offset, value length), the
+  sorted keys as a fixed-width byte array, and the entry position of each
+  sorted key
+- a string heap with the utf-8 keys and compact JSON values
+
+Example:
+    .. code-block:: python
+
+        from mirdata import compiled_index
+
+        compiled_index.compile_index("billboard_index_2.0.json")
+        index = compiled_index.load_index("billboard_index_2.0.json")
+        index["tracks"]["3"]["audio"]
+
+"""
+
+import argparse
+import collections.abc
+import json
+import logging
+import mmap
+import os
+import struct
+
+import numpy as np
+
+#: File extension of compiled indexes, replacing ".json"
+COMPILED_INDEX_EXTENSION = ".mirx"
+
+#: Top-level index fields stored as searchable sections
+SECTIONS = ["tracks", "multitracks"]
+
+MAGIC = b"MIRINDEX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIQqQQ")
+SECTION_RECORD = struct.Struct("<32sQQQQ")
+ENTRY_DTYPE = np.dtype(
+    [
+        ("key_offset", "<u8"),
+        ("key_length", "<u4"),
+        ("value_offset", "<u8"),
+        ("value_length", "<u4"),
+    ]
+)
+ORDER_DTYPE = np.dtype("<u4")
+
+
+def compiled_index_path(index_path):
+    """Get the path of the compiled index for a JSON index
+
+    Args:
+        index_path (str): path to a JSON index
+
+    Returns:
+        str: path to the compiled index
+    """
+    return os.path.splitext(index_path)[0] + COMPILED_INDEX_EXTENSION
+
+
+def compile_index(index_path, output_path=None):
+    """Compile a JSON index into the memory-mappable format
+
+    The file is written to a temporary path and renamed, so readers never
+    see a partially written index.
+
+    Args:
+        index_path (str): path to a JSON index
+        output_path (str or None): where to write the compiled index.
+            If None, uses compiled_index_path(index_path).
+
+    Returns:
+        str: path to the compiled index
+    """
+    output_path = output_path or compiled_index_path(index_path)
+    with open(index_path, encoding="utf-8") as fhandle:
+        index = json.load(fhandle)
+    stat = os.stat(index_path)
+
+    sections = [name for name in SECTIONS if isinstance(index.get(name), dict)]
+    rest = json.dumps(
+        {k: v for k, v in index.items() if k not in sections},
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    # fixed-size parts first, then the heap
+    offset = HEADER.size + SECTION_RECORD.size * len(sections)
+    records = []
+    tables = []
+    heap = [rest]
+    key_widths = {
+        name: max([len(key.encode("utf-8")) for key in index[name]] + [1])
+        for name in sections
+    }
+    heap_offset = offset + sum(
+        len(index[name])
+        * (ENTRY_DTYPE.itemsize + key_widths[name] + ORDER_DTYPE.itemsize)
+        for name in sections
+    )
+    rest_offset = heap_offset
+    heap_offset += len(rest)
+    for name in sections:
+        entries = index[name]
+        table = np.zeros(len(entries), dtype=ENTRY_DTYPE)
+        keys = []
+        for i, (key, value) in enumerate(entries.items()):
+            key_bytes = key.encode("utf-8")
+            value_bytes = json.dumps(value, separators=(",", ":")).encode(
+                "utf-8"
+            )
+            table[i] = (
+                heap_offset,
+                len(key_bytes),
+                heap_offset + len(key_bytes),
+                len(value_bytes),
+            )
+            heap.extend([key_bytes, value_bytes])
+            heap_offset += len(key_bytes) + len(value_bytes)
+            keys.append(key_bytes)
+
+        order = np.array(
+            sorted(range(len(keys)), key=keys.__getitem__), dtype=ORDER_DTYPE
+        )
+        sorted_keys = np.array(
+            [keys[i] for i in order], dtype="S{}".format(key_widths[name])
+        )
+        sorted_keys_offset = offset + table.nbytes
+        records.append(
+            SECTION_RECORD.pack(
+                name.encode("utf-8"),
+                offset,
+                len(entries),
+                sorted_keys_offset,
+                key_widths[name],
+            )
+        )
+        tables.extend(
+            [table.tobytes(), sorted_keys.tobytes(), order.tobytes()]
+        )
+        offset = sorted_keys_offset + sorted_keys.nbytes + order.nbytes
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(sections),
+        stat.st_size,
+        stat.st_mtime_ns,
+        rest_offset,
+        len(rest),
+    )
+    tmp_path = "{}.{}.tmp".format(output_path, os.getpid())
+    with open(tmp_path, "wb") as fhandle:
+        fhandle.write(header)
+        fhandle.writelines(records)
+        fhandle.writelines(tables)
+        fhandle.writelines(heap)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def load_index(index_path):
+    """Open the compiled version of a JSON index, if it is up to date
+
+    Args:
+        index_path (str): path to a JSON index
+
+    Returns:
+        CompiledIndex or None: the compiled index, or None if there is no
+        compiled index, it is older than the JSON index, or it cannot be
+        read (e.g. truncated or written by another format version)
+    """
+    path = compiled_index_path(index_path)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        index = CompiledIndex(path)
+    except (OSError, ValueError, struct.error) as exc:
+        logging.warning(
+            "Ignoring unreadable compiled index {}: {}".format(path, exc)
+        )
+        return None
+
+    try:
+        stat = os.stat(index_path)
+    except OSError:
+        # the compiled index was shipped without its source
+        return index
+
+    if (stat.st_size, stat.st_mtime_ns) != index.source_stat:
+        index.close()
+        return None
+    return index
+
+
+class CompiledIndex(collections.abc.Mapping):
+    """Read-only, dict-like view of a compiled index
+
+    ``index["tracks"]`` and ``index["multitracks"]`` are lazy
+    CompiledSection mappings, and all other fields are plain python
+    objects.
+
+    Attributes:
+        path (str): path to the compiled index
+        source_stat (tuple): (size, mtime_ns) of the JSON it was compiled from
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fhandle:
+            self._mmap = mmap.mmap(
+                fhandle.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        (
+            magic,
+            version,
+            n_sections,
+            source_size,
+            source_mtime_ns,
+            rest_offset,
+            rest_length,
+        ) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("{} is not a compiled mirdata index".format(path))
+        self.source_stat = (source_size, source_mtime_ns)
+
+        self._fields = json.loads(
+            self._mmap[rest_offset : rest_offset + rest_length]
+        )
+        for i in range(n_sections):
+            name, *layout = SECTION_RECORD.unpack_from(
+                self._mmap, HEADER.size + i * SECTION_RECORD.size
+            )
+            self._fields[name.rstrip(b"\0").decode("utf-8")] = (
+                CompiledSection(self._mmap, *layout)
+            )
+
+    def __getitem__(self, key):
+        return self._fields[key]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def close(self):
+        """Release the memory map"""
+        self._fields = {}
+        self._mmap.close()
+
+
+class CompiledSection(collections.abc.Mapping):
+    """Lazy mapping from track (or multitrack) id to its index entry
+
+    Lookups binary-search the sorted keys and only decode the requested
+    entry. Iteration follows the order of the source JSON.
+
+    """
+
+    def __init__(
+        self, buffer, table_offset, n_entries, sorted_keys_offset, key_width
+    ):
+        self._buffer = buffer
+        self._key_width = key_width
+        self._table = np.frombuffer(
+            buffer, dtype=ENTRY_DTYPE, count=n_entries, offset=table_offset
+        )
+        self._sorted_keys = np.frombuffer(
+            buffer,
+            dtype="S{}".format(key_width),
+            count=n_entries,
+            offset=sorted_keys_offset,
+        )
+        self._order = np.frombuffer(
+            buffer,
+            dtype=ORDER_DTYPE,
+            count=n_entries,
+            offset=sorted_keys_offset + n_entries * key_width,
+        )
+        # a truncated file loses the end of the string heap
+        if n_entries:
+            table = self._table
+            key_end = np.max(table["key_offset"] + table["key_length"])
+            value_end = np.max(table["value_offset"] + table["value_length"])
+            if max(key_end, value_end) > len(buffer):
+                raise ValueError("compiled index is truncated")
+
+    def _find(self, key):
+        """Position of key in the entry table, or -1 if it is missing"""
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        # numpy strips trailing nulls, so such keys cannot be matched
+        if len(target) > self._key_width or target.endswith(b"\0"):
+            return -1
+        i = int(np.searchsorted(self._sorted_keys, target))
+        if i < len(self._sorted_keys) and self._sorted_keys[i] == target:
+            return int(self._order[i])
+        return -1
+
+    def __contains__(self, key):
+        return self._find(key) != -1
+
+    def __getitem__(self, key):
+        position = self._find(key)
+        if position == -1:
+            raise KeyError(key)
+        entry = self._table[position]
+        start = int(entry["value_offset"])
+        return json.loads(
+            self._buffer[start : start + int(entry["value_length"])]
+        )
+
+    def __iter__(self):
+        starts = self._table["key_offset"].tolist()
+        lengths = self._table["key_length"].tolist()
+        for start, length in zip(starts, lengths):
+            yield self._buffer[start : start + length].decode("utf-8")
+
+    def __len__(self):
+        return len(self._table)
+
+
+def main():
+    """Command line entry point: ``python -m mirdata.compiled_index``"""
+    parser = argparse.ArgumentParser(
+        description="Compile mirdata JSON indexes for fast loading"
+    )
+    parser.add_argument("index_paths", nargs="+", help="JSON index files")
+    args = parser.parse_args()
+    for index_path in args.index_paths:
+        print(compile_index(index_path))
+
+
+if __name__ == "__main__":
+    main()
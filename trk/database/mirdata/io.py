@@ -0,0 +1,236 @@
+import functools
+import io
+from typing import Any, BinaryIO, Callable, List, Optional, TextIO, Union
+
+import numpy as np
+import pretty_midi
+from smart_open import open
+
+from mirdata import annotations
+
+
+def coerce_to_string_io(func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, TextIO]],
+        *args: Optional[Any],
+        **kwargs: Optional[Any],
+    ) -> Optional[Any]:
+        if not file_path_or_obj:
+            return None
+        if isinstance(file_path_or_obj, str):
+            with open(file_path_or_obj, encoding="utf-8") as f:
+                return func(f, *args, **kwargs)
+        elif isinstance(file_path_or_obj, io.StringIO):
+            return func(file_path_or_obj, *args, **kwargs)
+        else:
+            raise ValueError(
+                "Invalid argument passed to {}, argument has the type {}",
+                func.__name__,
+                type(file_path_or_obj),
+            )
+
+    return wrapper
+
+
+def coerce_to_bytes_io(func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, BinaryIO]],
+        *args: Optional[Any],
+        **kwargs: Optional[Any],
+    ) -> Optional[Any]:
+        if not file_path_or_obj:
+            return None
+        if isinstance(file_path_or_obj, str):
+            with open(file_path_or_obj, "rb") as f:
+                return func(f, *args, **kwargs)
+        elif isinstance(file_path_or_obj, io.BytesIO):
+            return func(file_path_or_obj, *args, **kwargs)
+        else:
+            raise ValueError(
+                "Invalid argument passed to {}, argument has the type {}",
+                func.__name__,
+                type(file_path_or_obj),
+            )
+
+    return wrapper
+
+
+@coerce_to_bytes_io
+def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
+    """Load a midi file.
+
+    Args:
+        fhandle (str or file-like): File-like object or path to midi file
+
+    Returns:
+        pretty_midi.PrettyMIDI: pretty_midi object
+
+    """
+    return pretty_midi.PrettyMIDI(fhandle)
+
+
+def load_notes_from_midi(
+    midi_path: Optional[Union[str, BinaryIO]] = None,
+    midi: Optional[pretty_midi.PrettyMIDI] = None,
+    skip_drums: bool = True,
+) -> Optional[annotations.NoteData]:
+    """Load note data from a midi file
+
+    Args:
+        midi_path (str or None): path to midi file or None
+        midi (pretty_midi.PrettyMIDI or None): pre-loaded midi object or None
+            if None, the midi object is loaded using midi_path
+        skip_drums (bool): if True, skips notes from intruments which are drums.
+
+    Returns:
+        NoteData: note annotations
+
+    """
+    if not midi and not midi_path:
+        raise ValueError("At least one of midi_path or midi must be provided")
+    elif not midi:
+        midi = load_midi(midi_path)
+
+    intervals = []
+    pitches = []
+    confidence = []
+    for instrument in midi.instruments:  # type: ignore
+        if instrument.is_drum and skip_drums:
+            continue
+
+        # remove notes which have start_time >= end_time
+        instrument.remove_invalid_notes()
+        for note in instrument.notes:
+            intervals.append([note.start, note.end])
+            pitches.append(note.pitch)
+            confidence.append(note.velocity)
+
+    # if there are no notes, return None
+    if len(intervals) == 0:
+        return None
+
+    return annotations.NoteData(
+        np.array(intervals),
+        "s",
+        np.array(pitches, dtype=float),
+        "midi",
+        np.array(confidence, dtype=float),
+        "velocity",
+    )
+
+
+def load_multif0_from_midi(
+    midi_path: Optional[Union[str, BinaryIO]] = None,
+    midi: Optional[pretty_midi.PrettyMIDI] = None,
+    skip_drums: bool = True,
+    pitch_bend: bool = False,
+    hop: Optional[float] = None,
+) -> Optional[annotations.MultiF0Data]:
+    """Load multif0 data from a midi file, optionally considering pitch bend information
+
+    Args:
+        midi_path (str or None): path to midi file or None
+        midi (pretty_midi.PrettyMIDI or None): pre-loaded midi object or None
+            if None, the midi object is loaded using midi_path
+        skip_drums (bool): if True, skips notes from intruments which are drums.
+        pitch_bend (bool): if True, adjusts pitch values containing pitch bend information.
+        hop (float or None): time between frames in seconds. If None, the
+            smallest time difference between two MIDI ticks is used.
+
+    Returns:
+        MultiF0Data: multif0 annotation
+
+    """
+    if not midi and not midi_path:
+        raise ValueError("At least one of midi_path or midi must be provided")
+    elif not midi:
+        midi = load_midi(midi_path)
+
+    if hop is not None and hop <= 0:
+        raise ValueError("hop must be positive, got {}".format(hop))
+
+    times_raw = midi._PrettyMIDI__tick_to_time  # type: ignore
+    time_hop = np.min(np.diff(times_raw)) if hop is None else hop
+    times = np.arange(0, np.max(times_raw) + time_hop, time_hop)
+
+    time_idx: List[np.ndarray] = []
+    pitch_val: List[np.ndarray] = []
+    conf_val: List[np.ndarray] = []
+    for instrument in midi.instruments:  # type: ignore
+        if instrument.is_drum and skip_drums:
+            continue
+
+        # remove notes which have start_time >= end_time
+        instrument.remove_invalid_notes()
+        if len(instrument.notes) == 0:
+            continue
+
+        notes = np.array(
+            [
+                (note.start, note.end, note.pitch, note.velocity)
+                for note in instrument.notes
+            ],
+            dtype=float,
+        )
+        # expand each note into the frames it covers, in note order
+        start_idx = _time_to_index(notes[:, 0], time_hop)
+        n_frames = _time_to_index(notes[:, 1], time_hop) - start_idx + 1
+        n_frames = np.maximum(n_frames, 0)
+        run_offsets = np.cumsum(n_frames) - n_frames
+        note_time_idx = (
+            np.repeat(start_idx, n_frames)
+            + np.arange(np.sum(n_frames))
+            - np.repeat(run_offsets, n_frames)
+        )
+        note_pitch = np.repeat(notes[:, 2], n_frames)
+
+        # pitch bends apply to the frames they fall on; when several bends
+        # share a frame the first one wins
+        if pitch_bend and len(instrument.pitch_bends) > 0:
+            pb_idx, pb_first = np.unique(
+                _time_to_index(
+                    np.array([p.time for p in instrument.pitch_bends]),
+                    time_hop,
+                ),
+                return_index=True,
+            )
+            pb_shifts = pretty_midi.utilities.pitch_bend_to_semitones(
+                np.array([p.pitch for p in instrument.pitch_bends])
+            )[pb_first]
+            pos = np.searchsorted(pb_idx, note_time_idx)
+            pos[pos == len(pb_idx)] = 0
+            has_bend = pb_idx[pos] == note_time_idx
+            note_pitch[has_bend] += pb_shifts[pos[has_bend]]
+
+        time_idx.append(note_time_idx)
+        pitch_val.append(note_pitch)
+        conf_val.append(np.repeat(notes[:, 3], n_frames))
+
+    if len(time_idx) == 0:
+        return None
+
+    # group values by frame, keeping instrument and note order within a frame
+    all_time_idx = np.concatenate(time_idx)
+    order = np.argsort(all_time_idx, kind="stable")
+    offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(all_time_idx, minlength=len(times)))]
+    )
+    pitches_sorted = np.concatenate(pitch_val)[order].tolist()
+    confidence_sorted = np.concatenate(conf_val)[order].tolist()
+    freqs_list = [
+        pitches_sorted[i:j] for i, j in zip(offsets[:-1], offsets[1:])
+    ]
+    confidence = [
+        confidence_sorted[i:j] for i, j in zip(offsets[:-1], offsets[1:])
+    ]
+
+    return annotations.MultiF0Data(
+        times, "s", freqs_list, "midi", confidence, "velocity"
+    )
+
+
+def _time_to_index(times_in_sec: np.ndarray, hop: float) -> np.ndarray:
+    """Convert times in seconds to indexes of a frame grid with the given hop"""
+    return np.round(times_in_sec / hop).astype(int)
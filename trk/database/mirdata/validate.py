@@ -0,0 +1,430 @@
+"""Utility functions for mirdata"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import tqdm
+
+from smart_open import open
+
+#: Size of the blocks read when hashing a file
+CHUNK_SIZE = 1024 * 1024
+
+#: Name of the checksum cache file written to a dataset's data_home
+CHECKSUM_CACHE_NAME = ".mirdata_checksums.json"
+
+#: md5 checksum of an empty file
+EMPTY_MD5 = "d41d8cd98f00b204e9800998ecf8427e"
+
+
+def md5(file_path, chunk_size=CHUNK_SIZE):
+    """Get md5 hash of a file.
+
+    Args:
+        file_path (str): File path
+        chunk_size (int): number of bytes read at a time
+
+    Returns:
+        str: md5 hash of data in file_path
+
+    """
+    hash_md5 = hashlib.md5()
+    with open(file_path, "rb", compression="disable") as fhandle:
+        for chunk in iter(lambda: fhandle.read(chunk_size), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
+def load_checksum_cache(cache_path):
+    """Load a checksum cache written by save_checksum_cache
+
+    Args:
+        cache_path (str): path to the cache file
+
+    Returns:
+        dict: mapping of absolute file path to [size, mtime_ns, md5].
+        Empty if the cache does not exist or cannot be read.
+
+    """
+    try:
+        with open(cache_path, "r") as fhandle:
+            return json.load(fhandle)["files"]
+    except (IOError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def save_checksum_cache(cache_path, cache):
+    """Atomically write a checksum cache next to a dataset
+
+    Failures are logged and ignored, e.g. when data_home is read-only.
+
+    Args:
+        cache_path (str): path to the cache file
+        cache (dict): mapping of absolute file path to [size, mtime_ns, md5]
+
+    """
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        with open(tmp_path, "w") as fhandle:
+            json.dump({"version": 1, "files": cache}, fhandle)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logging.warning(
+            "Could not write checksum cache {}: {}".format(cache_path, exc)
+        )
+
+
+def log_message(message, verbose=True):
+    """Helper function to log message
+
+    Args:
+        message (str): message to log
+        verbose (bool): if false, the message is not logged
+
+    """
+    if verbose:
+        logging.info(message)
+
+
+def validate(local_path, checksum):
+    """Validate that a file exists and has the correct checksum
+
+    Args:
+        local_path (str): file path
+        checksum (str): md5 checksum
+
+    Returns:
+        * bool - True if file exists
+        * bool - True if checksum matches
+
+    """
+    # validate that the file exists on disk
+    try:
+        with open(local_path):
+            pass
+    except IOError:
+        return False, False
+
+    # validate that the checksum matches
+    if md5(local_path) != checksum:
+        valid = False
+    else:
+        valid = True
+
+    return True, valid
+
+
+def validate_files(file_dict, data_home, verbose, **kwargs):
+    """Validate files
+
+    Args:
+        file_dict (dict): dictionary of file information
+        data_home (str): path where the data lives
+        verbose (bool): if True, show progress
+        **kwargs: options passed to validate_paths
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums
+
+    """
+    file_list = []
+    for file_id, file in file_dict.items():
+        for tracks in file.keys():
+            # multitrack case
+            if tracks == "tracks":
+                continue
+            # tracks
+            else:
+                filepath = file[tracks][0]
+                checksum = file[tracks][1]
+                if filepath is not None:
+                    local_path = os.path.join(data_home, filepath)
+                    file_list.append((file_id, local_path, checksum))
+
+    return validate_paths(file_list, verbose, **kwargs)
+
+
+def validate_metadata(file_dict, data_home, verbose, **kwargs):
+    """Validate files
+
+    Args:
+        file_dict (dict): dictionary of file information
+        data_home (str): path where the data lives
+        verbose (bool): if True, show progress
+        **kwargs: options passed to validate_paths
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums
+
+    """
+    file_list = []
+    for file_id, file in file_dict.items():
+        filepath = file[0]
+        checksum = file[1]
+        if filepath is not None:
+            local_path = os.path.join(data_home, filepath)
+            file_list.append((file_id, local_path, checksum))
+
+    return validate_paths(file_list, verbose, **kwargs)
+
+
+def validate_paths(
+    file_list,
+    verbose,
+    num_workers=None,
+    use_processes=False,
+    fast=False,
+    cache=None,
+):
+    """Validate a list of files, hashing them on a worker pool
+
+    Local files whose (path, size, mtime_ns) match an entry in the cache
+    are not re-hashed, and new checksums are added to the cache.
+
+    Args:
+        file_list (list): list of (file_id, local_path, checksum) tuples
+        verbose (bool): if True, show progress
+        num_workers (int or None): number of workers used for hashing.
+            If None, uses the executor's default.
+        use_processes (bool): if True, hash on a process pool instead of
+            a thread pool
+        fast (bool): if True, only check that files exist and have a
+            plausible size (non-empty, and equal to the cached size for
+            the same checksum), without hashing
+        cache (dict or None): checksum cache, as returned by
+            load_checksum_cache. Updated in place.
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums
+
+    """
+    cache = {} if cache is None else cache
+    cached_sizes = {entry[2]: entry[0] for entry in cache.values()}
+
+    # (exists, valid) for each file, filled in from the cache, the fast
+    # checks or the worker pool
+    results = [None] * len(file_list)
+    to_hash = {}
+    for i, (_, local_path, checksum) in enumerate(file_list):
+        try:
+            stat = os.stat(local_path)
+        except OSError:
+            # missing, or not on the local filesystem (e.g. a remote uri)
+            results[i] = validate(local_path, checksum)
+            continue
+
+        entry = cache.get(os.path.abspath(local_path))
+        if entry is not None and entry[:2] == [
+            stat.st_size,
+            stat.st_mtime_ns,
+        ]:
+            results[i] = (True, entry[2] == checksum)
+        elif fast:
+            plausible_size = (stat.st_size == 0) == (checksum == EMPTY_MD5)
+            known_size = cached_sizes.get(checksum, stat.st_size)
+            results[i] = (True, plausible_size and known_size == stat.st_size)
+        else:
+            to_hash[i] = stat
+
+    if use_processes:
+        executor = concurrent.futures.ProcessPoolExecutor(num_workers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(num_workers)
+    with executor:
+        futures = {
+            executor.submit(md5, file_list[i][1]): i for i in to_hash
+        }
+        for future in tqdm.tqdm(
+            concurrent.futures.as_completed(futures),
+            total=len(futures),
+            disable=not verbose,
+        ):
+            i = futures[future]
+            _, local_path, checksum = file_list[i]
+            try:
+                file_md5 = future.result()
+            except IOError:
+                results[i] = (False, False)
+                continue
+
+            stat = to_hash[i]
+            cache[os.path.abspath(local_path)] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+                file_md5,
+            ]
+            results[i] = (True, file_md5 == checksum)
+
+    missing = {}
+    invalid = {}
+    for (file_id, local_path, _), (exists, valid) in zip(file_list, results):
+        if not exists:
+            missing.setdefault(file_id, []).append(local_path)
+        elif not valid:
+            invalid.setdefault(file_id, []).append(local_path)
+
+    return missing, invalid
+
+
+def validate_index(
+    dataset_index, data_home, verbose=True, cache_path=None, **kwargs
+):
+    """Validate files in a dataset's index
+
+    Args:
+        dataset_index (list): dataset indices
+        data_home (str): Local home path that the dataset is being stored
+        verbose (bool): if true, prints validation status while running
+        cache_path (str or None): path to a checksum cache file. If given,
+            unchanged files are not re-hashed and the cache is updated.
+        **kwargs: options passed to validate_paths, e.g. num_workers,
+            use_processes or fast
+
+    Returns:
+        * dict - file paths that are in the index but missing locally
+        * dict - file paths with differing checksums
+
+    """
+    missing_files = {}
+    invalid_checksums = {}
+    if cache_path is not None:
+        kwargs["cache"] = load_checksum_cache(cache_path)
+
+    # check index
+    if "metadata" in dataset_index and dataset_index["metadata"] is not None:
+        missing_metadata, invalid_metadata = validate_metadata(
+            dataset_index["metadata"], data_home, verbose, **kwargs
+        )
+        missing_files["metadata"] = missing_metadata
+        invalid_checksums["metadata"] = invalid_metadata
+
+    if "tracks" in dataset_index and dataset_index["tracks"] is not None:
+        missing_tracks, invalid_tracks = validate_files(
+            dataset_index["tracks"], data_home, verbose, **kwargs
+        )
+        missing_files["tracks"] = missing_tracks
+        invalid_checksums["tracks"] = invalid_tracks
+
+    if (
+        "multitracks" in dataset_index
+        and dataset_index["multitracks"] is not None
+    ):
+        missing_multitracks, invalid_multitracks = validate_files(
+            dataset_index["multitracks"], data_home, verbose, **kwargs
+        )
+        missing_files["multitracks"] = missing_multitracks
+        invalid_checksums["multitracks"] = invalid_multitracks
+
+    if cache_path is not None:
+        save_checksum_cache(cache_path, kwargs["cache"])
+
+    return missing_files, invalid_checksums
+
+
+def validator(dataset_index, data_home, verbose=True, **kwargs):
+    """Checks the existence and validity of files stored locally with
+    respect to the paths and file checksums stored in the reference index.
+    Logs invalid checksums and missing files.
+
+    Args:
+        dataset_index (list): dataset indices
+        data_home (str): Local home path that the dataset is being stored
+        verbose (bool): if True (default), prints missing and invalid files
+            to stdout. Otherwise, this function is equivalent to validate_index.
+        **kwargs: options passed to validate_index, e.g. cache_path,
+            num_workers, use_processes or fast
+
+    Returns:
+        missing_files (list): List of file paths that are in the dataset index
+            but missing locally.
+        invalid_checksums (list): List of file paths that file exists in the
+            dataset index but has a different checksum compare to the reference
+            checksum.
+
+    """
+    missing_files, invalid_checksums = validate_index(
+        dataset_index, data_home, verbose, **kwargs
+    )
+
+    # print path of any missing files
+    has_any_missing_file = False
+    for file_id in missing_files:
+        if len(missing_files[file_id]) > 0:
+            log_message("Files missing for {}:".format(file_id), verbose)
+            for fpath in missing_files[file_id]:
+                log_message(fpath, verbose)
+            log_message("-" * 20, verbose)
+            has_any_missing_file = True
+
+    # print path of any invalid checksums
+    has_any_invalid_checksum = False
+    for file_id in invalid_checksums:
+        if len(invalid_checksums[file_id]) > 0:
+            log_message("Invalid checksums for {}:".format(file_id), verbose)
+            for fpath in invalid_checksums[file_id]:
+                log_message(fpath, verbose)
+            log_message("-" * 20, verbose)
+            has_any_invalid_checksum = True
+
+    if not (has_any_missing_file or has_any_invalid_checksum):
+        log_message(
+            "Success: the dataset is complete and all files are valid.",
+            verbose,
+        )
+        log_message("-" * 20, verbose)
+
+    return missing_files, invalid_checksums
+
+
+def main():
+    """Command line entry point: ``python -m mirdata.validate <dataset>``"""
+    import mirdata
+
+    parser = argparse.ArgumentParser(
+        description="Validate a local copy of a mirdata dataset"
+    )
+    parser.add_argument("dataset", help="dataset name, e.g. billboard")
+    parser.add_argument("--data-home", default=None, help="dataset location")
+    parser.add_argument("--version", default="default", help="index version")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="number of hash workers"
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="hash on a process pool instead of a thread pool",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="only check that files exist and have a plausible size",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore and do not update the checksum cache",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    dataset = mirdata.initialize(args.dataset, args.data_home, args.version)
+    missing_files, invalid_checksums = dataset.validate(
+        num_workers=args.workers,
+        use_processes=args.processes,
+        fast=args.fast,
+        use_cache=not args.no_cache,
+    )
+    has_errors = any(missing_files.values()) or any(
+        invalid_checksums.values()
+    )
+    raise SystemExit(1 if has_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
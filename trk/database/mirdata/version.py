@@ -0,0 +1,5 @@
+#!/usr/bin/env python
+"""Version info"""
+
+short_version = "0.3"
+version = "0.3.9"
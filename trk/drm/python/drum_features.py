@@ -0,0 +1,419 @@
+"""
+Drum Feature Extractor
+
+Shared by the Groove MIDI explorer, section classifier and component
+separator. A MIDI file is parsed once into note arrays (onset, duration,
+pitch, velocity of every drum note) and all the metrics the tools use are
+computed from them with numpy:
+
+- file info: duration, instruments, tempo and time signature changes
+- density, velocity statistics and per-pitch counts and velocities
+- swing (overall and per bar), main subdivision and fill detection,
+  on beat positions that follow the tempo map
+- 16th-note grid complexity, kick/snare regularity and pattern variation
+- per-component statistics (kick, snare, hihat, ...)
+
+Results are cached on disk, one .npz file per MIDI file, and reused as long
+as the size and modification time of the MIDI file are unchanged, so
+running the three tools over the same corpus costs one parse per file:
+
+    features = load_drum_features("groove.mid")
+    features["density"], features["swing_percentage"], features.onset
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+
+import numpy as np
+import pretty_midi
+
+from pattern_repeats import repeat_coverage
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, "data", "cache", "drum_features")
+# bump when the metrics change, so that cached files are recomputed
+CACHE_VERSION = 2
+
+DEFAULT_TEMPO = 120.0
+
+# Component definitions mapping MIDI note numbers to drum types
+DRUM_COMPONENTS = {
+    "kick": [35, 36],                            # Kick drums
+    "snare": [38, 40, 37, 31],                   # Snare and rim
+    "hihat": [42, 44, 46, 26, 22],              # Hi-hat variations
+    "toms": [41, 43, 45, 47, 48, 50, 58],       # All toms
+    "cymbals": [49, 51, 52, 53, 55, 57, 59],    # Crash and ride cymbals
+    "percussion": [39, 54, 56, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80]  # Various percussion
+}
+OTHER_COMPONENT = "other"
+
+# Pitches used for the kick and snare regularity of the 16th-note grid
+KICK_PITCHES = [35, 36]
+SNARE_PITCHES = [38, 40]
+
+# Metrics keyed by MIDI pitch (JSON turns the keys into strings)
+_PITCH_KEYED = ("note_counts", "pitch_mean_velocity", "pitch_velocity_std")
+
+NOTE_ARRAYS = ("onset", "duration", "pitch", "velocity", "track")
+
+
+def component_index():
+    """Component of every MIDI pitch, as indices into component_names()"""
+    names = component_names()
+    index = np.full(128, names.index(OTHER_COMPONENT))
+    # the first component listing a pitch wins
+    for i, pitches in reversed(list(enumerate(DRUM_COMPONENTS.values()))):
+        index[pitches] = i
+    return index
+
+
+def component_names():
+    return list(DRUM_COMPONENTS) + [OTHER_COMPONENT]
+
+
+class DrumFeatures:
+    """Drum notes and metrics of one MIDI file, see load_drum_features"""
+
+    def __init__(self, path, arrays, metrics):
+        self.path = path
+        self.arrays = arrays
+        self.metrics = metrics
+        # notes of all drum instruments, in file order
+        self.onset = arrays["onset"]
+        self.duration = arrays["duration"]
+        self.pitch = arrays["pitch"]
+        self.velocity = arrays["velocity"]
+        self.track = arrays["track"]
+        self.tempo_times = arrays["tempo_times"]
+        self.tempi = arrays["tempi"]
+
+    def __getitem__(self, name):
+        return self.metrics[name]
+
+    def get(self, name, default=None):
+        return self.metrics.get(name, default)
+
+    def order(self):
+        """Indices of the notes sorted by onset (stable)"""
+        return np.argsort(self.onset, kind="stable")
+
+    def notes(self, mask=None):
+        """
+        Rebuild pretty_midi notes, e.g. to write component files.
+
+        Args:
+            mask: optional boolean array or indices selecting notes
+
+        Returns:
+            List of pretty_midi.Note in file order
+        """
+        index = np.arange(len(self.onset)) if mask is None else np.arange(len(self.onset))[mask]
+        return [
+            pretty_midi.Note(velocity=int(self.velocity[i]), pitch=int(self.pitch[i]),
+                             start=float(self.onset[i]), end=float(self.onset[i] + self.duration[i]))
+            for i in index.tolist()
+        ]
+
+
+def read_drum_notes(midi_path):
+    """
+    Parse a MIDI file into drum note arrays.
+
+    Returns:
+        (arrays, info): dict of numpy arrays (NOTE_ARRAYS plus tempo_times and
+        tempi) and dict of file-level information
+    """
+    midi_data = pretty_midi.PrettyMIDI(midi_path)
+    notes = []
+    drum_tracks = 0
+    for instrument in midi_data.instruments:
+        if instrument.is_drum:
+            notes.extend((note.start, note.end - note.start, note.pitch, note.velocity, drum_tracks)
+                         for note in instrument.notes)
+            drum_tracks += 1
+    columns = np.array(notes, dtype=float).reshape(len(notes), 5)
+    tempo_times, tempi = midi_data.get_tempo_changes()
+    # bar length in quarter-note beats, from the first time signature
+    bar_beats = 4.0
+    if midi_data.time_signature_changes:
+        signature = midi_data.time_signature_changes[0]
+        bar_beats = signature.numerator * 4 / signature.denominator
+    arrays = {
+        "onset": columns[:, 0],
+        "duration": columns[:, 1],
+        "pitch": columns[:, 2].astype(np.int64),
+        "velocity": columns[:, 3].astype(np.int64),
+        "track": columns[:, 4].astype(np.int64),
+        "tempo_times": np.asarray(tempo_times, dtype=float),
+        "tempi": np.asarray(tempi, dtype=float),
+    }
+    info = {
+        "duration": float(midi_data.get_end_time()),
+        "num_instruments": len(midi_data.instruments),
+        "drum_tracks": drum_tracks,
+        "time_signature_changes": len(midi_data.time_signature_changes),
+        "tempo_changes": len(tempo_times),
+        "tempo": float(tempi[0]) if len(tempi) else DEFAULT_TEMPO,
+        "bar_beats": bar_beats,
+    }
+    return arrays, info
+
+
+def beat_positions(onsets, tempo_times, tempi):
+    """
+    Position of every onset in quarter-note beats, following the tempo map.
+
+    Args:
+        onsets: times in seconds
+        tempo_times, tempi: tempo changes, as from get_tempo_changes()
+    """
+    onsets = np.asarray(onsets, dtype=float)
+    tempo_times = np.asarray(tempo_times, dtype=float)
+    tempi = np.asarray(tempi, dtype=float)
+    if not len(tempi):
+        return onsets * DEFAULT_TEMPO / 60
+    # beats elapsed at every tempo change
+    change_beats = np.concatenate([[0.0], np.cumsum(np.diff(tempo_times) * tempi[:-1] / 60)])
+    segment = np.maximum(np.searchsorted(tempo_times, onsets, side="right") - 1, 0)
+    return change_beats[segment] + (onsets - tempo_times[segment]) * tempi[segment] / 60
+
+
+def _swing_from_ratios(ratios):
+    # 1.0 = straight (0%), 1.5 = typical swing (50%), 2.0 = hard swing (100%)
+    return np.clip((ratios - 1.0) * 100, 0, 100)
+
+
+def swing(beats, bar_beats=4.0):
+    """
+    Detect swing from pairs of consecutive 8th-note intervals.
+
+    Two consecutive intervals of 0.35-0.65 beats form a pair; the ratio of
+    the first to the second is its swing (pairs outside 0.5-2.0 are
+    ignored).
+
+    Args:
+        beats: beat position of every note (see beat_positions)
+        bar_beats: length of a bar in beats
+
+    Returns:
+        (percentage, curve): the swing of the whole pattern, 0 for straight,
+        50 for a typical 1.5 ratio and 100 for a hard 2.0 swing, and a list
+        with the swing of every bar (None for bars without 8th-note pairs)
+    """
+    beats = np.sort(beats)
+    n_bars = int(beats[-1] // bar_beats) + 1 if len(beats) else 0
+    if len(beats) < 2:
+        return 0, [None] * n_bars
+    intervals = np.diff(beats)
+    near_eighth = (intervals >= 0.35) & (intervals <= 0.65)
+    pairs = near_eighth[:-1] & near_eighth[1:]
+    ratios = intervals[:-1][pairs] / intervals[1:][pairs]
+    valid = (ratios >= 0.5) & (ratios <= 2.0)  # Reasonable swing range
+    ratios = ratios[valid]
+
+    # bar of the first note of every pair
+    bars = (beats[:-2][pairs][valid] // bar_beats).astype(np.int64)
+    counts = np.bincount(bars, minlength=n_bars)
+    sums = np.bincount(bars, weights=ratios, minlength=n_bars)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bar_swing = _swing_from_ratios(sums / counts)
+    curve = [float(value) if count else None for value, count in zip(bar_swing.tolist(), counts.tolist())]
+
+    if not len(ratios):
+        return 0, curve  # No swing detected
+    return float(_swing_from_ratios(np.mean(ratios))), curve
+
+
+def subdivision(onsets, beats):
+    """
+    Detect the main subdivision from the mean interval between notes.
+
+    Args:
+        onsets: times in seconds
+        beats: beat position of every note (see beat_positions)
+    """
+    if not len(onsets):
+        return "unknown"
+    order = np.argsort(onsets, kind="stable")
+    intervals = np.diff(np.asarray(beats)[order])
+    # Skip very short intervals (likely simultaneous hits)
+    intervals = intervals[np.diff(np.asarray(onsets)[order]) > 0.05]
+    if not len(intervals):
+        return "unknown"
+    avg_interval = np.mean(intervals)
+    for name, divisor in (("quarter", 1), ("eighth", 2), ("triplet", 3),
+                          ("sixteenth", 4), ("sextuplet", 6), ("32nd", 8)):
+        if avg_interval >= 0.85 / divisor:
+            return name
+    return "very_fast"
+
+
+def is_fill(pitches, density):
+    """A pattern is likely a fill if it is dense or toms make up >30% of it."""
+    if density > 8:  # More than 8 notes per second is likely a fill
+        return True
+    if not len(pitches):
+        return False
+    tom_count = np.isin(pitches, DRUM_COMPONENTS["toms"]).sum()
+    return bool(tom_count / len(pitches) > 0.3)
+
+
+def regularity(positions):
+    """Share of the most common interval between sorted grid positions (higher = more regular)."""
+    if len(positions) <= 1:
+        return 0.0
+    intervals = np.diff(positions)
+    if (intervals == intervals[0]).all():
+        return 1.0
+    return np.unique(intervals, return_counts=True)[1].max() / len(intervals)
+
+
+def pattern_variation(grid, pitches):
+    """
+    Share of 16th-note steps not covered by a repeated segment of 4+ steps.
+
+    Every step is a symbol for its set of drum pitches (rests are a symbol
+    too). Lower values indicate more repetitive patterns (common in
+    choruses), higher values more varied ones (bridges, transitions).
+
+    Args:
+        grid: nondecreasing grid position of every note
+        pitches: MIDI pitch of every note
+    """
+    if not len(grid):
+        return 0.0
+    steps, starts = np.unique(grid, return_index=True)
+    # 128-bit pitch set of every occupied step
+    bits = np.left_shift(np.uint64(1), (pitches % 64).astype(np.uint64))
+    low = np.bitwise_or.reduceat(np.where(pitches < 64, bits, np.uint64(0)), starts)
+    high = np.bitwise_or.reduceat(np.where(pitches >= 64, bits, np.uint64(0)), starts)
+    codes = np.unique(np.column_stack([low, high]), axis=0, return_inverse=True)[1].reshape(-1)
+    symbols = np.zeros(steps[-1] + 1, dtype=np.int64)  # 0 = rest
+    symbols[steps] = codes + 1
+    coverage = repeat_coverage(symbols, min_length=4)
+    if coverage is None:
+        return 0.5  # Default middle value if nothing repeats
+    return 1.0 - coverage
+
+
+def _pitch_stats(pitch, velocity):
+    values, inverse, counts = np.unique(pitch, return_inverse=True, return_counts=True)
+    velocity = velocity.astype(float)
+    means = np.bincount(inverse, weights=velocity) / counts
+    stds = np.sqrt(np.bincount(inverse, weights=(velocity - means[inverse]) ** 2) / counts)
+    return values, counts, means, stds
+
+
+def compute_metrics(arrays, info):
+    """
+    Compute every drum metric from the note arrays of read_drum_notes.
+
+    Returns:
+        Dict of JSON-serializable metrics (pitch-keyed dicts use int keys)
+    """
+    onset, pitch, velocity = arrays["onset"], arrays["pitch"], arrays["velocity"]
+    duration = info["duration"]
+    tempo = info["tempo"]
+    total_notes = len(onset)
+    density = total_notes / duration if duration > 0 else 0
+
+    values, counts, means, stds = _pitch_stats(pitch, velocity)
+    beats = beat_positions(onset, arrays["tempo_times"], arrays["tempi"])
+    swing_percentage, swing_curve = swing(beats, info["bar_beats"])
+    metrics = dict(info)
+    metrics.update({
+        "total_notes": total_notes,
+        "density": density,
+        "mean_velocity": float(np.mean(velocity)) if total_notes else 0.0,
+        "velocity_std": float(np.std(velocity)) if total_notes else 0.0,
+        "unique_pitches": len(values),
+        "note_counts": dict(zip(values.tolist(), counts.tolist())),
+        "pitch_mean_velocity": dict(zip(values.tolist(), means.tolist())),
+        "pitch_velocity_std": dict(zip(values.tolist(), stds.tolist())),
+        "swing_percentage": float(swing_percentage),
+        "swing_curve": swing_curve,
+        "subdivision": subdivision(onset, beats),
+        "is_fill": is_fill(pitch, density),
+    })
+
+    # 16th-note grid of the notes in onset order
+    order = np.argsort(onset, kind="stable")
+    sixteenth_duration = 60 / tempo / 4
+    grid = np.round(onset[order] / sixteenth_duration).astype(np.int64)
+    grid_pitches = pitch[order]
+    metrics["complexity"] = len(np.unique(grid)) / (duration / sixteenth_duration) if duration > 0 else 0
+    metrics["kick_regularity"] = float(regularity(np.unique(grid[np.isin(grid_pitches, KICK_PITCHES)])))
+    metrics["snare_regularity"] = float(regularity(np.unique(grid[np.isin(grid_pitches, SNARE_PITCHES)])))
+    metrics["pattern_variation"] = float(pattern_variation(grid, grid_pitches))
+
+    components = component_index()[pitch]
+    metrics["components"] = {}
+    for i, name in enumerate(component_names()):
+        selected = components == i
+        if selected.any():
+            metrics["components"][name] = {
+                "note_count": int(selected.sum()),
+                "mean_velocity": float(np.mean(velocity[selected])),
+                "pitches_used": np.unique(pitch[selected]).tolist(),
+            }
+    return metrics
+
+
+def analyze_drum_midi(midi_path):
+    """Parse a MIDI file and compute its drum features, without the cache."""
+    arrays, info = read_drum_notes(midi_path)
+    return DrumFeatures(midi_path, arrays, compute_metrics(arrays, info))
+
+
+def cache_path(midi_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Cache file of a MIDI file, named after the hash of its absolute path"""
+    key = hashlib.md5(os.path.abspath(midi_path).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{key}.npz")
+
+
+def _read_cache(path, midi_path, stat):
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            source = json.loads(str(data["source"]))
+            if source != [CACHE_VERSION, os.path.abspath(midi_path), stat.st_size, stat.st_mtime_ns]:
+                return None
+            arrays = {name: data[name] for name in data.files if name not in ("source", "metrics")}
+            metrics = json.loads(str(data["metrics"]))
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    for name in _PITCH_KEYED:
+        metrics[name] = {int(pitch): value for pitch, value in metrics[name].items()}
+    return DrumFeatures(midi_path, arrays, metrics)
+
+
+def _write_cache(path, features, stat):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    source = [CACHE_VERSION, os.path.abspath(features.path), stat.st_size, stat.st_mtime_ns]
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, source=np.array(json.dumps(source)),
+             metrics=np.array(json.dumps(features.metrics)), **features.arrays)
+    os.replace(tmp_path, path)
+
+
+def load_drum_features(midi_path, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Drum features of a MIDI file, from the disk cache when it is up to date.
+
+    Args:
+        midi_path: MIDI file
+        cache_dir: cache directory, or None to always parse the file
+
+    Returns:
+        DrumFeatures
+    """
+    if not cache_dir:
+        return analyze_drum_midi(midi_path)
+    stat = os.stat(midi_path)
+    path = cache_path(midi_path, cache_dir)
+    features = _read_cache(path, midi_path, stat) if os.path.exists(path) else None
+    if features is None:
+        features = analyze_drum_midi(midi_path)
+        _write_cache(path, features, stat)
+    return features
@@ -14,6 +14,7 @@ Features:
 """
 
 import os
+import re
 import sys
 import json
 import argparse
@@ -23,6 +24,10 @@ import pretty_midi
 from pathlib import Path
 from collections import defaultdict
 
+# DRUM_COMPONENTS used to live here, keep it importable from this module
+from drum_features import (DEFAULT_CACHE_DIR, DRUM_COMPONENTS, component_index, component_names,
+                           load_drum_features)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,23 +43,16 @@ COMPONENT_DIR = os.path.join(REPO_ROOT, "data", "midi", "groove_components")
 METADATA_DIR = os.path.join(REPO_ROOT, "data", "metadata", "groove_midi")
 CARD_DIR = os.path.join(REPO_ROOT, "data", "cards", "groove_midi")
 
-# Component definitions mapping MIDI note numbers to drum types
-DRUM_COMPONENTS = {
-    "kick": [35, 36],                            # Kick drums
-    "snare": [38, 40, 37, 31],                   # Snare and rim
-    "hihat": [42, 44, 46, 26, 22],              # Hi-hat variations
-    "toms": [41, 43, 45, 47, 48, 50, 58],       # All toms
-    "cymbals": [49, 51, 52, 53, 55, 57, 59],    # Crash and ride cymbals
-    "percussion": [39, 54, 56, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80]  # Various percussion
-}
+# Drum tracks play on channel 10 (is_drum); their program selects the kit
+DRUM_PROGRAM = 0
 
 class GrooveComponentSeparator:
-    def __init__(self, input_file):
+    def __init__(self, input_file, cache_dir=DEFAULT_CACHE_DIR):
         """Initialize with the path to a MIDI file to process."""
         self.input_file = input_file
         self.basename = os.path.basename(input_file)
         self.base_output_dir = os.path.dirname(input_file)
-        self.midi_data = None
+        self.features = None
         self.component_notes = defaultdict(list)
         self.metadata = {
             "source_file": self.basename,
@@ -62,197 +60,45 @@ class GrooveComponentSeparator:
             "analysis": {}
         }
         
-        # Load the MIDI file
+        # Load the drum notes and features of the MIDI file
         try:
-            self.midi_data = pretty_midi.PrettyMIDI(input_file)
+            self.features = load_drum_features(input_file, cache_dir)
         except Exception as e:
             logger.error(f"Error loading MIDI file {input_file}: {e}")
             raise
     
     def analyze_pattern(self):
         """Analyze the pattern to extract key characteristics."""
-        if not self.midi_data:
+        if not self.features:
             return False
-            
-        # Find the drum instrument
-        drum_instrument = None
-        for instrument in self.midi_data.instruments:
-            if instrument.is_drum:
-                drum_instrument = instrument
-                break
         
-        if not drum_instrument:
+        if not self.features["drum_tracks"]:
             logger.warning(f"No drum instrument found in {self.basename}")
             return False
         
-        # Analyze note distribution
-        note_counts = defaultdict(int)
-        note_velocities = defaultdict(list)
-        note_timings = defaultdict(list)
-        
-        for note in drum_instrument.notes:
-            note_counts[note.pitch] += 1
-            note_velocities[note.pitch].append(note.velocity)
-            note_timings[note.pitch].append(note.start)
-        
-        # Calculate metrics
-        total_notes = sum(note_counts.values())
-        duration = self.midi_data.get_end_time()
-        density = total_notes / duration if duration > 0 else 0
-        
-        # Calculate mean velocities
-        mean_velocities = {pitch: np.mean(velocities) for pitch, velocities in note_velocities.items()}
-        
-        # Calculate velocity variance 
-        velocity_variance = {}
-        for pitch, velocities in note_velocities.items():
-            if len(velocities) > 1:
-                velocity_variance[pitch] = np.std(velocities)
-            else:
-                velocity_variance[pitch] = 0
-        
-        # Overall velocity variance
-        all_velocities = [v for vlist in note_velocities.values() for v in vlist]
-        overall_velocity_variance = np.std(all_velocities) if all_velocities else 0
-        
-        # Detect swing by analyzing 8th notes
-        swing = self._detect_swing(note_timings)
+        features = self.features
         
         # Store analysis results
         self.metadata["analysis"] = {
-            "total_notes": total_notes,
-            "duration": duration,
-            "density": density,
-            "note_distribution": dict(note_counts),
-            "mean_velocity": mean_velocities,
-            "velocity_variance": overall_velocity_variance,
-            "swing_percentage": swing,
-            "subdivision": self._detect_subdivision(note_timings)
+            "total_notes": features["total_notes"],
+            "duration": features["duration"],
+            "density": features["density"],
+            "note_distribution": features["note_counts"],
+            "mean_velocity": features["pitch_mean_velocity"],
+            "velocity_variance": features["velocity_std"],
+            "swing_percentage": features["swing_percentage"],
+            "swing_curve": features["swing_curve"],
+            "subdivision": features["subdivision"],
+            "is_fill": features["is_fill"]
         }
         
-        # Check if it's likely a fill
-        self.metadata["analysis"]["is_fill"] = self._detect_fill(note_counts, density)
-        
-        logger.info(f"Analyzed {self.basename}: {total_notes} notes, "
-                   f"density: {density:.2f}, swing: {swing:.1f}%")
+        logger.info(f"Analyzed {self.basename}: {features['total_notes']} notes, "
+                   f"density: {features['density']:.2f}, swing: {features['swing_percentage']:.1f}%")
         return True
     
-    def _detect_swing(self, note_timings):
-        """Detect swing percentage by analyzing 8th note timings."""
-        # Combine all note timings to detect overall swing
-        all_timings = []
-        for pitch, timings in note_timings.items():
-            all_timings.extend(timings)
-        
-        all_timings.sort()
-        
-        # Look for pairs of notes that should be 8th notes
-        swing_ratios = []
-        
-        if len(all_timings) < 2:
-            return 0
-        
-        # Get tempo to determine beat duration
-        tempo_changes = self.midi_data.get_tempo_changes()
-        if len(tempo_changes[0]) > 0:
-            bpm = tempo_changes[1][0]
-            beat_duration = 60.0 / bpm
-        else:
-            beat_duration = 0.5  # Default assumption
-        
-        # Calculate ideal 8th note duration
-        eighth_note = beat_duration / 2
-        
-        # Look at consecutive notes to find swing patterns
-        for i in range(len(all_timings) - 1):
-            interval = all_timings[i+1] - all_timings[i]
-            
-            # If this interval is close to an 8th note
-            if 0.7 * eighth_note <= interval <= 1.3 * eighth_note:
-                # Check if the next interval is also close to an 8th note
-                if i+2 < len(all_timings):
-                    next_interval = all_timings[i+2] - all_timings[i+1]
-                    if 0.7 * eighth_note <= next_interval <= 1.3 * eighth_note:
-                        # Calculate swing ratio
-                        ratio = interval / next_interval
-                        if 0.5 <= ratio <= 2.0:  # Reasonable swing range
-                            swing_ratios.append(ratio)
-        
-        # Convert average ratio to swing percentage
-        if swing_ratios:
-            avg_ratio = np.mean(swing_ratios)
-            # Convert ratio to percentage where 1.0 = straight (0%), 1.5 = typical swing (50%), 2.0 = hard swing (100%)
-            swing_percentage = max(0, min(100, (avg_ratio - 1.0) * 100))
-            return swing_percentage
-        
-        return 0  # No swing detected
-    
-    def _detect_subdivision(self, note_timings):
-        """Detect the main subdivision of the pattern."""
-        # Combine all note timings
-        all_timings = []
-        for pitch, timings in note_timings.items():
-            all_timings.extend(timings)
-        
-        if not all_timings:
-            return "unknown"
-            
-        all_timings.sort()
-        
-        # Get tempo to determine beat duration
-        tempo_changes = self.midi_data.get_tempo_changes()
-        if len(tempo_changes[0]) > 0:
-            bpm = tempo_changes[1][0]
-            beat_duration = 60.0 / bpm
-        else:
-            beat_duration = 0.5  # Default assumption
-        
-        # Calculate intervals between consecutive notes
-        intervals = [all_timings[i+1] - all_timings[i] for i in range(len(all_timings)-1)]
-        
-        # Skip very short intervals (likely simultaneous hits)
-        intervals = [i for i in intervals if i > 0.05]
-        
-        if not intervals:
-            return "unknown"
-        
-        # Calculate average interval
-        avg_interval = np.mean(intervals)
-        
-        # Determine subdivision based on beat duration
-        if avg_interval >= 0.85 * beat_duration:
-            return "quarter"
-        elif avg_interval >= 0.85 * beat_duration / 2:
-            return "eighth"
-        elif avg_interval >= 0.85 * beat_duration / 3:
-            return "triplet"
-        elif avg_interval >= 0.85 * beat_duration / 4:
-            return "sixteenth"
-        elif avg_interval >= 0.85 * beat_duration / 6:
-            return "sextuplet"
-        elif avg_interval >= 0.85 * beat_duration / 8:
-            return "32nd"
-        else:
-            return "very_fast"
-    
-    def _detect_fill(self, note_counts, density):
-        """Detect if the pattern is likely a fill based on density and tom usage."""
-        # Check for high density
-        if density > 8:  # More than 8 notes per second is likely a fill
-            return True
-        
-        # Check for significant tom usage
-        tom_count = sum(note_counts.get(pitch, 0) for pitch in DRUM_COMPONENTS["toms"])
-        total_notes = sum(note_counts.values())
-        
-        if tom_count > 0 and tom_count / total_notes > 0.3:  # If toms make up >30% of notes
-            return True
-            
-        return False
-    
     def separate_components(self, output_dir=None):
         """Separate the MIDI file into component parts."""
-        if not self.midi_data:
+        if not self.features:
             return False
         
         if output_dir:
@@ -261,25 +107,15 @@ class GrooveComponentSeparator:
         component_dir = os.path.join(self.base_output_dir, "components", os.path.splitext(self.basename)[0])
         os.makedirs(component_dir, exist_ok=True)
         
-        # Find the drum instrument
-        drum_instrument = None
-        for instrument in self.midi_data.instruments:
-            if instrument.is_drum:
-                drum_instrument = instrument
-                break
-        
-        if not drum_instrument:
+        if not self.features["drum_tracks"]:
             logger.warning(f"No drum instrument found in {self.basename}")
             return False
         
         # Group notes by component
-        for note in drum_instrument.notes:
-            component = "other"
-            for comp_name, pitches in DRUM_COMPONENTS.items():
-                if note.pitch in pitches:
-                    component = comp_name
-                    break
-            self.component_notes[component].append(note)
+        components = component_index()[self.features.pitch]
+        for i, component in enumerate(component_names()):
+            if (components == i).any():
+                self.component_notes[component] = self.features.notes(components == i)
         
         # Create separate MIDI files for each component
         for component, notes in self.component_notes.items():
@@ -287,11 +123,10 @@ class GrooveComponentSeparator:
                 continue
                 
             # Create a new MIDI file for this component
-            component_midi = pretty_midi.PrettyMIDI(initial_tempo=self.midi_data.get_tempo_changes()[1][0])
+            component_midi = pretty_midi.PrettyMIDI(initial_tempo=self.features.tempi[0])
             
             # Create a drum instrument
-            drum_program = pretty_midi.instrument_name_to_program('Drums')
-            component_instrument = pretty_midi.Instrument(program=drum_program, is_drum=True)
+            component_instrument = pretty_midi.Instrument(program=DRUM_PROGRAM, is_drum=True)
             
             # Add all notes for this component
             for note in notes:
@@ -315,9 +150,8 @@ class GrooveComponentSeparator:
         # Special handling for fill if detected
         if self.metadata["analysis"].get("is_fill", False):
             # Create a fill component that combines toms, snare rolls, and crashes
-            fill_midi = pretty_midi.PrettyMIDI(initial_tempo=self.midi_data.get_tempo_changes()[1][0])
-            drum_program = pretty_midi.instrument_name_to_program('Drums')
-            fill_instrument = pretty_midi.Instrument(program=drum_program, is_drum=True)
+            fill_midi = pretty_midi.PrettyMIDI(initial_tempo=self.features.tempi[0])
+            fill_instrument = pretty_midi.Instrument(program=DRUM_PROGRAM, is_drum=True)
             
             fill_notes = []
             fill_notes.extend(self.component_notes["toms"])
@@ -407,7 +241,7 @@ class GrooveComponentSeparator:
                 "component": component,
                 "style": style,
                 "drummer": drummer,
-                "tempo": self.midi_data.get_tempo_changes()[1][0],
+                "tempo": self.features.tempi[0],
                 "swing": self.metadata["analysis"].get("swing_percentage", 0),
                 "subdivision": self.metadata["analysis"].get("subdivision", "unknown"),
                 "density": len(component_data["pitches_used"]) / component_data["note_count"] if component_data["note_count"] > 0 else 0,
@@ -459,8 +293,9 @@ class GrooveComponentSeparator:
             "source": self.basename,
             "style": style,
             "drummer": drummer,
-            "tempo": self.midi_data.get_tempo_changes()[1][0],
+            "tempo": self.features.tempi[0],
             "swing": self.metadata["analysis"].get("swing_percentage", 0),
+            "swing_curve": self.metadata["analysis"].get("swing_curve", []),
             "subdivision": self.metadata["analysis"].get("subdivision", "unknown"),
             "components": list(self.metadata["components"].keys()),
             "midi_file": self.input_file,
@@ -495,6 +330,8 @@ def main():
     parser.add_argument("--cards", help="Output directory for card files")
     parser.add_argument("--recursive", action="store_true", help="Process directories recursively")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Parse every MIDI file instead of using the drum feature cache in {DEFAULT_CACHE_DIR}")
     
     args = parser.parse_args()
     
@@ -534,7 +371,7 @@ def main():
     # Process each file
     for midi_file in input_files:
         try:
-            separator = GrooveComponentSeparator(midi_file)
+            separator = GrooveComponentSeparator(midi_file, None if args.no_cache else DEFAULT_CACHE_DIR)
             
             # Analyze the pattern
             if separator.analyze_pattern():
@@ -14,20 +14,29 @@ It implements:
 This is a user-guided tool that provides intelligent suggestions but leaves
 creative decisions to the user. All classifications are presented as options
 with explanations, not as automated decisions.
+
+Batch mode (--jobs N) extracts features on a process pool and writes them,
+with the section scores, to a single columnar feature store (an .npz table
+with one row per MIDI file). Files already in the store are not parsed
+again unless they changed, and --rescore recomputes the section scores
+from the stored features, e.g. after changing the section characteristics
+with --characteristics, without opening any MIDI file.
 """
 
 import os
 import sys
+import copy
+import functools
 import json
+import concurrent.futures
 import numpy as np
-import pretty_midi
 import argparse
 import logging
 from pathlib import Path
-from collections import defaultdict, Counter
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
-from suffix_trees import STree
+
+from drum_features import DEFAULT_CACHE_DIR, load_drum_features
 
 # Configure logging
 logging.basicConfig(
@@ -95,101 +104,160 @@ SECTION_CHARACTERISTICS = {
     }
 }
 
+# Features stored per file, in the order of GrooveSectionClassifier.features
+FEATURE_NAMES = [
+    "total_notes",
+    "duration",
+    "density",
+    "mean_velocity",
+    "velocity_std",
+    "unique_pitches",
+    "complexity",
+    "kick_regularity",
+    "snare_regularity",
+    "pattern_variation",
+    "energy",
+    "normalized_density",
+    "normalized_complexity",
+    "normalized_variation",
+]
+
+# Score components: (feature, range in SECTION_CHARACTERISTICS, weight)
+SCORE_COMPONENTS = {
+    "energy": ("energy", "energy_range", 0.3),
+    "complexity": ("normalized_complexity", "complexity_range", 0.25),
+    "density": ("normalized_density", "density_range", 0.25),
+    "variation": ("normalized_variation", "variation_range", 0.2),
+}
+
+FEATURE_STORE_NAME = "section_features.npz"
+
+
+def range_score(value, min_val, max_val):
+    """
+    Calculate how well a value fits within a range, with 1.0 being perfect.
+
+    Works on floats and on numpy arrays of values.
+    """
+    value = np.asarray(value, dtype=float)
+    center = (min_val + max_val) / 2
+    range_radius = (max_val - min_val) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Within range: the closer to the center, the higher the score
+        inside = 1.0 - (np.abs(value - center) / range_radius) * 0.5
+    # Outside range: score decreases with distance from range
+    distance = np.where(value < min_val, min_val - value, value - max_val)
+    outside = np.maximum(0.0, 1.0 - distance)
+    score = np.where((min_val <= value) & (value <= max_val), inside, outside)
+    return float(score) if score.ndim == 0 else score
+
+
+def confidence_level(score):
+    """Calculate a confidence level for the classification."""
+    # Simple confidence calculation based on score
+    if score > 0.8:
+        return "high"
+    elif score > 0.6:
+        return "medium"
+    else:
+        return "low"
+
+
+def score_sections(features, characteristics=None):
+    """
+    Score features for every section type.
+
+    Args:
+        features: dict of feature values, either floats for one pattern or
+            numpy arrays with one value per pattern
+        characteristics: section characteristics, default
+            SECTION_CHARACTERISTICS
+
+    Returns:
+        Dict of section -> {"score", "components"}, with floats or arrays
+        matching the features
+    """
+    characteristics = characteristics or SECTION_CHARACTERISTICS
+    scores = {}
+    for section, section_characteristics in characteristics.items():
+        components = {}
+        section_score = 0.0
+        for component, (feature, range_name, weight) in SCORE_COMPONENTS.items():
+            low, high = section_characteristics[range_name]
+            components[component] = range_score(features[feature], low, high)
+            section_score = section_score + components[component] * weight
+        scores[section] = {
+            "score": section_score * section_characteristics["weight"],
+            "components": components,
+        }
+    return scores
+
+
+def load_characteristics(path=None):
+    """
+    Load section characteristics, overriding the defaults from a JSON file.
+
+    The file maps section names to the fields to change, e.g.
+    {"chorus": {"weight": 1.2, "energy_range": [0.7, 1.0]}}. New section
+    names need every field.
+    """
+    characteristics = copy.deepcopy(SECTION_CHARACTERISTICS)
+    if not path:
+        return characteristics
+    with open(path, "r") as f:
+        overrides = json.load(f)
+    for section, fields in overrides.items():
+        characteristics.setdefault(section, {}).update(
+            {key: tuple(value) if isinstance(value, list) else value for key, value in fields.items()}
+        )
+    return characteristics
+
+
 class GrooveSectionClassifier:
-    def __init__(self, midi_file):
+    def __init__(self, midi_file, characteristics=None, cache_dir=DEFAULT_CACHE_DIR):
         """Initialize the classifier with a MIDI file."""
         self.midi_file = midi_file
-        self.midi_data = None
-        self.drum_notes = []
+        self.characteristics = characteristics or SECTION_CHARACTERISTICS
+        self.drum_features = None
         self.features = {}
         self.section_scores = {}
         self.pattern_sequences = []
         
         try:
-            self.midi_data = pretty_midi.PrettyMIDI(midi_file)
-            self._extract_drum_notes()
+            self.drum_features = load_drum_features(midi_file, cache_dir)
         except Exception as e:
             logger.error(f"Error loading MIDI file {midi_file}: {e}")
             raise
     
-    def _extract_drum_notes(self):
-        """Extract drum notes from the MIDI file."""
-        for instrument in self.midi_data.instruments:
-            if instrument.is_drum:
-                self.drum_notes.extend(instrument.notes)
-        
-        # Sort notes by start time
-        self.drum_notes.sort(key=lambda x: x.start)
-    
     def extract_features(self):
         """Extract features from the drum pattern for classification."""
-        if not self.drum_notes:
+        drum = self.drum_features
+        if not drum["total_notes"]:
             logger.warning("No drum notes found in the MIDI file")
             return {}
         
-        # Extract basic statistics
-        total_notes = len(self.drum_notes)
-        duration = self.midi_data.get_end_time()
-        
-        # Note density (notes per second)
-        density = total_notes / duration if duration > 0 else 0
-        
-        # Velocity statistics
-        velocities = [note.velocity for note in self.drum_notes]
-        mean_velocity = np.mean(velocities)
-        velocity_std = np.std(velocities)
-        
-        # Note distribution by pitch
-        pitches = Counter([note.pitch for note in self.drum_notes])
-        unique_pitches = len(pitches)
-        
-        # Group notes by time (quantized to 16th notes)
-        tempo_changes = self.midi_data.get_tempo_changes()
-        if len(tempo_changes[0]) > 0:
-            tempo = tempo_changes[1][0]
-        else:
-            tempo = 120  # Default tempo
-        
-        # Calculate 16th note duration in seconds
-        beat_duration = 60 / tempo
-        sixteenth_duration = beat_duration / 4
-        
-        # Quantize notes to 16th note grid
-        grid_notes = defaultdict(list)
-        for note in self.drum_notes:
-            # Round to nearest 16th note
-            grid_pos = round(note.start / sixteenth_duration)
-            grid_notes[grid_pos].append(note.pitch)
-        
-        # Calculate pattern complexity metrics
-        complexity = len(grid_notes) / (duration / sixteenth_duration) if duration > 0 else 0
-        
-        # Analyze kick and snare patterns for predictability
-        kick_positions = [pos for pos, pitches in grid_notes.items() if any(p in [35, 36] for p in pitches)]
-        snare_positions = [pos for pos, pitches in grid_notes.items() if any(p in [38, 40] for p in pitches)]
-        
-        # Calculate pattern regularity (higher = more regular)
-        kick_regularity = self._calculate_regularity(kick_positions)
-        snare_regularity = self._calculate_regularity(snare_positions)
-        
-        # Calculate the pattern variation using Supermaximal Repeats
-        pattern_variation = self._calculate_pattern_variation(grid_notes)
+        # Density, velocities, 16th-note grid complexity, kick/snare
+        # regularity and the pattern variation from repeated segments all
+        # come from the shared drum feature extractor
+        density = drum["density"]
+        complexity = drum["complexity"]
+        pattern_variation = drum["pattern_variation"]
         
         # Energy calculation based on velocity, density and complexity
-        energy = (mean_velocity / 127) * 0.5 + (density / 10) * 0.3 + complexity * 0.2
+        energy = (drum["mean_velocity"] / 127) * 0.5 + (density / 10) * 0.3 + complexity * 0.2
         energy = min(1.0, energy)  # Cap at 1.0
         
         # Store all features
         self.features = {
-            "total_notes": total_notes,
-            "duration": duration,
+            "total_notes": drum["total_notes"],
+            "duration": drum["duration"],
             "density": density,
-            "mean_velocity": mean_velocity,
-            "velocity_std": velocity_std,
-            "unique_pitches": unique_pitches,
+            "mean_velocity": drum["mean_velocity"],
+            "velocity_std": drum["velocity_std"],
+            "unique_pitches": drum["unique_pitches"],
             "complexity": complexity,
-            "kick_regularity": kick_regularity,
-            "snare_regularity": snare_regularity,
+            "kick_regularity": drum["kick_regularity"],
+            "snare_regularity": drum["snare_regularity"],
             "pattern_variation": pattern_variation,
             "energy": energy,
             "normalized_density": min(1.0, density / 10),  # Normalize density to 0-1 range
@@ -199,66 +267,6 @@ class GrooveSectionClassifier:
         
         return self.features
     
-    def _calculate_regularity(self, positions):
-        """Calculate the regularity of note positions (higher = more regular)."""
-        if len(positions) <= 1:
-            return 0.0
-        
-        # Calculate intervals between consecutive positions
-        intervals = [positions[i+1] - positions[i] for i in range(len(positions) - 1)]
-        
-        # If all intervals are the same, it's perfectly regular
-        if all(i == intervals[0] for i in intervals):
-            return 1.0
-        
-        # Count the frequency of each interval
-        interval_counts = Counter(intervals)
-        most_common_interval, most_common_count = interval_counts.most_common(1)[0]
-        
-        # Calculate regularity as the proportion of the most common interval
-        return most_common_count / len(intervals)
-    
-    def _calculate_pattern_variation(self, grid_notes):
-        """
-        Calculate pattern variation using Supermaximal Repeats.
-        
-        Lower values indicate more repetitive patterns (common in choruses).
-        Higher values indicate more varied patterns (common in bridges, transitions).
-        """
-        if not grid_notes:
-            return 0.0
-        
-        # Convert the grid notes to a string representation for pattern analysis
-        max_pos = max(grid_notes.keys())
-        pattern_string = ""
-        
-        for i in range(max_pos + 1):
-            if i in grid_notes:
-                # Create a symbol for this combination of notes
-                pitches = sorted(grid_notes[i])
-                symbol = chr(65 + (sum(pitches) % 26))  # Convert to a letter A-Z
-                pattern_string += symbol
-            else:
-                pattern_string += "-"  # Rest
-        
-        # Use suffix tree to find repeats
-        if len(pattern_string) > 0:
-            st = STree.STree(pattern_string)
-            repeats = st.maximal_repeats()
-            
-            # Filter to significant repeats (at least 4 characters)
-            significant_repeats = [r for r in repeats if len(r) >= 4]
-            
-            # Calculate the coverage of the pattern by repeats
-            if significant_repeats:
-                repeat_coverage = sum(len(r) * pattern_string.count(r) for r in significant_repeats)
-                repeat_coverage = min(repeat_coverage / len(pattern_string), 1.0)
-                
-                # Invert so higher values = more variation
-                return 1.0 - repeat_coverage
-        
-        return 0.5  # Default middle value if we can't calculate
-    
     def classify_sections(self):
         """
         Classify the pattern for suitability for different song sections.
@@ -267,87 +275,20 @@ class GrooveSectionClassifier:
         if not self.features:
             self.extract_features()
         
-        scores = {}
-        
-        # For each section type, calculate how well this pattern matches
-        for section, characteristics in SECTION_CHARACTERISTICS.items():
-            # Calculate score based on feature ranges
-            energy_score = self._range_score(
-                self.features["energy"], 
-                characteristics["energy_range"][0], 
-                characteristics["energy_range"][1]
-            )
-            
-            complexity_score = self._range_score(
-                self.features["normalized_complexity"], 
-                characteristics["complexity_range"][0], 
-                characteristics["complexity_range"][1]
-            )
-            
-            density_score = self._range_score(
-                self.features["normalized_density"], 
-                characteristics["density_range"][0], 
-                characteristics["density_range"][1]
-            )
-            
-            variation_score = self._range_score(
-                self.features["normalized_variation"], 
-                characteristics["variation_range"][0], 
-                characteristics["variation_range"][1]
-            )
-            
-            # Combined weighted score
-            section_score = (
-                energy_score * 0.3 +
-                complexity_score * 0.25 +
-                density_score * 0.25 +
-                variation_score * 0.2
-            ) * characteristics["weight"]
-            
-            scores[section] = {
-                "score": section_score,
-                "components": {
-                    "energy": energy_score,
-                    "complexity": complexity_score,
-                    "density": density_score,
-                    "variation": variation_score
-                },
-                "confidence": self._calculate_confidence(section_score)
-            }
+        scores = score_sections(self.features, self.characteristics)
+        for data in scores.values():
+            data["confidence"] = self._calculate_confidence(data["score"])
         
         self.section_scores = scores
         return scores
     
     def _range_score(self, value, min_val, max_val):
         """Calculate how well a value fits within a range, with 1.0 being perfect."""
-        if min_val <= value <= max_val:
-            # Within range gets a high score
-            # The closer to the center, the higher the score
-            center = (min_val + max_val) / 2
-            distance_from_center = abs(value - center)
-            range_radius = (max_val - min_val) / 2
-            
-            # Score is higher when closer to center
-            return 1.0 - (distance_from_center / range_radius) * 0.5
-        else:
-            # Outside range gets a lower score based on distance
-            if value < min_val:
-                distance = min_val - value
-            else:
-                distance = value - max_val
-                
-            # Score decreases with distance from range
-            return max(0.0, 1.0 - distance)
+        return range_score(value, min_val, max_val)
     
     def _calculate_confidence(self, score):
         """Calculate a confidence level for the classification."""
-        # Simple confidence calculation based on score
-        if score > 0.8:
-            return "high"
-        elif score > 0.6:
-            return "medium"
-        else:
-            return "low"
+        return confidence_level(score)
     
     def get_top_section_recommendations(self, n=3):
         """Get the top n section recommendations for this pattern."""
@@ -388,6 +329,162 @@ class GrooveSectionClassifier:
         
         return report
 
+def _extract_file(midi_file, cache_dir=DEFAULT_CACHE_DIR):
+    """Extract the features of one MIDI file, for the batch process pool."""
+    try:
+        features = GrooveSectionClassifier(midi_file, cache_dir=cache_dir).extract_features()
+    except Exception as e:
+        return midi_file, None, str(e)
+    if not features:
+        return midi_file, None, "No drum notes found"
+    return midi_file, [float(features[name]) for name in FEATURE_NAMES], None
+
+
+def load_feature_store(store_path):
+    """
+    Load a feature store.
+
+    Returns:
+        Dict of column name -> numpy array with one row per MIDI file: path,
+        file_id, size, mtime_ns, one column per feature in FEATURE_NAMES,
+        "score_<section>" per section and best_match. Empty if the store
+        does not exist.
+    """
+    if not os.path.exists(store_path):
+        return {}
+    with np.load(store_path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+
+def save_feature_store(store_path, table):
+    """Write a feature store atomically."""
+    directory = os.path.dirname(os.path.abspath(store_path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{store_path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, **table)
+    os.replace(tmp_path, store_path)
+
+
+def score_table(table, characteristics=None):
+    """
+    (Re)compute the section score columns of a feature table in place.
+
+    Returns:
+        The table, with "score_<section>" columns and best_match
+    """
+    for name in [name for name in table if name.startswith("score_")]:
+        del table[name]
+    scores = score_sections(table, characteristics)
+    sections = list(scores)
+    matrix = np.column_stack([scores[section]["score"] for section in sections]) \
+        if len(table["path"]) else np.zeros((0, len(sections)))
+    for column, section in enumerate(sections):
+        table[f"score_{section}"] = matrix[:, column]
+    best = matrix.argmax(axis=1) if len(sections) else np.zeros(len(matrix), dtype=int)
+    table["best_match"] = np.array([sections[i] for i in best], dtype=str) \
+        if len(best) else np.array([], dtype=str)
+    return table
+
+
+def run_batch(input_files, store_path, jobs=None, characteristics=None, chunk_size=32,
+              cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Extract features of many MIDI files on a process pool into a feature store.
+
+    Files already in the store with the same size and modification time are
+    not parsed again.
+
+    Args:
+        input_files: MIDI files to classify
+        store_path: path of the .npz feature store
+        jobs: number of worker processes (None = CPU count, 1 = no pool)
+        characteristics: section characteristics used for the scores
+        chunk_size: number of files sent to a worker at once
+        cache_dir: drum feature cache directory, or None to parse every file
+
+    Returns:
+        (table, errors): the feature table and a dict of file -> error
+    """
+    previous = load_feature_store(store_path)
+    known = {}
+    if previous and all(name in previous for name in FEATURE_NAMES):
+        for row, path in enumerate(previous["path"].tolist()):
+            known[path] = row
+
+    rows = {}
+    to_parse = []
+    for midi_file in input_files:
+        stat = os.stat(midi_file)
+        row = known.get(midi_file)
+        if row is not None and (int(previous["size"][row]), int(previous["mtime_ns"][row])) == (
+            stat.st_size, stat.st_mtime_ns
+        ):
+            rows[midi_file] = [float(previous[name][row]) for name in FEATURE_NAMES]
+        else:
+            to_parse.append(midi_file)
+    logger.info(f"{len(rows)} files unchanged in the feature store, {len(to_parse)} to analyze")
+
+    errors = {}
+    extract = functools.partial(_extract_file, cache_dir=cache_dir)
+    if jobs == 1 or len(to_parse) <= 1:
+        results = map(extract, to_parse)
+        executor = None
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+        results = executor.map(extract, to_parse, chunksize=chunk_size)
+    try:
+        for done, (midi_file, values, error) in enumerate(results, 1):
+            if error:
+                errors[midi_file] = error
+                logger.error(f"Error processing {midi_file}: {error}")
+            else:
+                rows[midi_file] = values
+            if done % 1000 == 0:
+                logger.info(f"Analyzed {done}/{len(to_parse)} files")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    paths = [midi_file for midi_file in input_files if midi_file in rows]
+    values = np.array([rows[path] for path in paths], dtype=float).reshape(len(paths), len(FEATURE_NAMES))
+    stats = [os.stat(path) for path in paths]
+    table = {
+        "path": np.array(paths, dtype=str),
+        "file_id": np.array([os.path.splitext(os.path.basename(path))[0] for path in paths], dtype=str),
+        "size": np.array([stat.st_size for stat in stats], dtype=np.int64),
+        "mtime_ns": np.array([stat.st_mtime_ns for stat in stats], dtype=np.int64),
+    }
+    for column, name in enumerate(FEATURE_NAMES):
+        table[name] = values[:, column]
+    score_table(table, characteristics)
+    save_feature_store(store_path, table)
+    return table, errors
+
+
+def summarize_table(table, n=3):
+    """Build the classification summary (file_id -> best match and top sections) of a feature table."""
+    sections = [name[len("score_"):] for name in table if name.startswith("score_")]
+    scores = np.column_stack([table[f"score_{section}"] for section in sections]) \
+        if len(table["path"]) else np.zeros((0, len(sections)))
+    summary = {}
+    for row, file_id in enumerate(table["file_id"].tolist()):
+        # stable sort, so ties keep the section order like sorted() does
+        order = np.argsort(-scores[row], kind="stable")[:n]
+        summary[file_id] = {
+            "file": os.path.basename(str(table["path"][row])),
+            "best_match": str(table["best_match"][row]),
+            "top_recommendations": [
+                {
+                    "section": sections[i],
+                    "score": float(scores[row, i]),
+                    "confidence": confidence_level(scores[row, i])
+                }
+                for i in order
+            ]
+        }
+    return summary
+
+
 def main():
     parser = argparse.ArgumentParser(description="Groove MIDI Song Section Classifier")
     parser.add_argument("--input", help="Input MIDI file or directory")
@@ -395,6 +492,17 @@ def main():
                       help="Output directory for classification results")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     parser.add_argument("--batch", action="store_true", help="Process all MIDI files in the dataset")
+    parser.add_argument("--jobs", type=int, default=None,
+                      help="Analyze files on N worker processes into a feature store instead of "
+                           "writing one JSON report per file (0 = one per CPU)")
+    parser.add_argument("--store", default=None,
+                      help=f"Feature store path (default: {FEATURE_STORE_NAME} in the output directory)")
+    parser.add_argument("--rescore", action="store_true",
+                      help="Recompute section scores from the feature store without reading MIDI files")
+    parser.add_argument("--characteristics", default=None,
+                      help="JSON file overriding fields of SECTION_CHARACTERISTICS")
+    parser.add_argument("--no-cache", action="store_true",
+                      help=f"Parse every MIDI file instead of using the drum feature cache in {DEFAULT_CACHE_DIR}")
     
     args = parser.parse_args()
     
@@ -403,6 +511,21 @@ def main():
     
     # Create output directory
     os.makedirs(args.output, exist_ok=True)
+    characteristics = load_characteristics(args.characteristics)
+    store_path = args.store or os.path.join(args.output, FEATURE_STORE_NAME)
+    summary_file = os.path.join(args.output, "section_classification_summary.json")
+    
+    if args.rescore:
+        table = load_feature_store(store_path)
+        if not table:
+            logger.error(f"No feature store at {store_path}, run with --jobs first")
+            return 1
+        score_table(table, characteristics)
+        save_feature_store(store_path, table)
+        with open(summary_file, 'w') as f:
+            json.dump(summarize_table(table), f, indent=2)
+        logger.info(f"Rescored {len(table['path'])} patterns in {store_path}")
+        return 0
     
     # Determine input files
     input_files = []
@@ -423,13 +546,23 @@ def main():
         input_files.append(args.input)
     
     logger.info(f"Found {len(input_files)} MIDI files to process")
+    cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+    
+    if args.jobs is not None:
+        table, errors = run_batch(input_files, store_path, args.jobs or None, characteristics,
+                                  cache_dir=cache_dir)
+        with open(summary_file, 'w') as f:
+            json.dump(summarize_table(table), f, indent=2)
+        logger.info(f"Processing complete. {len(table['path'])} patterns in {store_path}, "
+                    f"{len(errors)} errors")
+        return 0
     
     all_results = {}
     
     # Process each file
     for midi_file in input_files:
         try:
-            classifier = GrooveSectionClassifier(midi_file)
+            classifier = GrooveSectionClassifier(midi_file, characteristics, cache_dir)
             classifier.extract_features()
             classifier.classify_sections()
             
@@ -458,7 +591,6 @@ def main():
             logger.error(f"Error processing {midi_file}: {e}")
     
     # Save summary of all results
-    summary_file = os.path.join(args.output, "section_classification_summary.json")
     with open(summary_file, 'w') as f:
         json.dump(all_results, f, indent=2)
     
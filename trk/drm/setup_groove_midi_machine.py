@@ -25,6 +25,9 @@ FILES_TO_COPY = {
     os.path.join(TOOLS_DIR, "groove_midi_explorer.py"): os.path.join(GMM_ROOT, "python", "groove_midi_explorer.py"),
     os.path.join(TOOLS_DIR, "groove_midi_component_separator.py"): os.path.join(GMM_ROOT, "python", "groove_midi_component_separator.py"),
     os.path.join(TOOLS_DIR, "groove_midi_section_classifier.py"): os.path.join(GMM_ROOT, "python", "groove_midi_section_classifier.py"),
+    os.path.join(TOOLS_DIR, "pattern_repeats.py"): os.path.join(GMM_ROOT, "python", "pattern_repeats.py"),
+    os.path.join(TOOLS_DIR, "drum_features.py"): os.path.join(GMM_ROOT, "python", "drum_features.py"),
+    os.path.join(TOOLS_DIR, "drum_roll.py"): os.path.join(GMM_ROOT, "python", "drum_roll.py"),
     
     # Lua files
     os.path.join(TOOLS_DIR, "drum_pattern_browser.lua"): os.path.join(GMM_ROOT, "lua", "pattern_browser.lua"),
@@ -0,0 +1,104 @@
+"""Benchmark mirdata.annotations.closest_index against the cdist implementation
+
+Matches note onsets to a 10 ms frame grid, the way NoteData.to_sparse_index
+does, and reports wall time and peak traced memory for both engines.
+The cdist baseline is skipped when its (n x m) distance matrix would not
+fit in --max-cdist-gb; the projected size is printed instead.
+
+Usage:
+    PYTHONPATH=database python tests/benchmarks/bench_closest_index.py
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import scipy.spatial
+
+from mirdata import annotations
+
+
+def closest_index_cdist(input_array, target_array):
+    """The previous closest_index implementation, kept as a baseline"""
+    indexes = np.argmin(
+        scipy.spatial.distance.cdist(input_array, target_array), axis=1
+    )
+    indexes[input_array[:, 0] > np.max(target_array[:, 0])] = -1
+    indexes[input_array[:, 0] < np.min(target_array[:, 0])] = -1
+    return indexes
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--notes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="number of notes to match",
+    )
+    parser.add_argument(
+        "--hop", type=float, default=0.01, help="frame hop in seconds"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=600.0,
+        help="length of the frame grid in seconds",
+    )
+    parser.add_argument(
+        "--max-cdist-gb",
+        type=float,
+        default=2.0,
+        help="skip the cdist baseline above this matrix size",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    time_scale = np.arange(0, args.duration, args.hop)
+    targets = time_scale[:, np.newaxis]
+
+    header = "{:>10} {:>12} {:>14} {:>12} {:>14}".format(
+        "notes", "sorted (s)", "sorted (MB)", "cdist (s)", "cdist (MB)"
+    )
+    print("frame grid: {} frames".format(len(time_scale)))
+    print(header)
+    print("-" * len(header))
+    for n_notes in args.notes:
+        onsets = rng.uniform(-1.0, args.duration + 1.0, n_notes)
+        inputs = onsets[:, np.newaxis]
+
+        new, new_time, new_peak = measure(
+            annotations.closest_index, inputs, targets
+        )
+
+        matrix_bytes = n_notes * len(time_scale) * 8
+        if matrix_bytes > args.max_cdist_gb * 1e9:
+            old_time = "skipped"
+            old_mem = "~{:.0f} (est)".format(matrix_bytes / 1e6)
+        else:
+            old, elapsed, peak = measure(closest_index_cdist, inputs, targets)
+            assert np.array_equal(old, new), "engines disagree"
+            old_time = "{:.4f}".format(elapsed)
+            old_mem = "{:.1f}".format(peak / 1e6)
+
+        print(
+            "{:>10} {:>12.4f} {:>14.1f} {:>12} {:>14}".format(
+                n_notes, new_time, new_peak / 1e6, old_time, old_mem
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark compiled (memory-mapped) dataset indexes against JSON indexes
+
+Reports the time to open an index, the time to look up single tracks and
+the peak traced memory of both formats. The compiled index is written to
+a temporary directory, so the source index is left untouched.
+
+Usage:
+    PYTHONPATH=database python tests/benchmarks/bench_index.py
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from mirdata import compiled_index
+
+DEFAULT_INDEX = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "database",
+    "mirdata",
+    "datasets",
+    "indexes",
+    "billboard_index_2.0.json",
+)
+
+
+def load_json(index_path):
+    with open(index_path, encoding="utf-8") as fhandle:
+        return json.load(fhandle)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def lookup(index, track_ids):
+    for track_id in track_ids:
+        if track_id in index["tracks"]:
+            index["tracks"][track_id]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "index_path", nargs="?", default=DEFAULT_INDEX, help="JSON index"
+    )
+    parser.add_argument(
+        "--lookups", type=int, default=1000, help="number of track lookups"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per measurement, best kept"
+    )
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        index_path = os.path.join(tmp_dir, os.path.basename(args.index_path))
+        shutil.copy2(args.index_path, index_path)
+        _, compile_time, _ = measure(compiled_index.compile_index, index_path)
+
+        track_ids = list(load_json(index_path)["tracks"])
+        track_ids = random.Random(0).choices(track_ids, k=args.lookups)
+
+        print(
+            "index: {} ({:.1f} kB json, {:.1f} kB compiled, "
+            "compiled in {:.4f} s)".format(
+                os.path.basename(index_path),
+                os.path.getsize(index_path) / 1e3,
+                os.path.getsize(compiled_index.compiled_index_path(index_path))
+                / 1e3,
+                compile_time,
+            )
+        )
+        header = "{:>10} {:>12} {:>14} {:>16}".format(
+            "format", "open (s)", "open (MB)", "lookup (us)"
+        )
+        print(header)
+        print("-" * len(header))
+        for name, loader in [
+            ("json", load_json),
+            ("compiled", compiled_index.load_index),
+        ]:
+            runs = []
+            for _ in range(args.repeat):
+                index, open_time, peak = measure(loader, index_path)
+                start = time.perf_counter()
+                lookup(index, track_ids)
+                lookup_time = time.perf_counter() - start
+                runs.append((open_time, peak, lookup_time))
+            open_time, peak, lookup_time = min(runs)
+            print(
+                "{:>10} {:>12.5f} {:>14.2f} {:>16.2f}".format(
+                    name,
+                    open_time,
+                    peak / 1e6,
+                    lookup_time / len(track_ids) * 1e6,
+                )
+            )
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tools")
+)
+
+pytest.importorskip("music21")
+
+from add_roman_numerals import analyze_figure
+
+
+@pytest.mark.parametrize(
+    "symbol, key_name, figure",
+    [
+        ("C", "C major", "I"),
+        ("G7/B", "C major", "V65"),
+        ("C:maj/5", "C major", "I64"),
+        ("D/F#", "C major", "II6"),
+        ("Bb/F", "C major", "bVII64"),
+        ("Am7/G", "C major", "vi42"),
+        ("C:min7/b3", "C minor", "i65"),
+    ],
+)
+def test_slash_chord_figures(symbol, key_name, figure):
+    assert analyze_figure(symbol, key_name) == figure
+
+
+def test_unknown_symbol():
+    assert analyze_figure("N", "C major") == "?"
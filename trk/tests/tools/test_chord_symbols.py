@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tools")
+)
+
+from chord_symbols import chord_pitch_classes, parse_chord_symbol
+
+
+@pytest.mark.parametrize(
+    "symbol, pitch_classes",
+    [
+        # Harte
+        ("C:maj", (0, 4, 7)),
+        ("A:min", (0, 4, 9)),
+        ("G:7", (2, 5, 7, 11)),
+        ("D:(1,5)", (2, 9)),
+        # chord names
+        ("C", (0, 4, 7)),
+        ("F#m7", (1, 4, 6, 9)),
+        ("Bbmaj7", (2, 5, 9, 10)),
+        ("Dsus4", (2, 7, 9)),
+        # chordonomicon "s" sharps
+        ("Csmin", (1, 4, 8)),
+        ("Fs7", (1, 4, 6, 10)),
+        ("Gs", (0, 3, 8)),
+        # parenthesized extensions
+        ("Cm(maj7)", (0, 3, 7, 11)),
+        ("C(add9)", (0, 2, 4, 7)),
+        ("C7(#11)", (0, 4, 6, 7, 10)),
+        ("C(sus4)", (0, 5, 7)),
+    ],
+)
+def test_chord_pitch_classes(symbol, pitch_classes):
+    assert chord_pitch_classes(symbol) == pitch_classes
+
+
+@pytest.mark.parametrize(
+    "symbol, intervals, bass",
+    [
+        ("Bb:min7/b3", (0, 3, 7, 10), 3),
+        ("D/F#", (0, 4, 7), 4),
+        ("G7/B", (0, 4, 7, 10), 4),
+        # a bass outside the chord is added to it
+        ("C/Bb", (0, 4, 7, 10), 10),
+        ("C:maj/b7", (0, 4, 7, 10), 10),
+    ],
+)
+def test_slash_chords(symbol, intervals, bass):
+    parsed = parse_chord_symbol(symbol)
+    assert parsed.intervals == intervals
+    assert parsed.bass == bass
+
+
+def test_slash_chord_pitch_classes():
+    assert chord_pitch_classes("Bb:min7/b3") == (1, 5, 8, 10)
+    assert chord_pitch_classes("D/F#") == (2, 6, 9)
+    assert chord_pitch_classes("C/Bb") == (0, 4, 7, 10)
+
+
+@pytest.mark.parametrize("symbol", ["N", "X", "", "H:maj"])
+def test_no_chord(symbol):
+    assert parse_chord_symbol(symbol) is None
+    assert chord_pitch_classes(symbol) == ()
@@ -0,0 +1,98 @@
+import json
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "tools")
+)
+
+import jcrd_io
+
+DOCUMENT = {
+    "title": "Déjà Vu",
+    "artist": "Björk — 東京",
+    "bpm": 120,
+    "beat_times": [0.0, 0.5, 1.25],
+    "sections": [
+        {
+            "id": "A",
+            "start_ms": 0,
+            "duration_ms": 2000,
+            "chords": ["C:maj", "A:min"],
+        }
+    ],
+}
+
+EDGE_FLOATS = [0.1, -2.5, 1e-05, 0.00012, 1e16, 1.5e300, 123456789.123, -0.0]
+
+
+def test_dumps_matches_json_module():
+    assert jcrd_io.dumps(DOCUMENT) == json.dumps(DOCUMENT, indent=2).encode()
+    assert jcrd_io.dumps(DOCUMENT, compact=True) == json.dumps(
+        DOCUMENT, separators=(",", ":")
+    ).encode()
+
+
+def test_non_ascii_round_trip(tmp_path):
+    path = tmp_path / "song.json"
+    jcrd_io.dump(DOCUMENT, path)
+    raw = path.read_bytes()
+    assert raw.isascii()
+    assert jcrd_io.load(path) == DOCUMENT
+
+
+@pytest.mark.parametrize("value", EDGE_FLOATS)
+def test_float_round_trip(value):
+    data = {"value": value}
+    assert jcrd_io.dumps(data) == json.dumps(data, indent=2).encode()
+    assert jcrd_io.loads(jcrd_io.dumps(data)) == data
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_round_trip(value):
+    raw = jcrd_io.dumps({"value": value})
+    assert raw == json.dumps({"value": value}, indent=2).encode()
+    loaded = jcrd_io.loads(raw)["value"]
+    if math.isnan(value):
+        assert math.isnan(loaded)
+    else:
+        assert loaded == value
+
+
+def test_invalid_json_raises_value_error():
+    with pytest.raises(ValueError):
+        jcrd_io.loads(b"{not json")
+
+
+def test_dump_keeps_layout(tmp_path):
+    path = tmp_path / "song.json"
+    jcrd_io.dump(DOCUMENT, path)
+    assert not jcrd_io.is_compact(path.read_bytes())
+
+    jcrd_io.dump(DOCUMENT, path, compact=True)
+    assert jcrd_io.is_compact(path.read_bytes())
+
+    # None keeps the layout of the existing file
+    changed = dict(DOCUMENT, bpm=90)
+    jcrd_io.dump(changed, path)
+    assert jcrd_io.is_compact(path.read_bytes())
+    assert jcrd_io.load(path) == changed
+
+
+def test_dump_skips_unchanged(tmp_path):
+    path = tmp_path / "song.json"
+    assert jcrd_io.dump(DOCUMENT, path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    assert not jcrd_io.dump(DOCUMENT, path)
+    assert os.stat(path).st_mtime_ns == mtime_ns
+    assert jcrd_io.dump(dict(DOCUMENT, bpm=90), path)
+
+
+def test_gzip_round_trip(tmp_path):
+    path = tmp_path / "song.json.gz"
+    assert jcrd_io.dump(DOCUMENT, path)
+    assert jcrd_io.load(path) == DOCUMENT
+    assert not jcrd_io.dump(DOCUMENT, path)
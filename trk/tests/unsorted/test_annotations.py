@@ -258,6 +258,34 @@ def test_note_data():
     )
     assert np.allclose(matrix, expected)
 
+    # test to sparse matrix
+    dense = note_data2.to_matrix(
+        time_scale, "s", frequency_scale, "hz", "likelihood"
+    )
+    for sparse_format in ["coo", "csr"]:
+        matrix = note_data2.to_matrix(
+            time_scale,
+            "s",
+            frequency_scale,
+            "hz",
+            "likelihood",
+            sparse_format=sparse_format,
+        )
+        assert matrix.format == sparse_format
+        assert matrix.shape == (6, 3)
+        assert np.allclose(matrix.toarray(), dense)
+
+    with pytest.raises(ValueError):
+        note_data.to_matrix(
+            time_scale, "s", frequency_scale, "hz", sparse_format="dok"
+        )
+
+    # repeated indices keep the last value, as in the dense matrix
+    matrix = annotations.sparse_index_to_matrix(
+        np.array([[0, 1], [0, 1]]), np.array([0.3, 0.7]), (2, 2)
+    )
+    assert np.allclose(matrix.toarray(), np.array([[0, 0.7], [0, 0]]))
+
     # test to_multif0
     mf0_data = note_data2.to_multif0(0.5, "s")
     assert mf0_data.time_unit == "s"
@@ -713,6 +741,12 @@ def test_multif0_data():
     )
     assert np.allclose(matrix, matrix_expected)
 
+    sparse_matrix = f0_data2.to_matrix(
+        time_scale, "s", frequency_scale, "hz", "binary", sparse_format="csr"
+    )
+    assert sparse_matrix.format == "csr"
+    assert np.allclose(sparse_matrix.toarray(), matrix_expected)
+
     times_me, frequencies_me = f0_data.to_mir_eval()
     assert np.allclose(times_me, times)
     for flist, farr in zip(frequencies, frequencies_me):
@@ -722,6 +756,101 @@ def test_multif0_data():
     )
 
 
+def test_ragged_multif0_data():
+    times = np.array([1.0, 2.0, 3.0])
+    frequencies = [[100.0], [150.0, 120.0], []]
+    confidence = [[0.5], [0.25, 0.75], []]
+    mf0_data = annotations.MultiF0Data(
+        times, "s", frequencies, "hz", confidence, "likelihood"
+    )
+    ragged = mf0_data.to_ragged()
+    assert ragged.frequencies.dtype == np.float32
+    assert np.array_equal(ragged.offsets, [0, 1, 3, 3])
+    assert ragged.frequency_list == frequencies
+    assert ragged.confidence_list == confidence
+    assert ragged.to_multif0().frequency_list == frequencies
+
+    ragged2 = annotations.RaggedMultiF0Data(
+        times, "s", np.array([100.0, 150.0, 120.0]), [0, 1, 3, 3], "hz"
+    )
+    assert ragged2.frequency_list == frequencies
+    assert ragged2.confidence_list is None
+
+    # test duplicates
+    ragged_dup = annotations.RaggedMultiF0Data(
+        times,
+        "s",
+        np.array([100.0, 150.0, 120.0, 150.0]),
+        np.array([0, 1, 4, 4]),
+        "hz",
+        np.array([0.5, 0.25, 0.75, 1.0]),
+        "likelihood",
+    )
+    assert ragged_dup.frequency_list == frequencies
+    assert ragged_dup.confidence_list == confidence
+
+    with pytest.raises(ValueError):
+        annotations.RaggedMultiF0Data(
+            times, "s", np.array([100.0]), np.array([0, 1, 2]), "hz"
+        )
+    with pytest.raises(ValueError):
+        annotations.RaggedMultiF0Data(
+            times, "s", np.array([100.0]), np.array([0, 1, 1, 1]), "pc"
+        )
+
+    # test resample
+    time_scale = np.array([0.5, 1.0, 1.5, 2.0])
+    ragged_rsmp = ragged.resample(time_scale, "s")
+    assert np.allclose(ragged_rsmp.times, time_scale)
+    assert ragged_rsmp.frequency_list == [
+        [],
+        [100.0],
+        [100.0],
+        [150.0, 120.0],
+    ]
+    assert ragged_rsmp.confidence_list == [[], [0.5], [0.5], [0.25, 0.75]]
+
+    # test add, which matches MultiF0Data
+    other = annotations.MultiF0Data(
+        np.array([1000.0, 2000.0, 3000.0, 4000.0]),
+        "ms",
+        [[20.0], [30.0, 43.0], [], []],
+        "midi",
+    )
+    ragged_add = mf0_data.to_ragged(dtype=float) + other
+    assert isinstance(ragged_add, annotations.RaggedMultiF0Data)
+    assert ragged_add.frequency_list == (mf0_data + other).frequency_list
+    assert ragged_add.confidence_list is None
+
+    ragged_add = ragged + ragged
+    assert ragged_add.frequency_list == frequencies
+    assert ragged_add.confidence_list == confidence
+
+    with pytest.raises(TypeError):
+        ragged + 1
+
+    # test sparse index and matrix
+    frequency_scale = np.array([50.0, 90.0, 130.0])
+    sparse_idx, conf = ragged.to_sparse_index(
+        time_scale, "s", frequency_scale, "hz", "likelihood"
+    )
+    # 150 Hz is above the frequency scale and is dropped
+    assert np.array_equal(sparse_idx, [[1, 1], [2, 1], [3, 2]])
+    assert np.allclose(conf, [0.5, 0.5, 0.75])
+    matrix = ragged.to_matrix(
+        time_scale, "s", frequency_scale, "hz", sparse_format="csr"
+    )
+    assert np.allclose(
+        matrix.toarray(),
+        ragged.to_matrix(time_scale, "s", frequency_scale, "hz"),
+    )
+
+    times_me, frequencies_me = ragged.to_mir_eval()
+    assert np.allclose(times_me, times)
+    for flist, farr in zip(frequencies, frequencies_me):
+        assert np.allclose(flist, farr)
+
+
 def test_key_data():
     intervals = np.array([[1.0, 2.0], [1.5, 3.0], [2.0, 3.0]])
     keys = ["E:minor", "A", "G"]
@@ -937,6 +1066,19 @@ def test_closest_index():
     expected = np.array([-1, 1, -1, 0])
     assert np.array_equal(actual, expected)
 
+    # ties resolve to the lowest target index, as with argmin over distances
+    input_array = np.array([1.5, 2.5, 3.0, 0.0])[:, np.newaxis]
+    target_array = np.array([3.0, 1.0, 2.0, 2.0, 0.0])[:, np.newaxis]
+    actual = annotations.closest_index(input_array, target_array)
+    expected = np.array([1, 0, 0, 4])
+    assert np.array_equal(actual, expected)
+
+    # 1-D inputs and empty inputs
+    actual = annotations.closest_index(np.array([0.4, 9.0]), np.arange(5.0))
+    assert np.array_equal(actual, np.array([0, -1]))
+    actual = annotations.closest_index(np.zeros((0, 1)), np.arange(5.0))
+    assert actual.shape == (0,)
+
 
 def test_validate_array_like():
     with pytest.raises(ValueError):
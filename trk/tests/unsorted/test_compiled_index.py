@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from mirdata import compiled_index
+
+
+def test_compiled_index(tmpdir):
+    index_path = os.path.join(str(tmpdir), "slakh_index.json")
+    shutil.copy("tests/indexes/slakh_index_baby_sample.json", index_path)
+    with open(index_path) as fhandle:
+        expected = json.load(fhandle)
+
+    assert compiled_index.load_index(index_path) is None
+    compiled_path = compiled_index.compile_index(index_path)
+    assert compiled_path == os.path.join(str(tmpdir), "slakh_index.mirx")
+
+    index = compiled_index.load_index(index_path)
+    assert set(index.keys()) == set(expected.keys())
+    assert index["version"] == expected["version"]
+    for section in ["tracks", "multitracks"]:
+        assert list(index[section]) == list(expected[section])
+        assert len(index[section]) == len(expected[section])
+        for key, value in expected[section].items():
+            assert key in index[section]
+            assert index[section][key] == value
+        assert "not-a-key" not in index[section]
+        assert 0 not in index[section]
+        with pytest.raises(KeyError):
+            index[section]["not-a-key"]
+    assert dict(index["tracks"].items()) == expected["tracks"]
+    index.close()
+
+    # a stale compiled index is ignored
+    with open(index_path, "a") as fhandle:
+        fhandle.write("\n")
+    assert compiled_index.load_index(index_path) is None
+
+    # a compiled index without its source is used as is
+    compiled_index.compile_index(index_path)
+    os.remove(index_path)
+    index = compiled_index.load_index(index_path)
+    track_id = "Track00001-S00"
+    assert index["tracks"][track_id] == expected["tracks"][track_id]
+
+    with open(compiled_path, "r+b") as fhandle:
+        fhandle.write(b"NOTINDEX")
+    with pytest.raises(ValueError):
+        compiled_index.CompiledIndex(compiled_path)
+    # an unreadable compiled index is ignored, so the JSON index is used
+    assert compiled_index.load_index(index_path) is None
+
+    # so are truncated and empty ones (checked without the source, so that
+    # they are not simply discarded as stale)
+    shutil.copy("tests/indexes/slakh_index_baby_sample.json", index_path)
+    compiled_index.compile_index(index_path)
+    os.remove(index_path)
+    with open(compiled_path, "rb") as fhandle:
+        compiled = fhandle.read()
+    for size in [len(compiled) // 2, len(compiled) - 1, 0]:
+        with open(compiled_path, "wb") as fhandle:
+            fhandle.write(compiled[:size])
+        assert compiled_index.load_index(index_path) is None
@@ -897,3 +897,117 @@ def test_dataset_splits():
     assert set(splits.keys()) == set(
         ["train", "validation", "test", "omitted"]
     )
+
+
+def test_iter_tracks():
+    loads = []
+
+    class CountingTrack(core.Track):
+        @core.cached_property
+        def annotation(self):
+            loads.append(self.track_id)
+            return np.zeros(1000)
+
+    dataset = mirdata.initialize("billboard")
+    dataset._track_class = CountingTrack
+    track_ids = dataset.track_ids[:10]
+
+    tracks = list(dataset.iter_tracks(track_ids))
+    assert [track.track_id for track in tracks] == track_ids
+    assert loads == []
+
+    for prefetch in [0, 3]:
+        loads.clear()
+        iterator = dataset.iter_tracks(
+            track_ids,
+            prefetch=prefetch,
+            properties=["annotation"],
+            release=True,
+        )
+        previous = None
+        for track in iterator:
+            assert "annotation" in track.__dict__
+            if previous is not None:
+                assert "annotation" not in previous.__dict__
+            previous = track
+        assert sorted(loads) == sorted(track_ids)
+
+    # stopping early doesn't load the remaining tracks
+    loads.clear()
+    iterator = dataset.iter_tracks(
+        track_ids, prefetch=2, properties=["annotation"]
+    )
+    next(iterator)
+    iterator.close()
+    assert len(loads) <= 4
+
+    released = core.clear_cached_properties(tracks[0])
+    assert released == []
+    tracks[0].annotation
+    assert core.clear_cached_properties(tracks[0]) == ["annotation"]
+
+    dataset._track_class = None
+    with pytest.raises(AttributeError):
+        dataset.iter_tracks()
+    with pytest.raises(AttributeError):
+        dataset.iter_multitracks()
+
+
+def test_property_cache():
+    class ArrayTrack(core.Track):
+        @core.cached_property
+        def annotation(self):
+            return np.zeros(1000)  # 8000 bytes
+
+        @core.cached_property
+        def big(self):
+            return np.zeros(10000)
+
+    index = {"tracks": {str(i): {} for i in range(5)}}
+    tracks = [
+        ArrayTrack(str(i), "data_home", "test", index, lambda: None)
+        for i in range(5)
+    ]
+    cache = core.property_cache
+    assert cache.max_bytes is None
+
+    cache.set_budget(20000)
+    try:
+        annotation = tracks[0].annotation
+        assert tracks[0].annotation is annotation
+        assert "annotation" not in tracks[0].__dict__
+        tracks[1].annotation
+        tracks[0].annotation  # 0 is now the most recently used
+        tracks[2].annotation
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 16000
+        assert tracks[0].annotation is annotation
+
+        # too large for the budget, returned but never cached
+        tracks[3].big
+        assert cache.stats()["entries"] == 2
+
+        assert core.clear_cached_properties(tracks[0]) == ["annotation"]
+        assert cache.stats()["bytes"] == 8000
+
+        # values are dropped with their track
+        del tracks[2]
+        assert cache.stats()["bytes"] == 0
+
+        tracks[1].annotation
+        cache.set_budget(0)
+        assert cache.stats()["entries"] == 0
+        with pytest.raises(ValueError):
+            cache.set_budget(-1)
+    finally:
+        cache.set_budget(None)
+        cache.clear()
+        cache.reset_stats()
+
+    tracks[0].annotation
+    assert "annotation" in tracks[0].__dict__
+    assert cache.stats()["entries"] == 0
@@ -2,6 +2,7 @@ import tempfile
 from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
 
 import numpy as np
+import pretty_midi
 import pytest
 
 from mirdata import io
@@ -59,6 +60,44 @@ def test_load_multif0_from_midi():
         io.load_notes_from_midi(None, None)
 
 
+def test_load_multif0_from_midi_hop():
+    midi = pretty_midi.PrettyMIDI(initial_tempo=120.0)
+    instrument = pretty_midi.Instrument(0)
+    instrument.notes.append(pretty_midi.Note(100, 60, 0.0, 0.2))
+    instrument.notes.append(pretty_midi.Note(80, 64, 0.1, 0.3))
+    instrument.pitch_bends.append(pretty_midi.PitchBend(4096, 0.1))
+    instrument.pitch_bends.append(pretty_midi.PitchBend(-4096, 0.2))
+    midi.instruments.append(instrument)
+    drums = pretty_midi.Instrument(0, is_drum=True)
+    drums.notes.append(pretty_midi.Note(100, 36, 0.0, 0.1))
+    midi.instruments.append(drums)
+    # pretty_midi only builds its tick grid when loading a file
+    midi_bytes = BytesIO()
+    midi.write(midi_bytes)
+    midi_bytes.seek(0)
+
+    mf0_data = io.load_multif0_from_midi(
+        midi_bytes, pitch_bend=True, hop=0.1
+    )
+    assert np.allclose(mf0_data.times[:5], [0.0, 0.1, 0.2, 0.3, 0.4])
+    assert mf0_data.frequency_list[:5] == [
+        [60.0],
+        [61.0, 65.0],
+        [59.0, 63.0],
+        [64.0],
+        [],
+    ]
+    assert mf0_data.confidence_list[:4] == [
+        [100.0],
+        [100.0, 80.0],
+        [100.0, 80.0],
+        [80.0],
+    ]
+
+    with pytest.raises(ValueError):
+        io.load_multif0_from_midi(midi=midi, hop=0)
+
+
 def test_coerce_to_string_with_none():
     @io.coerce_to_string_io
     def func(fh):
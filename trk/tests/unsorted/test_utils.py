@@ -150,6 +150,57 @@ def test_validate_index(test_index, expected_missing, expected_inv_checksum):
     assert expected_inv_checksum == invalid_checksums
 
 
+def test_validate_index_cache(mocker, tmp_path):
+    with open("tests/indexes/test_index_valid.json", "r") as index_file:
+        test_index = json.load(index_file)
+    cache_path = str(tmp_path / validate.CHECKSUM_CACHE_NAME)
+    data_home = os.path.normpath("tests/resources/")
+
+    for use_processes in [False, True]:
+        missing_files, invalid_checksums = validate.validate_index(
+            test_index,
+            data_home,
+            False,
+            cache_path=cache_path,
+            num_workers=2,
+            use_processes=use_processes,
+        )
+        assert missing_files == {"tracks": {}}
+        assert invalid_checksums == {"tracks": {}}
+
+    cache = validate.load_checksum_cache(cache_path)
+    assert sorted(cache.keys()) == sorted(
+        os.path.abspath(os.path.join(data_home, f))
+        for f in ["10161_chorus.wav", "10161_verse.wav"]
+    )
+
+    # unchanged files are not hashed again
+    mock_md5 = mocker.patch.object(validate, "md5")
+    missing_files, invalid_checksums = validate.validate_index(
+        test_index, data_home, False, cache_path=cache_path
+    )
+    assert invalid_checksums == {"tracks": {}}
+    mock_md5.assert_not_called()
+
+
+def test_validate_index_fast(mocker):
+    with open("tests/indexes/test_index_missing_file.json", "r") as fhandle:
+        test_index = json.load(fhandle)
+    mock_md5 = mocker.patch.object(validate, "md5")
+    missing_files, invalid_checksums = validate.validate_index(
+        test_index, os.path.normpath("tests/resources/"), False, fast=True
+    )
+    assert missing_files == {
+        "tracks": {
+            "10161_chorus": [
+                os.path.normpath("tests/resources/10162_chorus.wav")
+            ]
+        }
+    }
+    assert invalid_checksums == {"tracks": {}}
+    mock_md5.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "missing_files,invalid_checksums",
     [
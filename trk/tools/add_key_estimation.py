@@ -1,29 +1,94 @@
 """
 TOOLBOX:
 name: Add Key Estimation
-description: Analyzes chords in .jcrd files and estimates the key using Music21. Adds "key" field to the song if missing.
+description: Analyzes chords in .jcrd files and estimates the key from a duration-weighted chroma histogram. Adds "key" field to the song if missing.
 arguments:
   --directory: Folder containing .jcrd files (default: mcgill_jcrd/)
+  --recursive: Also process sub folders
+  --jobs: Number of worker processes (default: CPU count, 1 = no pool)
+  --profile: Key profile: aarden, krumhansl or temperley (default: aarden)
+  --backend: numpy (default) or music21 (slow, for verification)
+  --verify: Compare both backends without writing any file
+  --overwrite: Re-estimate songs that already have a key
+
+Every distinct chord symbol (Harte "Bb:min7/b3", chord names "F#m7",
+chordonomicon "Csmin") is parsed once per process to its pitch classes
+by chord_symbols.py.
+A song's chroma histogram sums the pitch classes of its chords weighted by
+their duration (chord times, or the section duration shared by its
+chords, or 1 per chord when the file has no timing), and the key is the
+one whose rotated major or minor profile correlates best with it, the
+Krumhansl-Schmuckler method music21 uses. The default Aarden-Essen
+profile is the one music21's analyze("key") picks, as the previous
+music21-based version of this tool did. All songs of a chunk are
+correlated against the 24 keys in one matrix product. Key names use the
+music21 spelling, e.g. "E- major" or "G# minor".
 """
 
-import os
-import json
 import argparse
-from music21 import key, chord, stream
+import concurrent.futures
+import functools
+import os
+import sys
+import time
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import jcrd_io
+from chord_symbols import chord_pitch_classes, chord_symbol
+from jcrd_catalog import find_files
+
+UNKNOWN_KEY = "Unknown"
+DEFAULT_PROFILE = "aarden"
+DEFAULT_CHUNK_SIZE = 64
+
+# key profiles (major, minor) from tonic upwards, as in music21.analysis.discrete;
+# the profile names are also music21's analysis method names
+PROFILES = {
+    "krumhansl": (
+        [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88],
+        [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17],
+    ),
+    "temperley": (
+        [0.748, 0.060, 0.488, 0.082, 0.670, 0.460, 0.096, 0.715, 0.104, 0.366, 0.057, 0.400],
+        [0.712, 0.084, 0.474, 0.618, 0.049, 0.460, 0.105, 0.747, 0.404, 0.067, 0.133, 0.330],
+    ),
+    "aarden": (
+        [17.7661, 0.145624, 14.9265, 0.160186, 19.8049, 11.3587,
+         0.291248, 22.062, 0.145624, 8.15494, 0.232998, 4.95122],
+        [18.2648, 0.737619, 14.0499, 16.8599, 0.702494, 14.4362,
+         0.702494, 18.6161, 4.56621, 1.93186, 7.37619, 1.75623],
+    ),
+}
+
+# tonic spelling music21 chooses for each pitch class
+MAJOR_TONICS = ["C", "C#", "D", "E-", "E", "F", "F#", "G", "A-", "A", "B-", "B"]
+MINOR_TONICS = ["C", "C#", "D", "E-", "E", "F", "F#", "G", "G#", "A", "B-", "B"]
+KEY_NAMES = [f"{tonic} major" for tonic in MAJOR_TONICS] + [f"{tonic} minor" for tonic in MINOR_TONICS]
 
 
-def estimate_key_from_chords(chord_list):
+# ---------------------------------------------------------------------------
+# Chroma histograms
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def chord_vector(symbol):
+    """12-dimensional pitch-class indicator vector of a chord symbol (read-only)"""
+    vector = np.zeros(12)
+    vector[list(chord_pitch_classes(symbol))] = 1.0
+    vector.flags.writeable = False
+    return vector
+
+
+def _number(value):
     try:
-        s = stream.Stream()
-        for ch in chord_list:
-            try:
-                s.append(chord.Chord(ch))
-            except Exception:
-                continue
-        return s.analyze("key").name
-    except Exception as e:
-        print(f"Key estimation error: {e}")
-        return "Unknown"
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
 
 def collect_chords(data):
@@ -33,6 +98,234 @@ def collect_chords(data):
     return all_chords
 
 
+def _section_duration(section):
+    if "duration_ms" in section:
+        duration = _number(section.get("duration_ms"))
+        return duration / 1000.0 if duration is not None else None
+    duration = _number(section.get("duration"))
+    start = _number(section.get("start_time", section.get("start")))
+    end = _number(section.get("end_time", section.get("end")))
+    if duration is None and start is not None and end is not None:
+        duration = end - start
+    return duration
+
+
+def chord_durations(data):
+    """
+    Chord symbols of a song with the duration of every chord
+
+    Chords given as objects use their own duration (or end minus start);
+    chords given as text share the duration of their section equally. When
+    no duration is known at all, every chord counts once.
+
+    Returns:
+        (list of chord symbols, list of durations)
+    """
+    symbols, durations = [], []
+    timed = False
+    for section in data.get("sections", []):
+        chords = section.get("chords") or []
+        section_duration = _section_duration(section)
+        share = section_duration / len(chords) if section_duration and chords else None
+        for chord in chords:
+            duration = share
+            symbol = chord_symbol(chord)
+            if isinstance(chord, dict):
+                duration = _number(chord.get("duration"))
+                start, end = _number(chord.get("start_time")), _number(chord.get("end_time"))
+                if duration is None and start is not None and end is not None:
+                    duration = end - start
+            timed = timed or duration is not None
+            symbols.append(symbol)
+            durations.append(duration)
+    if not timed:
+        durations = [1.0] * len(symbols)
+    return symbols, [max(duration or 0.0, 0.0) for duration in durations]
+
+
+def chroma_histogram(symbols, durations=None):
+    """Duration-weighted pitch-class histogram of a chord sequence"""
+    if not symbols:
+        return np.zeros(12)
+    weights = np.ones(len(symbols)) if durations is None else np.asarray(durations, dtype=float)
+    return weights @ np.array([chord_vector(symbol) for symbol in symbols])
+
+
+# ---------------------------------------------------------------------------
+# Key estimation
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def profile_matrix(profile=DEFAULT_PROFILE):
+    """
+    The 24 key profiles as rows (C major ... B major, C minor ... B minor),
+    centered and scaled to unit length so a dot product with a centered
+    histogram is proportional to their Pearson correlation
+    """
+    major, minor = (np.asarray(weights, dtype=float) for weights in PROFILES[profile])
+    rows = np.array([np.roll(major, tonic) for tonic in range(12)]
+                    + [np.roll(minor, tonic) for tonic in range(12)])
+    rows -= rows.mean(axis=1, keepdims=True)
+    rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+    rows.flags.writeable = False
+    return rows
+
+
+def key_correlations(chromas, profile=DEFAULT_PROFILE):
+    """
+    Correlation of every histogram with every key profile
+
+    Args:
+        chromas: array (songs, 12) of pitch-class histograms
+
+    Returns:
+        array (songs, 24), columns in the order of KEY_NAMES; 0 for flat
+        or empty histograms
+    """
+    chromas = np.atleast_2d(np.asarray(chromas, dtype=float))
+    centered = chromas - chromas.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=1, keepdims=True)
+    centered = np.divide(centered, norms, out=np.zeros_like(centered), where=norms > 0)
+    return centered @ profile_matrix(profile).T
+
+
+def estimate_keys(chromas, profile=DEFAULT_PROFILE):
+    """Key name of every histogram, "Unknown" for songs without chord tones"""
+    chromas = np.atleast_2d(np.asarray(chromas, dtype=float))
+    best = key_correlations(chromas, profile).argmax(axis=1)
+    return [KEY_NAMES[index] if total > 0 else UNKNOWN_KEY
+            for index, total in zip(best, chromas.sum(axis=1))]
+
+
+def estimate_key_music21(symbols, durations=None, profile=DEFAULT_PROFILE):
+    """
+    Same estimate computed by music21, for verification
+
+    Every chord becomes a music21 chord of its parsed pitch classes, as long
+    as its duration, and music21's analysis of the profile is run on them.
+    """
+    from music21 import chord, stream
+
+    durations = [1.0] * len(symbols) if durations is None else durations
+    try:
+        s = stream.Stream()
+        for symbol, duration in zip(symbols, durations):
+            pitch_classes = chord_pitch_classes(symbol)
+            if pitch_classes and duration > 0:
+                s.append(chord.Chord(list(pitch_classes), quarterLength=duration))
+        return s.analyze(profile).name
+    except Exception as e:
+        print(f"Key estimation error: {e}")
+        return UNKNOWN_KEY
+
+
+def estimate_key_from_chords(chord_list, durations=None, profile=DEFAULT_PROFILE, backend="numpy"):
+    """
+    Estimate the key of a chord sequence
+
+    Args:
+        chord_list: chord symbols
+        durations: duration of every chord, default 1 each
+        profile: name of the key profile in PROFILES
+        backend: "numpy" or "music21" (slow, for verification)
+
+    Returns:
+        key name in music21 spelling (e.g. "B- major"), or "Unknown"
+    """
+    if backend == "music21":
+        return estimate_key_music21(chord_list, durations, profile)
+    return estimate_keys(chroma_histogram(chord_list, durations), profile)[0]
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+def annotate_files(paths, profile=DEFAULT_PROFILE, backend="numpy", overwrite=False):
+    """
+    Add the estimated key to a chunk of JCRD files that have none
+
+    The histograms of the whole chunk are correlated with the key profiles
+    in one batch.
+
+    Returns:
+        list of (path, key, error); key is None for skipped files
+    """
+    results = []
+    todo = []
+    for path in paths:
+        try:
+            data = jcrd_io.load(path)
+        except (OSError, ValueError) as e:
+            results.append((path, None, str(e)))
+            continue
+        if data.get("key") and not overwrite:
+            results.append((path, None, None))
+            continue
+        todo.append((path, data, chord_durations(data)))
+
+    if backend == "music21":
+        keys = [estimate_key_music21(symbols, durations, profile) for _, _, (symbols, durations) in todo]
+    else:
+        chromas = np.zeros((len(todo), 12))
+        for row, (_, _, (symbols, durations)) in enumerate(todo):
+            chromas[row] = chroma_histogram(symbols, durations)
+        keys = estimate_keys(chromas, profile)
+
+    for (path, data, _), detected_key in zip(todo, keys):
+        data["key"] = detected_key
+        try:
+            jcrd_io.dump(data, path)
+        except OSError as e:
+            results.append((path, None, str(e)))
+            continue
+        results.append((path, detected_key, None))
+    return results
+
+
+def compare_backends(paths, profile=DEFAULT_PROFILE):
+    """
+    Estimate the keys of a chunk of files with both backends, writing nothing
+
+    Returns:
+        list of (path, numpy key, music21 key)
+    """
+    results = []
+    for path in paths:
+        try:
+            symbols, durations = chord_durations(jcrd_io.load(path))
+        except (OSError, ValueError):
+            continue
+        results.append((path,
+                        estimate_key_from_chords(symbols, durations, profile),
+                        estimate_key_music21(symbols, durations, profile)))
+    return results
+
+
+def list_files(directory, recursive=False):
+    """JCRD files of a directory, sorted"""
+    if recursive:
+        return find_files(directory)
+    return [os.path.join(directory, filename) for filename in sorted(os.listdir(directory))
+            if filename.endswith(".json")]
+
+
+def map_chunks(function, paths, jobs=None, chunk_size=DEFAULT_CHUNK_SIZE, initializer=None, initargs=()):
+    """
+    Apply a per-chunk function to files, on a process pool unless jobs is 1
+
+    initializer(*initargs) runs in every worker process (not in this
+    process). Yields the results of every chunk in order.
+    """
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    if jobs == 1 or len(chunks) <= 1:
+        yield from map(function, chunks)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=initializer,
+                                                initargs=initargs) as executor:
+        yield from executor.map(function, chunks)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Add key to .jcrd files")
     parser.add_argument(
@@ -40,23 +333,44 @@ def main():
         default="mcgill_jcrd",
         help="Directory with .jcrd files",
     )
+    parser.add_argument("--recursive", action="store_true", help="Also process sub folders")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Number of worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="Key profile")
+    parser.add_argument("--backend", choices=["numpy", "music21"], default="numpy",
+                        help="Estimation backend (music21 is slow, for verification)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Compare the numpy and music21 backends without writing")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Re-estimate songs that already have a key")
     args = parser.parse_args()
 
-    for filename in sorted(os.listdir(args.directory)):
-        if not filename.endswith(".json"):
-            continue
+    start = time.perf_counter()
+    paths = list_files(args.directory, args.recursive)
+
+    if args.verify:
+        total = mismatches = 0
+        for results in map_chunks(functools.partial(compare_backends, profile=args.profile), paths, args.jobs):
+            for path, fast_key, music21_key in results:
+                total += 1
+                if fast_key != music21_key:
+                    mismatches += 1
+                    print(f"❌ {os.path.basename(path)}: {fast_key} (numpy) != {music21_key} (music21)")
+        print(f"{total - mismatches}/{total} keys agree ({time.perf_counter() - start:.1f}s)")
+        return
 
-        fpath = os.path.join(args.directory, filename)
-        with open(fpath, "r") as f:
-            data = json.load(f)
-
-        if "key" not in data or not data["key"]:
-            chords = collect_chords(data)
-            detected_key = estimate_key_from_chords(chords)
-            data["key"] = detected_key
-            with open(fpath, "w") as f:
-                json.dump(data, f, indent=2)
-            print(f"✅ Added key '{detected_key}' to {filename}")
+    added = 0
+    annotate = functools.partial(annotate_files, profile=args.profile, backend=args.backend,
+                                 overwrite=args.overwrite)
+    for results in map_chunks(annotate, paths, args.jobs):
+        for path, detected_key, error in results:
+            if error:
+                print(f"Error processing {os.path.basename(path)}: {error}")
+            elif detected_key is not None:
+                added += 1
+                print(f"✅ Added key '{detected_key}' to {os.path.basename(path)}")
+    print(f"Added {added} keys to {len(paths)} files in {time.perf_counter() - start:.1f}s")
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ then adds or updates the "key" field in the file.
 """
 
 import os
-import json
+import jcrd_io
 import argparse
 from pathlib import Path
 
@@ -78,8 +78,7 @@ def add_keys_to_jcrd_files(directory):
 
         try:
             # Load the JCRD file
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = jcrd_io.load(file_path)
 
             # Skip if file already has a key field with content
             if data.get("key"):
@@ -98,8 +97,7 @@ def add_keys_to_jcrd_files(directory):
             data["key"] = detected_key
 
             # Save updated file
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2)
+            jcrd_io.dump(data, file_path)
 
             updated_files += 1
             print(f"Updated {filename}: Added key '{detected_key}'")
@@ -4,29 +4,218 @@ name: Add Roman Numerals
 description: Uses Music21 to analyze chords in each section of a .jcrd file and annotate with functional harmony.
 arguments:
   --directory: Folder of .jcrd files (default: mcgill_jcrd/)
+  --recursive: Also process sub folders
+  --jobs: Number of worker processes (default: CPU count, 1 = no pool)
+  --overwrite: Recompute sections that already have Roman numerals
+  --table: Figure table file (default: data/cache/roman_figures.json)
+
+Pop corpora reuse a few hundred chord symbols, so the figure of every
+(key, chord symbol) pair is computed by music21 only once and kept in a
+table. The table is stored in data/cache/roman_figures.json, handed to
+every worker process when a run starts, and the pairs the workers had to
+analyze are merged into it at the end of the run, so later runs are
+dictionary lookups and do not even import music21. Keys are normalized
+("E- major", "Eb", "Eb:maj" share entries) and chord symbols are read by
+chord_symbols.py, so Harte and chordonomicon spellings are understood.
 """
 
-import os
-import json
 import argparse
-from music21 import roman, key, chord
+import functools
+import importlib.metadata
+import json
+import os
+import re
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import jcrd_io
+from add_key_estimation import list_files, map_chunks
+from chord_symbols import chord_symbol, parse_chord_symbol
+from jcrd_catalog import split_key
+
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+DEFAULT_TABLE = os.path.join(REPO_ROOT, "data", "cache", "roman_figures.json")
+TABLE_VERSION = 3
+UNKNOWN_FIGURE = "?"
+DEFAULT_KEY = "C"
+
+# interval above the root used to spell every chord tone
+INTERVAL_NAMES = ["P1", "m2", "M2", "m3", "M3", "P4", "d5", "P5", "m6", "M6", "m7", "M7"]
+
+# (key, chord symbol) -> figure table of this process, and the entries
+# analyzed since it was loaded
+_figures = {}
+_new_figures = {}
+
+
+def normalize_key(key_signature):
+    """Key as "<tonic> <mode>" (e.g. "Eb major"), or None if it cannot be read"""
+    tonic, mode = split_key(key_signature)
+    if not tonic or not re.match(r"^[A-G][#b]?$", tonic):
+        return None
+    return f"{tonic} {mode or 'major'}"
+
+
+@functools.lru_cache(maxsize=None)
+def _music21_key(key_name):
+    from music21 import key
+
+    tonic, mode = key_name.split(" ", 1)
+    return key.Key(tonic.replace("b", "-"), mode)
+
+
+def _music21_chord(parsed):
+    from music21 import chord, pitch
+
+    root = pitch.Pitch(parsed.root_name.replace("b", "-") + "4")
+    tones = []
+    for interval in parsed.intervals:
+        name = INTERVAL_NAMES[interval]
+        if interval == 8 and 4 in parsed.intervals and 7 not in parsed.intervals:
+            name = "A5"
+        elif interval == 6 and 7 in parsed.intervals:
+            name = "A4"
+        tone = root.transpose(name)
+        if interval == parsed.bass:
+            tone.octave = 3
+        tones.append(tone)
+    # music21 reads the figure from the tones in pitch order
+    return chord.Chord(sorted(tones, key=lambda p: p.ps))
+
+
+def analyze_figure(symbol, key_name):
+    """Roman numeral figure of a chord symbol in a key, computed by music21"""
+    from music21 import roman
+
+    parsed = parse_chord_symbol(symbol)
+    if parsed is None or key_name is None:
+        return UNKNOWN_FIGURE
+    try:
+        return str(roman.romanNumeralFromChord(_music21_chord(parsed), _music21_key(key_name)).figure)
+    except Exception:
+        return UNKNOWN_FIGURE
+
+
+def roman_figure(symbol, key_name):
+    """Figure of a chord symbol in a normalized key, through the figure table"""
+    if symbol is None:
+        return UNKNOWN_FIGURE
+    entry = f"{key_name}\t{symbol}"
+    figure = _figures.get(entry)
+    if figure is None:
+        figure = _figures[entry] = _new_figures[entry] = analyze_figure(symbol, key_name)
+    return figure
 
 
 def analyze_chords_to_roman(chords, key_signature):
+    key_name = normalize_key(key_signature)
+    if key_name is None:
+        print(f"Key error: cannot read key {key_signature!r}")
+        return [UNKNOWN_FIGURE] * len(chords)
+    return [roman_figure(chord_symbol(ch), key_name) for ch in chords]
+
+
+# ---------------------------------------------------------------------------
+# Figure table
+# ---------------------------------------------------------------------------
+
+def _music21_version():
     try:
-        k = key.Key(key_signature)
-        roman_numerals = []
-        for ch in chords:
+        return importlib.metadata.version("music21")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def load_figure_table(path=DEFAULT_TABLE):
+    """
+    Read a figure table; tables of another format or music21 version are
+    ignored because music21 may spell figures differently
+
+    Returns:
+        dict "<key>\\t<chord symbol>" -> figure
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            table = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if table.get("version") != TABLE_VERSION or table.get("music21") != _music21_version():
+        return {}
+    return table.get("figures", {})
+
+
+def save_figure_table(figures, path=DEFAULT_TABLE):
+    """Write a figure table atomically"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": TABLE_VERSION, "music21": _music21_version(), "figures": figures},
+                  f, sort_keys=True, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def use_figure_table(figures):
+    """Make a loaded table the figure table of this process (worker initializer)"""
+    global _figures
+    _figures = figures
+    _new_figures.clear()
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+def annotate_data(data, overwrite=False):
+    """Add Roman numerals to the sections of a loaded JCRD document; returns True if any changed"""
+    song_key = data.get("key") or DEFAULT_KEY
+
+    updated = False
+    for section in data.get("sections", []):
+        if overwrite or "romanNumerals" not in section or not section["romanNumerals"]:
+            chords = section.get("chords", [])
+            section["romanNumerals"] = analyze_chords_to_roman(
+                chords, song_key
+            )
+            updated = True
+    return updated
+
+
+def take_new_figures():
+    """Table entries analyzed by this process since the last call"""
+    new_figures = dict(_new_figures)
+    _new_figures.clear()
+    return new_figures
+
+
+def annotate_files(paths, overwrite=False):
+    """
+    Add Roman numerals to the sections of a chunk of JCRD files
+
+    Returns:
+        (list of (path, updated, error), table entries analyzed by this chunk)
+    """
+    results = []
+    for path in paths:
+        try:
+            data = jcrd_io.load(path)
+        except (OSError, ValueError) as e:
+            results.append((path, False, str(e)))
+            continue
+
+        updated = annotate_data(data, overwrite)
+        if updated:
             try:
-                c = chord.Chord(ch)
-                rn = roman.romanNumeralFromChord(c, k)
-                roman_numerals.append(str(rn.figure))
-            except Exception:
-                roman_numerals.append("?")
-        return roman_numerals
-    except Exception as e:
-        print(f"Key error: {e}")
-        return ["?"] * len(chords)
+                jcrd_io.dump(data, path)
+            except OSError as e:
+                results.append((path, False, str(e)))
+                continue
+        results.append((path, updated, None))
+
+    return results, take_new_figures()
 
 
 def main():
@@ -36,31 +225,37 @@ def main():
     parser.add_argument(
         "--directory", default="mcgill_jcrd", help="Folder of .jcrd files"
     )
+    parser.add_argument("--recursive", action="store_true", help="Also process sub folders")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Number of worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Recompute sections that already have Roman numerals")
+    parser.add_argument("--table", default=DEFAULT_TABLE, help="Figure table file")
     args = parser.parse_args()
 
-    for filename in sorted(os.listdir(args.directory)):
-        if not filename.endswith(".json"):
-            continue
-
-        fpath = os.path.join(args.directory, filename)
-        with open(fpath, "r") as f:
-            data = json.load(f)
+    start = time.perf_counter()
+    figures = load_figure_table(args.table)
+    known = len(figures)
+    use_figure_table(figures)
 
-        song_key = data.get("key", "C")
+    paths = list_files(args.directory, args.recursive)
+    annotate = functools.partial(annotate_files, overwrite=args.overwrite)
 
-        updated = False
-        for section in data.get("sections", []):
-            if "romanNumerals" not in section or not section["romanNumerals"]:
-                chords = section.get("chords", [])
-                section["romanNumerals"] = analyze_chords_to_roman(
-                    chords, song_key
-                )
-                updated = True
+    updated = 0
+    for results, new_figures in map_chunks(annotate, paths, args.jobs, initializer=use_figure_table,
+                                           initargs=(figures,)):
+        figures.update(new_figures)
+        for path, file_updated, error in results:
+            if error:
+                print(f"Error processing {os.path.basename(path)}: {error}")
+            elif file_updated:
+                updated += 1
+                print(f"✅ Updated Roman numerals in {os.path.basename(path)}")
 
-        if updated:
-            with open(fpath, "w") as f:
-                json.dump(data, f, indent=2)
-            print(f"✅ Updated Roman numerals in {filename}")
+    if len(figures) > known:
+        save_figure_table(figures, args.table)
+    print(f"Updated {updated} of {len(paths)} files in {time.perf_counter() - start:.1f}s "
+          f"({len(figures) - known} new figures, {len(figures)} in the table)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+batch_conversion_engine.py - In-process parallel engine for batch conversions
+
+Converts many files with a converter imported once per worker process,
+instead of starting a fresh Python interpreter per file. Files are sent to
+a ProcessPoolExecutor in chunks, every worker compiles the JCRD schema
+once (see jcrd_validation.py), and each file yields a result record:
+
+    {"input": ..., "output": ..., "status": "success" | "validation_failed"
+     | "failed" | "skipped", "error": ..., "seconds": ...}
+
+Records are appended to a JSON-lines results file as they complete. With
+resume enabled, files whose recorded (or explicit) output already exists,
+is newer than the input and passes validation are skipped, so a crashed
+batch can be restarted where it stopped.
+
+Used by batch_convert_choco.py, convert_all_partitions.py,
+batch_convert_choco_jams.py and batch_convert_rock_corpus.py.
+"""
+
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import jcrd_validation
+
+DEFAULT_SCHEMA = jcrd_validation.SCHEMA_PATH
+DEFAULT_CHUNK_SIZE = 16
+RESULTS_NAME = "conversion_results.jsonl"
+
+# Per-process state, set up once by _init_worker
+_SCHEMA_PATH = None
+_META_CACHE = {}
+
+
+def make_task(input_path, output=None, out_dir=None, meta=None, partition=None):
+    """Describe one file to convert
+
+    Args:
+        input_path: file to convert
+        output: explicit output path, or None to let the converter name it
+        out_dir: output directory when output is None
+        meta: path to a meta.csv used for enrichment (JAMS only)
+        partition: partition name stored in the JCRD (JAMS only)
+    """
+    return {
+        "input": input_path,
+        "output": output,
+        "out_dir": out_dir,
+        "meta": meta,
+        "partition": partition,
+    }
+
+
+def _convert_jams(task):
+    import jams_to_jcrd
+
+    meta_lookup = None
+    if task.get("meta"):
+        if task["meta"] not in _META_CACHE:
+            _META_CACHE[task["meta"]] = jams_to_jcrd.load_meta_lookup(task["meta"])
+        meta_lookup = _META_CACHE[task["meta"]]
+    output_path, _ = jams_to_jcrd.convert_file(
+        task["input"],
+        task.get("output"),
+        meta_lookup,
+        task.get("partition"),
+        task.get("out_dir"),
+    )
+    return output_path
+
+
+def _convert_har(task):
+    import rock_corpus_har_to_jcrd
+
+    output_path = task.get("output") or os.path.join(
+        task.get("out_dir") or os.path.dirname(task["input"]),
+        os.path.splitext(os.path.basename(task["input"]))[0] + ".jcrd",
+    )
+    rock_corpus_har_to_jcrd.convert_har_to_jcrd(task["input"], output_path)
+    return output_path
+
+
+#: Available converters, by name
+CONVERTERS = {
+    "jams": _convert_jams,
+    "har": _convert_har,
+}
+
+
+def _init_worker(schema_path):
+    global _SCHEMA_PATH
+    _SCHEMA_PATH = schema_path
+    if schema_path:
+        # compile once per worker
+        jcrd_validation.get_validator(schema_path)
+
+
+def _validation_error(path):
+    """Return the schema errors of a JCRD file, or None if it is valid"""
+    record = jcrd_validation.validate_file(path, ("schema",), _SCHEMA_PATH)
+    if record["valid"]:
+        return None
+    return "\n".join(f"{e['path'] or '/'}: {e['message']}" for e in record["errors"])
+
+
+def _is_done(task):
+    """Check if a previous run already produced a valid output for task"""
+    output = task.get("output") or task.get("previous_output")
+    if not output or not os.path.exists(output):
+        return False
+    if os.path.getmtime(output) < os.path.getmtime(task["input"]):
+        return False
+    if _SCHEMA_PATH is None:
+        return True
+    try:
+        return _validation_error(output) is None
+    except Exception:
+        return False
+
+
+def _run_task(converter, task, resume):
+    start = time.perf_counter()
+    record = {
+        "input": task["input"],
+        "output": task.get("output"),
+        "status": "failed",
+        "error": None,
+    }
+    if task.get("partition"):
+        record["partition"] = task["partition"]
+
+    if resume and _is_done(task):
+        record["output"] = task.get("output") or task.get("previous_output")
+        record["status"] = "skipped"
+        record["seconds"] = time.perf_counter() - start
+        return record
+
+    # converters print progress and debug output, keep it out of the batch log
+    captured = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(captured):
+            output = CONVERTERS[converter](task)
+        record["output"] = output
+        if not output or not os.path.exists(output):
+            record["error"] = "Output file not created"
+            tail = captured.getvalue().strip().splitlines()[-5:]
+            if tail:
+                record["error"] += ": " + " | ".join(tail)
+        elif _SCHEMA_PATH is not None:
+            error = _validation_error(output)
+            record["status"] = "success" if error is None else "validation_failed"
+            record["error"] = error
+        else:
+            record["status"] = "success"
+    except Exception as e:
+        record["error"] = f"{e}\n{traceback.format_exc()}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def _run_chunk(converter, tasks, resume):
+    return [_run_task(converter, task, resume) for task in tasks]
+
+
+def load_results(results_path):
+    """Read the result records of previous runs, keyed by input path"""
+    records = {}
+    if not results_path or not os.path.exists(results_path):
+        return records
+    with open(results_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # the last line may be truncated by a crash
+                continue
+            records[record["input"]] = record
+    return records
+
+
+def run_batch(tasks, converter="jams", workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+              schema_path=DEFAULT_SCHEMA, results_path=None, resume=False):
+    """Convert files on a process pool, yielding result records as they complete
+
+    Args:
+        tasks: list of task dicts, see make_task()
+        converter: name of the converter in CONVERTERS
+        workers: number of worker processes (None = cpu count, 0 = run in
+            this process)
+        chunk_size: number of files sent to a worker at once
+        schema_path: JCRD schema used to validate outputs, or None to skip
+            validation
+        results_path: JSON-lines file the records are appended to
+        resume: skip files whose output from a previous run is still valid
+
+    Yields:
+        one result record per task, in completion order
+    """
+    if converter not in CONVERTERS:
+        raise ValueError(f"Unknown converter {converter}, use one of {sorted(CONVERTERS)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if resume:
+        previous = load_results(results_path)
+        tasks = [dict(task) for task in tasks]
+        for task in tasks:
+            record = previous.get(task["input"])
+            if record and record["status"] in ("success", "skipped"):
+                task["previous_output"] = record["output"]
+
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    results_file = None
+    if results_path:
+        results_dir = os.path.dirname(os.path.abspath(results_path))
+        os.makedirs(results_dir, exist_ok=True)
+        results_file = open(results_path, "a", encoding="utf-8")
+
+    def emit(records):
+        for record in records:
+            if results_file:
+                results_file.write(json.dumps(record) + "\n")
+            yield record
+        if results_file:
+            results_file.flush()
+
+    try:
+        if workers == 0:
+            _init_worker(schema_path)
+            for chunk in chunks:
+                yield from emit(_run_chunk(converter, chunk, resume))
+            return
+
+        workers = workers or os.cpu_count() or 1
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(schema_path,)
+        ) as executor:
+            # keep a bounded number of chunks in flight
+            max_pending = 2 * workers
+            chunks = iter(chunks)
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_run_chunk, converter, chunk, resume))
+                if len(pending) >= max_pending:
+                    break
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        pending.add(executor.submit(_run_chunk, converter, chunk, resume))
+                    yield from emit(future.result())
+    finally:
+        if results_file:
+            results_file.close()
+
+
+def summarize(records):
+    """Count result records by status"""
+    summary = {"total": 0, "success": 0, "failed": 0, "validation_failed": 0, "skipped": 0}
+    for record in records:
+        summary["total"] += 1
+        summary[record["status"]] += 1
+    return summary
+
+
+def format_summary(summary):
+    return (
+        f"\nSummary:\n- Total: {summary['total']}\n- Success: {summary['success']}\n"
+        f"- Failed: {summary['failed']}\n- Validation failed: {summary['validation_failed']}\n"
+        f"- Skipped: {summary['skipped']}\n"
+    )
+
+
+def add_engine_arguments(parser):
+    """Add the shared --workers/--chunk-size/--resume/--results options"""
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count, 0 = no pool)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Number of files sent to a worker at once")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip files whose output from a previous run is still valid")
+    parser.add_argument("--results", default=None,
+                        help=f"JSON-lines file of per-file results (default: {RESULTS_NAME} in the output directory)")
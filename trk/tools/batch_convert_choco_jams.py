@@ -1,6 +1,9 @@
+import argparse
 import os
 import glob
-import subprocess
+import datetime
+
+import batch_conversion_engine as engine
 
 JAMS_DIR = r"datasets/choco/choco-main/partitions/rock-corpus/choco/jams"
 JCRD_DIR = r"datasets/choco/choco-main/partitions/rock-corpus/choco/jcrd"
@@ -8,19 +11,37 @@ META_PATH = r"datasets/choco/choco-main/partitions/rock-corpus/choco/meta.csv"
 PARTITION = "rock-corpus"
 LOG_PATH = r"datasets/choco/choco-main/partitions/rock-corpus/choco/conversion_log.txt"
 
-os.makedirs(JCRD_DIR, exist_ok=True)
-jams_files = glob.glob(os.path.join(JAMS_DIR, '*.jams'))
-
-for jams_path in jams_files:
-    base = os.path.splitext(os.path.basename(jams_path))[0]
-    jcrd_path = os.path.join(JCRD_DIR, base + '.jcrd.json')
-    cmd = [
-        'python', 'scripts/jams_to_jcrd.py',
-        jams_path, jcrd_path,
-        '--meta', META_PATH,
-        '--partition', PARTITION,
-        '--log', LOG_PATH
-    ]
-    print('Converting:', jams_path)
-    subprocess.run(cmd)
-print('Batch conversion complete.')
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the rock-corpus ChoCo partition to JCRD")
+    engine.add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    os.makedirs(JCRD_DIR, exist_ok=True)
+    jams_files = glob.glob(os.path.join(JAMS_DIR, '*.jams'))
+
+    tasks = []
+    for jams_path in jams_files:
+        base = os.path.splitext(os.path.basename(jams_path))[0]
+        jcrd_path = os.path.join(JCRD_DIR, base + '.jcrd.json')
+        tasks.append(engine.make_task(jams_path, output=jcrd_path, meta=META_PATH, partition=PARTITION))
+
+    results_path = args.results or os.path.join(JCRD_DIR, engine.RESULTS_NAME)
+    records = []
+    with open(LOG_PATH, 'a', encoding='utf-8') as logf:
+        logf.write(f"Batch conversion started at {datetime.datetime.now().isoformat()}\n")
+        for record in engine.run_batch(tasks, "jams", workers=args.workers, chunk_size=args.chunk_size,
+                                       results_path=results_path, resume=args.resume):
+            records.append(record)
+            if record['status'] in ('failed', 'validation_failed'):
+                print('Failed:', record['input'])
+                logf.write(f"FAIL: {record['input']} | Error: {record['error']}\n")
+            else:
+                print('Converted:', record['input'])
+                logf.write(f"{record['status'].upper()}: {record['input']} -> {record['output']} | partition: {PARTITION}\n")
+    print(engine.format_summary(engine.summarize(records)))
+    print('Batch conversion complete.')
+
+
+if __name__ == "__main__":
+    main()
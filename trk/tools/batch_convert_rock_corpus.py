@@ -1,13 +1,36 @@
+import argparse
 import os
-import subprocess
-
-har_dir = os.path.join("datasets", "rock_corpus", "rock_corpus", "rock_corpus_v2-1", "rs200_harmony")
-out_dir = os.path.abspath(".")
-script = os.path.abspath("rock_corpus_har_to_jcrd.py")
-
-for fname in os.listdir(har_dir):
-    if fname.endswith(".har"):
-        har_path = os.path.join(har_dir, fname)
-        jcrd_path = os.path.join(out_dir, fname.replace(".har", ".jcrd"))
-        print(f"Converting {fname} -> {os.path.basename(jcrd_path)}")
-        subprocess.run(["python", script, har_path, jcrd_path])
+
+import batch_conversion_engine as engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the Rock Corpus .har files to JCRD")
+    parser.add_argument("--har-dir", default=os.path.join("datasets", "rock_corpus", "rock_corpus", "rock_corpus_v2-1", "rs200_harmony"))
+    parser.add_argument("--out-dir", default=os.path.abspath("."))
+    engine.add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    tasks = []
+    for fname in sorted(os.listdir(args.har_dir)):
+        if fname.endswith(".har"):
+            har_path = os.path.join(args.har_dir, fname)
+            jcrd_path = os.path.join(args.out_dir, fname.replace(".har", ".jcrd"))
+            tasks.append(engine.make_task(har_path, output=jcrd_path))
+
+    # .har conversions use their own layout, they are not checked against jcrd.schema.json
+    results_path = args.results or os.path.join(args.out_dir, engine.RESULTS_NAME)
+    records = []
+    for record in engine.run_batch(tasks, "har", workers=args.workers, chunk_size=args.chunk_size,
+                                   schema_path=None, results_path=results_path, resume=args.resume):
+        records.append(record)
+        name = os.path.basename(record["input"])
+        if record["status"] == "failed":
+            print(f"Failed {name}: {record['error']}")
+        else:
+            print(f"Converted {name} -> {os.path.basename(record['output'])} ({record['status']})")
+    print(engine.format_summary(engine.summarize(records)))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ a consistent formatting pattern: "<LETTER>, <label>," (e.g., "A, intro,", "B, ve
 
 import os
 import re
-import json
+import jcrd_io
 import logging
 from difflib import SequenceMatcher
 import argparse
@@ -135,8 +135,7 @@ def find_best_matching_salami(jcrd_title, jcrd_artist, reference_map):
 def update_jcrd_file(jcrd_path, sections, dry_run=False):
     """Update a JCRD file with section labels and letters from SALAMI."""
     try:
-        with open(jcrd_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = jcrd_io.load(jcrd_path)
         
         # Backup original section labels
         original_labels = [section.get("sectionLabel", "") for section in data.get("sections", [])]
@@ -157,8 +156,7 @@ def update_jcrd_file(jcrd_path, sections, dry_run=False):
                     updated += 1
         
         if updated > 0 and not dry_run:
-            with open(jcrd_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            jcrd_io.dump(data, jcrd_path)
               logging.info(f"Updated {jcrd_path} with {updated} section changes")
             logging.debug(f"  Original: {original_labels}")
             section_info = []
@@ -194,8 +192,7 @@ def process_jcrd_files(jcrd_dir, reference_map, dry_run=False):
         jcrd_path = os.path.join(jcrd_dir, filename)
         
         try:
-            with open(jcrd_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = jcrd_io.load(jcrd_path)
             
             title = data.get("title", "")
             artist = data.get("artist", "")
@@ -233,8 +230,7 @@ def generate_section_label_stats(jcrd_dir):
         jcrd_path = os.path.join(jcrd_dir, filename)
         
         try:
-            with open(jcrd_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = jcrd_io.load(jcrd_path)
             
             for section in data.get("sections", []):
                 # Count section labels
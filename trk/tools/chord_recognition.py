@@ -0,0 +1,193 @@
+"""
+Chord recognition from pitch-class sets, shared by the MIDI converters.
+
+A set of pitch classes is a 12-bit mask (bit 0 = C). Every mask is
+labelled once, for every possible bass note, with the largest chord
+template whose tones are all present:
+
+- triads: major, minor, diminished, augmented, sus2, sus4
+- sevenths: 7, maj7, m7, dim7, m7b5, and the 6 chord
+
+The lookup table has 4096 x 13 entries (mask x bass note or none), so
+labelling a whole song is one vectorized lookup on its beat chroma:
+
+    chroma, bass = beat_chroma(pitches, note_beats, n_beats)
+    labels = label_chroma(chroma, bass)
+
+Between templates of the same size, major and minor triads are preferred
+over diminished, augmented and suspended ones; when two equally preferred
+templates explain the same notes (C6 / Am7, Csus2 / Gsus4), the one whose
+root is in the bass wins. A bass note other than the root is written as
+an inversion, e.g. "C/E". Sets that match no template are labelled with
+their pitch classes, e.g. "0+1+2".
+"""
+
+import functools
+
+import numpy as np
+
+NO_CHORD = "N.C."
+ROOT_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+
+# (suffix, intervals above the root, preference), in order of preference
+# for equal sizes; among templates of the same size, preference 0 wins over
+# preference 1 even when the root of the other template is in the bass
+TEMPLATES = [
+    ("", (0, 4, 7), 0),
+    ("m", (0, 3, 7), 0),
+    ("7", (0, 4, 7, 10), 0),
+    ("maj7", (0, 4, 7, 11), 0),
+    ("m7", (0, 3, 7, 10), 0),
+    ("6", (0, 4, 7, 9), 0),
+    ("m7b5", (0, 3, 6, 10), 0),
+    ("dim7", (0, 3, 6, 9), 1),
+    ("dim", (0, 3, 6), 1),
+    ("aug", (0, 4, 8), 1),
+    ("sus4", (0, 5, 7), 1),
+    ("sus2", (0, 2, 7), 1),
+]
+
+_BIT_WEIGHTS = 1 << np.arange(12)
+
+
+def pitch_class_mask(pitch_classes):
+    """Encode pitch classes (or MIDI pitches) as a 12-bit mask"""
+    mask = 0
+    for pc in pitch_classes:
+        mask |= 1 << (int(pc) % 12)
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _candidates():
+    """Masks, roots and suffixes of every template in every key"""
+    masks, roots, suffixes, scores = [], [], [], []
+    for rank, (suffix, intervals, preference) in enumerate(TEMPLATES):
+        for root in range(12):
+            masks.append(pitch_class_mask(root + i for i in intervals))
+            roots.append(root)
+            suffixes.append(suffix)
+            # larger templates first, then preference, (root in the bass,)
+            # template order and lower roots
+            scores.append(
+                len(intervals) * 10000 + (1 - preference) * 1000 + (len(TEMPLATES) - rank) * 12 + (11 - root)
+            )
+    return np.array(masks), np.array(roots), suffixes, np.array(scores)
+
+
+@functools.lru_cache(maxsize=None)
+def chord_table():
+    """
+    Best template for every (mask, bass) pair.
+
+    Returns:
+        Array of shape (4096, 13): index into the template candidates, or -1
+        when no template fits. Column 0 is "no bass note", column b + 1 is
+        bass pitch class b.
+    """
+    masks, roots, _, scores = _candidates()
+    all_masks = np.arange(4096)[:, None]
+    contained = (all_masks & masks) == masks
+    table = np.empty((4096, 13), dtype=np.int16)
+    for bass in range(-1, 12):
+        # a root in the bass beats template order, not size or preference
+        score = np.where(contained, scores + (roots == bass) * 500, -1)
+        best = score.argmax(axis=1)
+        table[:, bass + 1] = np.where(score[np.arange(4096), best] >= 0, best, -1)
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def label_mask(mask, bass=-1):
+    """
+    Name the chord of a pitch-class mask.
+
+    Args:
+        mask: 12-bit pitch-class mask
+        bass: pitch class of the lowest note, or -1 if unknown
+
+    Returns:
+        Chord label such as "C", "F#m7", "Gsus4", "C/E", NO_CHORD for an
+        empty mask, or the pitch classes joined with "+" if no template fits
+    """
+    mask = int(mask)
+    bass = int(bass)
+    if not mask:
+        return NO_CHORD
+    candidate = chord_table()[mask, bass + 1]
+    if candidate < 0:
+        return "+".join(str(pc) for pc in range(12) if mask >> pc & 1)
+    _, roots, suffixes, _ = _candidates()
+    root = int(roots[candidate])
+    label = ROOT_NAMES[root] + suffixes[candidate]
+    if bass >= 0 and bass != root and mask >> bass & 1:
+        label += "/" + ROOT_NAMES[bass]
+    return label
+
+
+def beat_chroma(pitches, note_beats, n_beats, weights=None):
+    """
+    Accumulate notes into a beat-synchronous chroma matrix.
+
+    Args:
+        pitches: MIDI pitch of every note
+        note_beats: beat index of every note; notes outside 0..n_beats-1 are
+            ignored
+        n_beats: number of beats
+        weights: optional weight of every note (e.g. duration or velocity),
+            default 1
+
+    Returns:
+        chroma: array (n_beats, 12) of summed weights per pitch class
+        bass: array (n_beats,) with the pitch class of the lowest note of
+            each beat, -1 for beats without notes
+    """
+    pitches = np.asarray(pitches, dtype=int)
+    note_beats = np.asarray(note_beats, dtype=int)
+    weights = np.ones(len(pitches)) if weights is None else np.asarray(weights, dtype=float)
+    valid = (note_beats >= 0) & (note_beats < n_beats)
+    pitches, note_beats, weights = pitches[valid], note_beats[valid], weights[valid]
+
+    chroma = np.zeros((n_beats, 12))
+    np.add.at(chroma, (note_beats, pitches % 12), weights)
+    lowest = np.full(n_beats, 128)
+    np.minimum.at(lowest, note_beats, pitches)
+    bass = np.where(lowest < 128, lowest % 12, -1)
+    return chroma, bass
+
+
+def label_chroma(chroma, bass=None, threshold=0.0):
+    """
+    Label every row of a chroma matrix in one vectorized lookup.
+
+    Args:
+        chroma: array (n, 12); a pitch class is present above threshold
+        bass: optional array (n,) of bass pitch classes, -1 where unknown
+        threshold: minimum chroma value of a present pitch class
+
+    Returns:
+        List of n chord labels
+    """
+    chroma = np.asarray(chroma)
+    masks = (chroma > threshold).astype(int) @ _BIT_WEIGHTS
+    bass = np.full(len(masks), -1) if bass is None else np.asarray(bass, dtype=int)
+    keys = masks * 13 + bass + 1
+    unique, inverse = np.unique(keys, return_inverse=True)
+    names = [label_mask(key // 13, key % 13 - 1) for key in unique.tolist()]
+    return [names[i] for i in inverse.tolist()]
+
+
+def detect_chord(notes):
+    """
+    Identify the chord of a set of notes.
+
+    Args:
+        notes: objects with a MIDI ``pitch`` (e.g. pretty_midi notes)
+
+    Returns:
+        Chord label, see label_mask
+    """
+    pitches = [n.pitch for n in notes]
+    if not pitches:
+        return NO_CHORD
+    return label_mask(pitch_class_mask(pitches), min(pitches) % 12)
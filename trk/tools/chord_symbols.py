@@ -0,0 +1,181 @@
+"""
+Chord symbol parsing shared by the JCRD annotation tools
+
+Understands the chord spellings of the JCRD library:
+
+- Harte symbols (McGill Billboard): C:min7, Bb:maj(9)/3, D:(1,5), F:sus4(b7)
+- chord names (Beatles, user files): Cm7, F#maj7, Bbadd9, G7sus4, C/E
+- chordonomicon, which writes sharps as "s": Csmin, Fs7, Emin/Cs
+
+Every distinct symbol is parsed once per process (lru_cache), so a
+library-wide pass parses a few hundred symbols instead of every chord.
+
+    parse_chord_symbol("Bb:min7/b3")  # ChordSymbol("Bb", 10, (0, 3, 7, 10), 3)
+    chord_pitch_classes("Bb:min7/b3")  # (1, 5, 8, 10)
+"""
+
+import collections
+import functools
+import re
+
+# root_name: spelled root ("Bb", "C#"), root: its pitch class, intervals:
+# semitones above the root (bass included), bass: interval of the bass note
+# above the root, or None when the root is in the bass
+ChordSymbol = collections.namedtuple("ChordSymbol", ["root_name", "root", "intervals", "bass"])
+
+PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+NO_CHORD = {"N", "NC", "N.C.", "X", "R"}
+# pitch class of each scale degree above the root (Harte intervals)
+DEGREES = {1: 0, 2: 2, 3: 4, 4: 5, 5: 7, 6: 9, 7: 11, 8: 0, 9: 2, 10: 4, 11: 5, 12: 7, 13: 9}
+
+# Harte shorthands plus the usual chord-name suffixes, as degree lists
+SHORTHANDS = {
+    "maj": "1,3,5", "min": "1,b3,5", "dim": "1,b3,b5", "aug": "1,3,#5",
+    "maj7": "1,3,5,7", "min7": "1,b3,5,b7", "7": "1,3,5,b7",
+    "dim7": "1,b3,b5,bb7", "hdim7": "1,b3,b5,b7", "minmaj7": "1,b3,5,7",
+    "maj6": "1,3,5,6", "min6": "1,b3,5,6",
+    "9": "1,3,5,b7,9", "maj9": "1,3,5,7,9", "min9": "1,b3,5,b7,9",
+    "11": "1,3,5,b7,9,11", "maj11": "1,3,5,7,9,11", "min11": "1,b3,5,b7,9,11",
+    "13": "1,3,5,b7,9,11,13", "maj13": "1,3,5,7,9,11,13", "min13": "1,b3,5,b7,9,11,13",
+    "sus2": "1,2,5", "sus4": "1,4,5", "5": "1,5", "1": "1",
+    "aug7": "1,3,#5,b7", "+7": "1,3,#5,b7", "augmaj7": "1,3,#5,7", "+maj7": "1,3,#5,7",
+}
+SHORTHAND_ALIASES = {
+    "": "maj", "M": "maj", "m": "min", "mi": "min", "6": "maj6", "m6": "min6",
+    "M7": "maj7", "m7": "min7", "M9": "maj9", "m9": "min9", "m11": "min11", "m13": "min13",
+    "mmaj7": "minmaj7", "mM7": "minmaj7", "minM7": "minmaj7",
+    "o": "dim", "°": "dim", "o7": "dim7", "°7": "dim7",
+    "ø": "hdim7", "ø7": "hdim7", "hdim": "hdim7", "m7b5": "hdim7", "min7b5": "hdim7",
+    "+": "aug", "sus": "sus4", "no3d": "5",
+}
+# longest first, so "maj7" wins over "maj" and "min" over "m"
+_SHORTHAND_PREFIXES = sorted(set(SHORTHANDS) | set(SHORTHAND_ALIASES), key=len, reverse=True)
+
+ROOT = re.compile(r"^([A-G])((?:#|b|♯|♭|s(?!us))*)(.*)$")
+DEGREE = re.compile(r"^(\*?)([#b♯♭]*)(\d+)$")
+MODIFIER = re.compile(r"(add|no|omit|sus)?([#b♯♭]*)(\d+)")
+MODIFIERS = re.compile(r"^(?:(?:add|no|omit|sus)?[#b♯♭]*\d+)+$")
+# root, thirds and fifth: the tones a parenthesized shorthand does not change
+TRIAD_TONES = {0, 3, 4, 7}
+
+
+def _accidentals(text):
+    return sum(1 if c in "#♯s" else -1 for c in text)
+
+
+def _degree(accidentals, number):
+    number = int(number)
+    if number not in DEGREES:
+        return None
+    return (DEGREES[number] + _accidentals(accidentals)) % 12
+
+
+def _shorthand(figure):
+    """Split a chord figure into (intervals of its quality, rest of the figure)"""
+    prefix = next(prefix for prefix in _SHORTHAND_PREFIXES if figure.startswith(prefix))
+    degrees = SHORTHANDS[SHORTHAND_ALIASES.get(prefix, prefix)]
+    intervals = {_degree(*DEGREE.match(degree).groups()[1:]) for degree in degrees.split(",")}
+    return intervals, figure[len(prefix):]
+
+
+def _apply_modifiers(intervals, rest):
+    # chord-name modifiers: add9, no3, sus4 after an extension (7sus4), b5, #11
+    for kind, accidentals, number in MODIFIER.findall(rest):
+        # a bare 7 in a chord name is the minor seventh
+        interval = 10 if number == "7" and not (kind or accidentals) else _degree(accidentals, number)
+        if interval is None:
+            continue
+        if kind in ("no", "omit"):
+            intervals -= {3, 4} if number == "3" else {6, 7, 8} if number == "5" else {interval}
+            continue
+        if kind == "sus":
+            intervals -= {3, 4}
+        elif number == "5" and accidentals:
+            intervals.discard(7)
+        intervals.add(interval)
+
+
+def _apply_extension(intervals, text):
+    # chord-name extension in parentheses: Cm(maj7), C(add9), C7(#11), C(sus4)
+    if MODIFIERS.match(text):
+        _apply_modifiers(intervals, text)
+        return
+    extension, rest = _shorthand(text)
+    intervals |= extension - TRIAD_TONES
+    _apply_modifiers(intervals, rest)
+
+
+@functools.lru_cache(maxsize=None)
+def parse_chord_symbol(symbol):
+    """
+    Parse a chord symbol, once per process
+
+    Returns:
+        ChordSymbol, or None for no-chord symbols and for text that is not
+        a chord name (e.g. Roman numerals)
+    """
+    text = (symbol or "").strip()
+    match = ROOT.match(text)
+    if text in NO_CHORD or not match:
+        return None
+    letter, accidentals, figure = match.groups()
+    root = (PITCH_CLASSES[letter] + _accidentals(accidentals)) % 12
+    root_name = letter + "".join("#" if c in "#♯s" else "b" for c in accidentals)
+
+    bass = None
+    if "/" in figure:
+        figure, bass_text = figure.rsplit("/", 1)
+        bass_match = ROOT.match(bass_text)
+        degree_match = DEGREE.match(bass_text)
+        if bass_match and not bass_match.group(3):
+            bass = (PITCH_CLASSES[bass_match.group(1)] + _accidentals(bass_match.group(2)) - root) % 12
+        elif degree_match:
+            bass = _degree(*degree_match.groups()[1:])
+
+    figure = figure[1:] if figure.startswith(":") else figure
+    degrees = None
+    if "(" in figure:
+        figure, _, degrees = figure.partition("(")
+        degrees = degrees.rstrip(")")
+    if figure or degrees is None or not all(DEGREE.match(degree.strip()) for degree in degrees.split(",")):
+        intervals, rest = _shorthand(figure)
+        _apply_modifiers(intervals, rest)
+    else:
+        # Harte interval list without shorthand, e.g. C:(3,5)
+        intervals = {0}
+    for degree in (degrees or "").split(","):
+        degree_match = DEGREE.match(degree.strip())
+        if not degree_match:
+            _apply_extension(intervals, degree.strip())
+            continue
+        omit, accidentals, number = degree_match.groups()
+        interval = _degree(accidentals, number)
+        if interval is not None:
+            (intervals.discard if omit else intervals.add)(interval)
+    intervals.discard(None)
+    if bass is not None:
+        intervals.add(bass)
+    return ChordSymbol(root_name, root, tuple(sorted(intervals)), bass)
+
+
+@functools.lru_cache(maxsize=None)
+def chord_pitch_classes(symbol):
+    """
+    Pitch classes of a chord symbol
+
+    Returns:
+        sorted tuple of pitch classes, empty for no-chord symbols and for
+        text that is not a chord
+    """
+    parsed = parse_chord_symbol(symbol)
+    if parsed is None:
+        return ()
+    return tuple(sorted({(parsed.root + interval) % 12 for interval in parsed.intervals}))
+
+
+def chord_symbol(chord):
+    """Chord symbol of a JCRD chord given as text or as an object, or None"""
+    if isinstance(chord, dict):
+        chord = chord.get("chord") or chord.get("name") or chord.get("symbol")
+    return chord if isinstance(chord, str) else None
+
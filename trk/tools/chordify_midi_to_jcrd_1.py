@@ -52,25 +52,6 @@ def extract_pdf_metadata(pdf_path):
     return meta, warnings
 
 
-def detect_chord(notes):
-    pitch_classes = sorted(set(n.pitch % 12 for n in notes))
-    if not pitch_classes:
-        return "N.C."
-    triads = {
-        (0, 4, 7): "C",
-        (2, 5, 9): "D",
-        (4, 7, 11): "E",
-        (5, 9, 0): "F",
-        (7, 11, 2): "G",
-        (9, 0, 4): "A",
-        (11, 2, 5): "B",
-    }
-    for triad, name in triads.items():
-        if all(pc in pitch_classes for pc in triad):
-            return name
-    return "+".join(str(pc) for pc in pitch_classes)
-
-
 def parse_midi_chords(pm):
     """Parse MIDI file into sections with improved section detection"""
     from improved_section_detection import detect_sections
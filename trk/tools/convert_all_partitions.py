@@ -4,12 +4,14 @@ convert_all_partitions.py - Convert all ChoCo dataset partitions to JCRD format
 """
 
 import os
-import subprocess
+import glob
 import argparse
 import time
 from datetime import datetime
 import sys
 
+import batch_conversion_engine as engine
+
 def main():
     parser = argparse.ArgumentParser(description="Convert all ChoCo dataset partitions to JCRD format")
     parser.add_argument("--input-root", default="../datasets/choco/choco-main/partitions", 
@@ -22,6 +24,9 @@ def main():
                         help="Partitions to skip")
     parser.add_argument("--limit", type=int, default=0, 
                         help="Limit number of files per partition (0=all)")
+    parser.add_argument("--schema", default=engine.DEFAULT_SCHEMA,
+                        help="Path to JCRD schema file")
+    engine.add_engine_arguments(parser)
     args = parser.parse_args()
     
     # Ensure output directory exists
@@ -44,105 +49,68 @@ def main():
     
     print(f"Found {len(partitions)} partitions to process")
     
-    # Process each partition
+    # Collect the files of every partition, so that a single worker pool
+    # converts them all
     start_time = time.time()
-    results = {"success": 0, "failed": 0, "skipped": 0, "total": 0}
-    
+    tasks = []
+    skipped = []
     for partition in partitions:
-        partition_start = time.time()
         input_dir = os.path.join(args.input_root, partition, "choco", "jams")
         output_dir = os.path.join(args.output_root, partition)
         
         # Skip if input directory doesn't exist
         if not os.path.isdir(input_dir):
             print(f"Skipping {partition} - input directory not found: {input_dir}")
-            results["skipped"] += 1
+            skipped.append(partition)
             continue
         
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-        
-        print(f"\n{'='*80}")
-        print(f"Processing partition: {partition}")
-        print(f"Input: {input_dir}")
-        print(f"Output: {output_dir}")
-        print(f"{'='*80}\n")
-        
-        # Build and run command
-        cmd = [
-            "python", "batch_convert_choco.py",
-            "--recursive",
-            "--partition", partition,
-            "--log", f"{output_dir}_conversion.log"
-        ]
-        
+        jams_files = glob.glob(os.path.join(input_dir, "**/*.jams"), recursive=True)
         if args.limit > 0:
-            cmd.extend(["--limit", str(args.limit)])
-            
-        cmd.extend([input_dir, output_dir])
+            jams_files = jams_files[:args.limit]
+        print(f"{partition}: {len(jams_files)} JAMS files")
         
-        try:
-            print(f"Running: {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if process.returncode == 0:
-                # Extract statistics from output
-                output = process.stdout
-                print(output)
-                
-                # Try to parse results
-                success = 0
-                failed = 0
-                validation_failed = 0
-                total = 0
-                
-                for line in output.splitlines():
-                    if "Success:" in line:
-                        try:
-                            success = int(line.split("Success:")[1].strip())
-                        except:
-                            pass
-                    elif "Failed:" in line:
-                        try:
-                            failed = int(line.split("Failed:")[1].strip())
-                        except:
-                            pass
-                    elif "Validation failed:" in line:
-                        try:
-                            validation_failed = int(line.split("Validation failed:")[1].strip())
-                        except:
-                            pass
-                    elif "Total:" in line:
-                        try:
-                            total = int(line.split("Total:")[1].strip())
-                        except:
-                            pass
-                
-                results["success"] += success
-                results["failed"] += failed + validation_failed
-                results["total"] += total
-                
-                partition_time = time.time() - partition_start
-                print(f"\nPartition {partition} completed in {partition_time:.2f} seconds")
-                print(f"Success: {success}, Failed: {failed}, Validation Failed: {validation_failed}")
-            else:
-                error_msg = process.stderr
-                print(f"Error processing partition {partition}:")
-                print(error_msg)
-                results["failed"] += 1
-        except Exception as e:
-            print(f"Exception processing partition {partition}: {e}")
-            results["failed"] += 1
+        for jams_path in jams_files:
+            rel_path = os.path.relpath(jams_path, input_dir)
+            out_dir = os.path.join(output_dir, os.path.dirname(rel_path))
+            tasks.append(engine.make_task(jams_path, out_dir=out_dir, partition=partition))
+    
+    results_path = args.results or os.path.join(args.output_root, engine.RESULTS_NAME)
+    records = {partition: [] for partition in partitions}
+    for i, record in enumerate(engine.run_batch(tasks, "jams", workers=args.workers, chunk_size=args.chunk_size,
+                                                schema_path=args.schema, results_path=results_path,
+                                                resume=args.resume)):
+        records[record["partition"]].append(record)
+        if record["status"] in ("failed", "validation_failed"):
+            print(f"{record['status'].upper()}: {record['input']} | {record['error'].splitlines()[0]}")
+        if (i + 1) % 500 == 0:
+            print(f"Processed {i + 1}/{len(tasks)} files")
+    
+    # Per-partition summaries
+    failed_partitions = 0
+    results = {"success": 0, "failed": 0, "total": 0}
+    for partition in partitions:
+        if partition in skipped:
+            continue
+        summary = engine.summarize(records[partition])
+        converted = summary["success"] + summary["skipped"]
+        results["success"] += converted
+        results["failed"] += summary["failed"] + summary["validation_failed"]
+        results["total"] += summary["total"]
+        if summary["total"] and not converted:
+            failed_partitions += 1
+        print(f"\nPartition {partition}: Success: {summary['success']}, Skipped: {summary['skipped']}, "
+              f"Failed: {summary['failed']}, Validation Failed: {summary['validation_failed']}")
     
     # Print final summary
     total_time = time.time() - start_time
     print("\n" + "="*80)
     print(f"Conversion completed in {total_time:.2f} seconds ({total_time/60:.2f} minutes)")
     print(f"Total partitions: {len(partitions)}")
-    print(f"Successful partitions: {len(partitions) - results['skipped'] - results['failed']}")
-    print(f"Failed partitions: {results['failed']}")
-    print(f"Skipped partitions: {results['skipped']}")
+    print(f"Successful partitions: {len(partitions) - len(skipped) - failed_partitions}")
+    print(f"Failed partitions: {failed_partitions}")
+    print(f"Skipped partitions: {len(skipped)}")
     print(f"Total files converted: {results['success']} / {results['total']}")
+    print(f"Per-file results: {results_path}")
     print("="*80)
 
 if __name__ == "__main__":
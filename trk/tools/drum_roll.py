@@ -0,0 +1,141 @@
+"""
+Headless drum-roll rendering
+
+Builds drum rolls straight from the note arrays of drum_features (one row
+per drum pitch of interest, no full 128-pitch piano roll) and writes them
+as PNG files without matplotlib figures:
+
+- drum_roll: velocity matrix (pitches x time frames)
+- thumbnail: fixed-size RGB image of a drum roll
+- write_png: minimal PNG writer (8-bit RGB, zlib)
+- write_atlas: tiles many thumbnails into one sprite sheet plus a JSON
+  file with the position of every tile, so a browser can load all the
+  previews with a single image read
+"""
+
+import collections
+import json
+import os
+import struct
+import zlib
+
+import numpy as np
+
+THUMBNAIL_WIDTH = 256
+THUMBNAIL_ROW_HEIGHT = 4
+
+
+def drum_roll(features, pitches, fs=100):
+    """
+    Velocity of every pitch over time, like pretty_midi's get_piano_roll.
+
+    Args:
+        features: DrumFeatures of a MIDI file
+        pitches: MIDI pitches of the rows, in order
+        fs: frames per second
+
+    Returns:
+        Array (len(pitches), frames); overlapping notes add up
+    """
+    frames = max(1, int(np.ceil(features["duration"] * fs)))
+    row_of = np.full(128, -1)
+    row_of[list(pitches)] = np.arange(len(pitches))
+    rows = row_of[features.pitch]
+    keep = rows >= 0
+    rows = rows[keep]
+    start = np.clip((features.onset[keep] * fs).astype(np.int64), 0, frames - 1)
+    end = np.clip(((features.onset[keep] + features.duration[keep]) * fs).astype(np.int64), 0, frames)
+    # keep hits shorter than a frame visible
+    end = np.maximum(end, start + 1)
+    velocity = features.velocity[keep].astype(float)
+
+    # add every note to a difference array and integrate over time
+    delta = np.zeros((len(pitches), frames + 1))
+    np.add.at(delta, (rows, start), velocity)
+    np.add.at(delta, (rows, end), -velocity)
+    return np.cumsum(delta, axis=1)[:, :frames]
+
+
+def _colormap(name="viridis"):
+    import matplotlib
+    return (matplotlib.colormaps[name](np.arange(256))[:, :3] * 255).astype(np.uint8)
+
+
+def thumbnail(roll, width=THUMBNAIL_WIDTH, row_height=THUMBNAIL_ROW_HEIGHT, lut=None):
+    """
+    Render a drum roll to a fixed-size RGB image.
+
+    Time is resampled to width columns (keeping the loudest hit of every
+    column) and velocity 0-127 is mapped through a colormap; the lowest
+    pitch is at the bottom.
+
+    Returns:
+        uint8 array (rows * row_height, width, 3)
+    """
+    lut = _colormap() if lut is None else lut
+    edges = np.arange(width) * roll.shape[1] // width
+    columns = np.maximum.reduceat(roll, edges, axis=1)
+    levels = np.clip(columns / 127 * 255, 0, 255).astype(np.uint8)
+    image = lut[levels[::-1]]
+    return np.repeat(image, row_height, axis=0)
+
+
+def write_png(path, image):
+    """Write an RGB uint8 image (height, width, 3) as a PNG file."""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width, _ = image.shape
+    # every scanline starts with filter type 0 (none)
+    raw = np.hstack([np.zeros((height, 1), dtype=np.uint8), image.reshape(height, width * 3)])
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    png = b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) \
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)) + chunk(b"IEND", b"")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(png)
+    os.replace(tmp_path, path)
+
+
+def write_atlas(tiles, names, path, columns=None):
+    """
+    Write thumbnails of the same size into one sprite sheet.
+
+    Args:
+        tiles: list of RGB images of equal shape
+        names: unique name of every tile (e.g. the MIDI file path relative
+            to the library)
+        path: PNG file; the tile positions go to the same path with .json
+        columns: tiles per row, default about square
+
+    Returns:
+        Path of the JSON index: {"image", "tile_width", "tile_height",
+        "tiles": {name: [x, y]}}
+    """
+    if not tiles:
+        raise ValueError("No thumbnails to put in the atlas")
+    duplicates = sorted(name for name, count in collections.Counter(names).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate thumbnail names: {', '.join(duplicates)}")
+    tile_height, tile_width, _ = tiles[0].shape
+    columns = columns or int(np.ceil(np.sqrt(len(tiles))))
+    rows = int(np.ceil(len(tiles) / columns))
+    sheet = np.zeros((rows * tile_height, columns * tile_width, 3), dtype=np.uint8)
+    positions = {}
+    for i, (tile, name) in enumerate(zip(tiles, names)):
+        x, y = (i % columns) * tile_width, (i // columns) * tile_height
+        sheet[y:y + tile_height, x:x + tile_width] = tile
+        positions[name] = [x, y]
+    write_png(path, sheet)
+
+    index_path = os.path.splitext(path)[0] + ".json"
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "image": os.path.basename(path),
+            "tile_width": tile_width,
+            "tile_height": tile_height,
+            "tiles": positions,
+        }, f, indent=2)
+    return index_path
@@ -8,7 +8,7 @@ arguments:
 """
 
 import os
-import json
+import jcrd_io
 import argparse
 import pretty_midi
 
@@ -68,8 +68,7 @@ def main():
             continue
 
         path = os.path.join(args.directory, fname)
-        with open(path, "r") as f:
-            jcrd = json.load(f)
+        jcrd = jcrd_io.load(path)
 
         title = jcrd.get("title", os.path.splitext(fname)[0]).replace(
             " ", "_"
@@ -9,7 +9,7 @@ arguments:
 
 import os
 import sys
-import json
+import jcrd_io
 import argparse
 import pretty_midi
 import sys
@@ -84,8 +84,7 @@ def main():
         out_path = os.path.join(output_dir, output_name)
 
         try:
-            with open(args.file, "r") as f:
-                jcrd = json.load(f)
+            jcrd = jcrd_io.load(args.file)
             create_midi_from_jcrd(jcrd, out_path)
             print(f"🎹 Exported {args.file} to {out_path}")
             return 0
@@ -101,8 +100,7 @@ def main():
                 continue
 
             path = os.path.join(args.directory, fname)
-            with open(path, "r") as f:
-                jcrd = json.load(f)
+            jcrd = jcrd_io.load(path)
 
             output_name = os.path.splitext(fname)[0] + ".mid"
             out_path = os.path.join(args.output, output_name)
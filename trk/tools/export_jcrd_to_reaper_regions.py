@@ -8,7 +8,7 @@ arguments:
 """
 
 import os
-import json
+import jcrd_io
 import argparse
 
 def write_reaper_region_file(jcrd_data, out_path):
@@ -42,8 +42,7 @@ def main():
             continue
 
         path = os.path.join(args.directory, fname)
-        with open(path, "r") as f:
-            jcrd = json.load(f)
+        jcrd = jcrd_io.load(path)
 
         title = jcrd.get("title", os.path.splitext(fname)[0]).replace(" ", "_")
         out_file = os.path.join(args.output, f"{title}_regions.txt")
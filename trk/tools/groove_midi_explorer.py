@@ -14,6 +14,8 @@ It can:
 import os
 import sys
 import json
+import functools
+import concurrent.futures
 import shutil
 import argparse
 import re
@@ -23,9 +25,13 @@ import logging
 from pathlib import Path
 import pretty_midi
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from collections import defaultdict
 
+from drum_features import DEFAULT_CACHE_DIR, load_drum_features
+from drum_roll import drum_roll, thumbnail, write_atlas
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -67,6 +73,9 @@ DRUM_MAPPING = {
     53: "Ride (Cup)"
 }
 
+# Rows of the drum roll visualizations, lowest pitch first
+DRUM_ROLL_PITCHES = sorted(DRUM_MAPPING)
+
 def load_metadata_from_csv():
     """Load metadata from the info.csv file."""
     metadata_by_path = {}
@@ -117,37 +126,26 @@ def find_groove_midi_files():
     logger.info(f"Found {len(midi_files)} MIDI files in {groove_path}")
     return midi_files
 
-def analyze_midi_file(midi_path):
+def analyze_midi_file(midi_path, cache_dir=DEFAULT_CACHE_DIR):
     """Analyze a MIDI file and return statistics."""
     try:
-        midi_data = pretty_midi.PrettyMIDI(midi_path)
+        features = load_drum_features(midi_path, cache_dir)
         
-        # Extract basic information
+        # Extract basic and drum-specific information
         file_info = {
             "path": midi_path,
             "filename": os.path.basename(midi_path),
-            "duration": midi_data.get_end_time(),
-            "num_instruments": len(midi_data.instruments),
-            "time_signature_changes": len(midi_data.time_signature_changes),
-            "tempo_changes": len(midi_data.get_tempo_changes()[0]),
-            "drum_events": 0,
-            "drum_notes": defaultdict(int),
-            "beat_density": 0,
-            "unique_drums": set()
+            "duration": features["duration"],
+            "num_instruments": features["num_instruments"],
+            "time_signature_changes": features["time_signature_changes"],
+            "tempo_changes": features["tempo_changes"],
+            "tempi": features.tempi.tolist(),
+            "drum_events": features["total_notes"],
+            "drum_notes": features["note_counts"],
+            "beat_density": features["density"],
+            "unique_drums": list(features["note_counts"])
         }
         
-        # Extract drum-specific information
-        for instrument in midi_data.instruments:
-            if instrument.is_drum:
-                file_info["drum_events"] += len(instrument.notes)
-                for note in instrument.notes:
-                    file_info["drum_notes"][note.pitch] += 1
-                    file_info["unique_drums"].add(note.pitch)
-        
-        file_info["unique_drums"] = list(file_info["unique_drums"])
-        if file_info["duration"] > 0:
-            file_info["beat_density"] = file_info["drum_events"] / file_info["duration"]
-        
         # Extract style information from filename
         filename_parts = os.path.basename(midi_path).split('_')
         if len(filename_parts) >= 2:
@@ -203,23 +201,17 @@ def extract_midi_file(midi_path, output_dir, csv_metadata=None):
     # Get tempo (prefer CSV data, then MIDI file, then filename)
     tempo = metadata.get("bpm")
     if not tempo:
-        try:
-            midi_data = pretty_midi.PrettyMIDI(midi_path)
-            # Get the first tempo change event
-            tempo_changes = midi_data.get_tempo_changes()
-            if len(tempo_changes[0]) > 0:
-                tempo = int(tempo_changes[1][0])  # Get the first tempo value
+        # Get the first tempo change event (parsed once by analyze_midi_file)
+        if info.get("tempi"):
+            tempo = int(info["tempi"][0])
+        else:
+            # Try to extract from filename
+            filename = os.path.basename(midi_path)
+            tempo_match = re.search(r'(\d+)(?:_beat|_bpm)', filename)
+            if tempo_match:
+                tempo = int(tempo_match.group(1))
             else:
-                # Try to extract from filename
-                filename = os.path.basename(midi_path)
-                tempo_match = re.search(r'(\d+)(?:_beat|_bpm)', filename)
-                if tempo_match:
-                    tempo = int(tempo_match.group(1))
-                else:
-                    tempo = 120  # Default tempo
-        except Exception as e:
-            logger.warning(f"Error getting tempo from MIDI: {e}")
-            tempo = 120  # Default tempo
+                tempo = 120  # Default tempo
     
     # Create organized directory structure based on style and tempo range
     tempo_range = "unknown_tempo"
@@ -299,6 +291,26 @@ def extract_midi_file(midi_path, output_dir, csv_metadata=None):
     
     return dest_path, file_metadata
 
+def _pattern_info(metadata):
+    """Entry of an extracted MIDI file in the master index."""
+    return {
+        "filename": metadata["filename"],
+        "path": metadata["output_path"],
+        "drummer": metadata["drummer"],
+        "tempo": metadata["tempo"],
+        "beat_type": metadata["beat_type"],
+        "time_signature": metadata["time_signature"],
+        "duration": metadata["duration"]
+    }
+
+def _write_json_atomic(data, output_path):
+    """Write a JSON file through a temporary file, so readers never see half of it."""
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, output_path)
+
 def create_master_index(metadata_list, output_path):
     """Create a master index of all extracted MIDI files."""
     # Group by style and tempo range
@@ -323,17 +335,7 @@ def create_master_index(metadata_list, output_path):
         index["styles"][style]["tempo_ranges"][tempo_range]["count"] += 1
         
         # Add pattern info
-        pattern_info = {
-            "filename": metadata["filename"],
-            "path": metadata["output_path"],
-            "drummer": metadata["drummer"],
-            "tempo": metadata["tempo"],
-            "beat_type": metadata["beat_type"],
-            "time_signature": metadata["time_signature"],
-            "duration": metadata["duration"]
-        }
-        
-        index["styles"][style]["tempo_ranges"][tempo_range]["patterns"].append(pattern_info)
+        index["styles"][style]["tempo_ranges"][tempo_range]["patterns"].append(_pattern_info(metadata))
     
     # Convert defaultdicts to regular dicts for JSON serialization
     index_dict = {
@@ -363,13 +365,57 @@ def create_master_index(metadata_list, output_path):
     logger.info(f"Created master index at {output_path} with {len(metadata_list)} patterns")
     return output_path
 
-def convert_to_jcrd(midi_path, output_dir):
-    """Convert a MIDI drum file to JCRD format."""
+def update_master_index(output_path, added=(), removed=()):
+    """
+    Update the master index in place instead of rebuilding it.
+    
+    Args:
+        output_path: index file; created if it does not exist
+        added: metadata of newly extracted files (replacing any pattern with
+            the same output path)
+        removed: output paths of patterns to drop
+    """
+    index = {"total_patterns": 0, "styles": {}}
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    
+    dropped = set(removed) | {metadata["output_path"] for metadata in added}
+    if dropped:
+        for style, style_data in list(index["styles"].items()):
+            for tempo_range, range_data in list(style_data["tempo_ranges"].items()):
+                patterns = [p for p in range_data["patterns"] if p["path"] not in dropped]
+                if len(patterns) == len(range_data["patterns"]):
+                    continue
+                style_data["count"] -= len(range_data["patterns"]) - len(patterns)
+                if patterns:
+                    range_data["patterns"] = patterns
+                    range_data["count"] = len(patterns)
+                else:
+                    del style_data["tempo_ranges"][tempo_range]
+            if not style_data["tempo_ranges"]:
+                del index["styles"][style]
+    
+    for metadata in added:
+        style_data = index["styles"].setdefault(metadata["style"], {"count": 0, "tempo_ranges": {}})
+        range_data = style_data["tempo_ranges"].setdefault(metadata["tempo_range"], {"count": 0, "patterns": []})
+        style_data["count"] += 1
+        range_data["count"] += 1
+        range_data["patterns"].append(_pattern_info(metadata))
+    
+    index["total_patterns"] = sum(style_data["count"] for style_data in index["styles"].values())
+    _write_json_atomic(index, output_path)
+    logger.info(f"Updated master index at {output_path}: {len(added)} added or changed, "
+                f"{len(set(removed))} removed, {index['total_patterns']} patterns")
+    return output_path
+
+def convert_to_jcrd(midi_path, output_dir, name=None):
+    """Convert a MIDI drum file to JCRD format (named after name, default: the file name)."""
     try:
         midi_data = pretty_midi.PrettyMIDI(midi_path)
         
         # Extract basic information
-        filename = os.path.basename(midi_path)
+        filename = name or os.path.basename(midi_path)
         filename_parts = filename.split('_')
         
         # Parse metadata from filename
@@ -468,74 +514,130 @@ def convert_to_jcrd(midi_path, output_dir):
         print(f"Error converting {midi_path} to JCRD: {e}")
         return None
 
-def visualize_midi(midi_path, output_dir=None):
-    """Create a piano roll visualization of a MIDI drum file."""
+def visualize_midi(midi_path, output_dir=None, name=None):
+    """
+    Create a drum roll visualization of a MIDI drum file.
+    
+    The roll has one row per mapped drum pitch and is built from the cached
+    note arrays. With an output directory the figure is rendered headless on
+    an Agg canvas (no pyplot figure is opened); otherwise it is shown. The
+    title and image are named after name (default: the file name).
+    """
+    name = name or os.path.basename(midi_path)
     try:
-        midi_data = pretty_midi.PrettyMIDI(midi_path)
+        features = load_drum_features(midi_path)
+        if not features["drum_tracks"]:
+            print(f"No drum tracks found in {midi_path}")
+            return False
         
-        plt.figure(figsize=(12, 8))
+        roll = drum_roll(features, DRUM_ROLL_PITCHES, fs=100)
         
-        # Only visualize drum tracks
-        for i, instrument in enumerate(midi_data.instruments):
-            if instrument.is_drum:
-                # Get a piano roll representation
-                piano_roll = instrument.get_piano_roll(fs=100)
-                
-                # Only show drum notes (between 35 and 60)
-                drum_roll = np.zeros((128, piano_roll.shape[1]))
-                for note_num in range(35, 61):
-                    if note_num in DRUM_MAPPING:
-                        if np.any(piano_roll[note_num] > 0):
-                            drum_roll[note_num] = piano_roll[note_num]
-                
-                # Plot the drum roll
-                plt.imshow(drum_roll[35:61], aspect='auto', origin='lower', 
-                          interpolation='nearest', cmap='viridis')
-                
-                # Add labels for drum notes
-                yticks = []
-                yticklabels = []
-                for note_num in range(35, 61):
-                    if note_num in DRUM_MAPPING:
-                        yticks.append(note_num - 35)
-                        yticklabels.append(f"{note_num}: {DRUM_MAPPING.get(note_num, '')}")
-                
-                plt.yticks(yticks, yticklabels)
-                
-                # Add time markers
-                times = np.arange(0, midi_data.get_end_time(), 1.0)
-                plt.xticks(times * 100, [f"{t:.1f}" for t in times])
-                
-                plt.xlabel("Time (s)")
-                plt.title(f"Drum Pattern: {os.path.basename(midi_path)}")
-                
-                if output_dir:
-                    os.makedirs(output_dir, exist_ok=True)
-                    output_path = os.path.join(output_dir, f"{os.path.splitext(os.path.basename(midi_path))[0]}_visualization.png")
-                    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-                    print(f"Saved visualization to {output_path}")
-                else:
-                    plt.show()
-                
-                plt.close()
-                return True
+        if output_dir:
+            figure = Figure(figsize=(12, 8))
+            FigureCanvasAgg(figure)
+        else:
+            import matplotlib.pyplot as plt
+            figure = plt.figure(figsize=(12, 8))
+        # Fixed margins instead of bbox_inches='tight', which draws the figure twice
+        figure.subplots_adjust(left=0.17, right=0.98, bottom=0.07, top=0.95)
+        ax = figure.add_subplot()
+        ax.imshow(roll, aspect='auto', origin='lower', interpolation='nearest', cmap='viridis')
         
-        print(f"No drum tracks found in {midi_path}")
-        return False
+        # Add labels for drum notes
+        ax.set_yticks(range(len(DRUM_ROLL_PITCHES)))
+        ax.set_yticklabels([f"{pitch}: {DRUM_MAPPING[pitch]}" for pitch in DRUM_ROLL_PITCHES])
+        
+        # Add time markers
+        times = np.arange(0, features["duration"], 1.0)
+        ax.set_xticks(times * 100)
+        ax.set_xticklabels([f"{t:.1f}" for t in times])
+        
+        ax.set_xlabel("Time (s)")
+        ax.set_title(f"Drum Pattern: {name}")
+        
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_path = os.path.join(output_dir, f"{os.path.splitext(name)[0]}_visualization.png")
+            figure.savefig(output_path, dpi=150)
+            print(f"Saved visualization to {output_path}")
+        else:
+            plt.show()
+            plt.close(figure)
+        return True
     
     except Exception as e:
         print(f"Error visualizing {midi_path}: {e}")
         return False
 
-def prepare_for_reaper(midi_path, output_dir):
+def _map_files(function, midi_files, jobs, chunk_size=16):
+    """Apply a per-file function, on a process pool unless jobs is 1."""
+    if jobs == 1 or len(midi_files) <= 1:
+        return list(map(function, midi_files))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(function, midi_files, chunksize=chunk_size))
+
+def create_visualizations(midi_files, output_dir, jobs=None):
+    """
+    Render the drum roll of many MIDI files headless on a process pool.
+    
+    Args:
+        jobs: number of worker processes (None = CPU count, 1 = no pool)
+    
+    Returns:
+        Number of visualizations written
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    return sum(_map_files(functools.partial(visualize_midi, output_dir=output_dir), midi_files, jobs))
+
+def render_thumbnail(midi_path):
+    """Small drum roll image of a MIDI file, or None if it has no drums."""
+    try:
+        features = load_drum_features(midi_path)
+    except Exception as e:
+        logger.error(f"Error rendering {midi_path}: {e}")
+        return None
+    if not features["drum_tracks"]:
+        return None
+    return thumbnail(drum_roll(features, DRUM_ROLL_PITCHES, fs=100))
+
+def create_thumbnail_atlas(midi_files, atlas_path, jobs=None, names=None):
+    """
+    Render drum roll thumbnails of many MIDI files into one sprite sheet.
+    
+    The atlas PNG comes with a JSON file of the same name giving the tile
+    size and the position of every file's thumbnail, so the REAPER browser
+    can load all the previews with one image read. Tiles are keyed by path
+    relative to the common folder of the files, so files with the same name
+    in different folders keep their own tiles.
+    
+    Args:
+        names: paths the tiles are named after, one per MIDI file
+            (default: the MIDI files themselves)
+    
+    Returns:
+        Path of the JSON index, or None if no file could be rendered
+    """
+    images = _map_files(render_thumbnail, midi_files, jobs)
+    names = [os.path.abspath(name) for name in names or midi_files]
+    root = os.path.commonpath([os.path.dirname(name) for name in names]) if names else ""
+    rendered = [(os.path.relpath(name, root).replace(os.sep, "/"), image)
+                for name, image in zip(names, images) if image is not None]
+    if not rendered:
+        logger.warning("No drum patterns to put in the thumbnail atlas")
+        return None
+    index_path = write_atlas([image for _, image in rendered], [name for name, _ in rendered], atlas_path)
+    logger.info(f"Wrote {len(rendered)} thumbnails to {atlas_path} ({index_path})")
+    return index_path
+
+def prepare_for_reaper(midi_path, output_dir, name=None):
     """
     Prepare a MIDI file for use in REAPER.
     This includes:
-    1. Copying the file to the output directory
+    1. Copying the file to the output directory (as name, default: its file name)
     2. Creating a .RPP (REAPER project file) template
     3. Adding markers for different sections/patterns
     """
-    filename = os.path.basename(midi_path)
+    filename = name or os.path.basename(midi_path)
     base_name = os.path.splitext(filename)[0]
     output_midi_path = os.path.join(output_dir, filename)
     
@@ -558,17 +660,12 @@ def prepare_for_reaper(midi_path, output_dir):
     style = info.get("style", "unknown")
     duration = info.get("duration", 0)
     
-    # Try to get tempo from MIDI file itself if available
-    try:
-        midi_data = pretty_midi.PrettyMIDI(midi_path)
-        tempos = midi_data.get_tempo_changes()
-        if tempos[0].size > 0:
-            # Use last tempo in file if multiple tempos exist
-            midi_tempo = int(tempos[1][-1])
-            if 40 <= midi_tempo <= 240:  # Reasonable tempo range
-                tempo = midi_tempo
-    except Exception as e:
-        print(f"Warning: Could not read tempo from MIDI: {e}")
+    # Use the tempo of the MIDI file itself if available
+    if info.get("tempi"):
+        # Use last tempo in file if multiple tempos exist
+        midi_tempo = int(info["tempi"][-1])
+        if 40 <= midi_tempo <= 240:  # Reasonable tempo range
+            tempo = midi_tempo
     
     # Create a simple REAPER project file
     rpp_path = os.path.join(output_dir, f"{base_name}.rpp")
@@ -606,6 +703,175 @@ def prepare_for_reaper(midi_path, output_dir):
     
     return output_midi_path, rpp_path
 
+PIPELINE_STAGES = ("extract", "convert", "visualize", "prepare")
+MANIFEST_NAME = "pipeline_manifest.json"
+
+def load_manifest(manifest_path):
+    """
+    Load the pipeline manifest.
+    
+    Returns:
+        Dict of source MIDI path -> {"size", "mtime_ns", "outputs", "metadata"}
+        where outputs maps every completed stage to its output path(s)
+    """
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get("files", {})
+
+def _stage_dirs(output_dir):
+    return {
+        "extract": output_dir,
+        "convert": os.path.join(JCRD_OUTPUT_DIR, "jcrd"),
+        "visualize": os.path.join(output_dir, "visualizations"),
+        "prepare": os.path.join(output_dir, "reaper"),
+    }
+
+def _outputs_exist(outputs):
+    paths = [p for value in outputs.values() for p in (value if isinstance(value, list) else [value])]
+    return all(os.path.exists(p) for p in paths)
+
+def _pipeline_file(task, output_dir):
+    """
+    Run the pending stages of one MIDI file, for the pipeline process pool.
+    
+    Args:
+        task: (midi_path, stages to run, CSV metadata of the file, outputs of
+            the stages already done)
+        output_dir: output directory for extracted MIDI files
+    
+    Returns:
+        (midi_path, outputs, metadata, error)
+    """
+    midi_path, stages, csv_info, outputs = task
+    outputs = dict(outputs)
+    metadata = None
+    dirs = _stage_dirs(output_dir)
+    try:
+        if "extract" in stages:
+            outputs["extract"], metadata = extract_midi_file(midi_path, output_dir, {midi_path: csv_info})
+        # Later stages read the source, whose drum features are cached, and
+        # name their outputs after the extracted copy if there is one
+        name = os.path.basename(outputs.get("extract", midi_path))
+        if "convert" in stages:
+            jcrd_path = convert_to_jcrd(midi_path, dirs["convert"], name)
+            if not jcrd_path:
+                return midi_path, outputs, metadata, "JCRD conversion failed"
+            outputs["convert"] = jcrd_path
+        if "visualize" in stages:
+            if not visualize_midi(midi_path, dirs["visualize"], name):
+                return midi_path, outputs, metadata, "visualization failed"
+            outputs["visualize"] = os.path.join(
+                dirs["visualize"], f"{os.path.splitext(name)[0]}_visualization.png")
+        if "prepare" in stages:
+            outputs["prepare"] = list(prepare_for_reaper(midi_path, dirs["prepare"], name))
+    except Exception as e:
+        return midi_path, outputs, metadata, str(e)
+    return midi_path, outputs, metadata, None
+
+def run_pipeline(midi_files, stages, output_dir, csv_metadata=None, jobs=None,
+                 manifest_path=None, index_path=None, chunk_size=16):
+    """
+    Run the requested stages file by file on a process pool, incrementally.
+    
+    A file is skipped when its size and modification time match the manifest
+    and the outputs of every requested stage exist; otherwise only its
+    missing stages run (all of them if the source changed). Files that
+    failed are recorded in the manifest with their error, and are only
+    retried once the source changes. Sources that were deleted are dropped
+    from the manifest and the index.
+    
+    Args:
+        midi_files: source MIDI files
+        stages: subset of PIPELINE_STAGES
+        output_dir: output directory for extracted MIDI files
+        csv_metadata: dataset metadata by source path
+        jobs: number of worker processes (None = CPU count, 1 = no pool)
+        manifest_path: manifest file (default: MANIFEST_NAME in output_dir)
+        index_path: master index to update with extracted files, or None
+        chunk_size: number of files sent to a worker at once
+    
+    Returns:
+        (processed, skipped, errors): counts of processed and up-to-date
+        files, and dict of source path -> error
+    """
+    csv_metadata = csv_metadata or {}
+    manifest_path = manifest_path or os.path.join(output_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+    
+    tasks = []
+    removed_outputs = []
+    failed = 0
+    for midi_path in midi_files:
+        stat = os.stat(midi_path)
+        entry = manifest.get(midi_path)
+        if entry and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns) \
+                and _outputs_exist(entry["outputs"]):
+            if entry.get("error"):
+                failed += 1
+                pending = []
+            else:
+                pending = [stage for stage in stages if stage not in entry["outputs"]]
+            outputs = entry["outputs"]
+        else:
+            if entry and entry.get("metadata"):
+                removed_outputs.append(entry["metadata"]["output_path"])
+            pending = list(stages)
+            outputs = {}
+        if pending:
+            tasks.append((midi_path, pending, csv_metadata.get(midi_path, {}), outputs))
+    
+    # Forget sources that no longer exist
+    for midi_path in [path for path in manifest if not os.path.exists(path)]:
+        entry = manifest.pop(midi_path)
+        if entry.get("metadata"):
+            removed_outputs.append(entry["metadata"]["output_path"])
+    
+    skipped = len(midi_files) - len(tasks)
+    logger.info(f"{skipped} files up to date ({failed} failed before), {len(tasks)} to process")
+    
+    for directory in _stage_dirs(output_dir).values():
+        os.makedirs(directory, exist_ok=True)
+    
+    process = functools.partial(_pipeline_file, output_dir=output_dir)
+    if jobs == 1 or len(tasks) <= 1:
+        results = map(process, tasks)
+        executor = None
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+        results = executor.map(process, tasks, chunksize=chunk_size)
+    
+    added = []
+    errors = {}
+    try:
+        for done, (midi_path, outputs, metadata, error) in enumerate(results, 1):
+            if metadata:
+                added.append(metadata)
+            if error:
+                errors[midi_path] = error
+                logger.error(f"Error processing {midi_path}: {error}")
+            # Failed files are kept too, so the manifest lists everything
+            # in the index and they are not retried until the source changes
+            stat = os.stat(midi_path)
+            previous = manifest.get(midi_path, {})
+            manifest[midi_path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "outputs": outputs,
+                "metadata": metadata or previous.get("metadata"),
+                "error": error,
+            }
+            if done % 1000 == 0:
+                logger.info(f"Processed {done}/{len(tasks)} files")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    _write_json_atomic({"files": manifest}, manifest_path)
+    if index_path and (added or removed_outputs):
+        update_master_index(index_path, added, removed_outputs)
+    return len(tasks), skipped, errors
+
 def main():
     parser = argparse.ArgumentParser(description="Groove MIDI Dataset Explorer and Extractor")
     parser.add_argument("--list", action="store_true", help="List all available MIDI files")
@@ -623,6 +889,14 @@ def main():
     parser.add_argument("--convert", action="store_true", help="Convert MIDI files to JCRD format (optional)")
     parser.add_argument("--prepare", action="store_true", help="Prepare MIDI files for use in REAPER (optional, creates RPP files)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Run the requested stages file by file on N worker processes, skipping "
+                             "files whose outputs are up to date (0 = one per CPU)")
+    parser.add_argument("--atlas", default=None,
+                        help="Also write drum roll thumbnails of all processed files into this PNG "
+                             "sprite sheet (tile positions in a .json file next to it)")
+    parser.add_argument("--manifest", default=None,
+                        help=f"Pipeline manifest path (default: {MANIFEST_NAME} in the output directory)")
     
     args = parser.parse_args()
     
@@ -665,6 +939,22 @@ def main():
             print(f"{i+1}. {os.path.basename(file)} - Style: {style}, "
                   f"Tempo: {tempo}, Duration: {duration:.2f}s")
     
+    if args.jobs is not None:
+        stages = [stage for stage in PIPELINE_STAGES if getattr(args, stage)]
+        if not stages:
+            logger.error("No stage requested, use --extract, --convert, --visualize or --prepare")
+            return 1
+        processed, skipped, errors = run_pipeline(
+            filtered_files, stages, args.output, csv_metadata, args.jobs or None, args.manifest,
+            args.index_path if args.create_index else None)
+        if args.atlas:
+            manifest = load_manifest(args.manifest or os.path.join(args.output, MANIFEST_NAME))
+            create_thumbnail_atlas(
+                filtered_files, args.atlas, args.jobs or None,
+                [manifest.get(f, {}).get("outputs", {}).get("extract", f) for f in filtered_files])
+        logger.info(f"\nDone! {processed} processed, {skipped} up to date, {len(errors)} errors")
+        return 0
+    
     # Extract files and collect metadata
     extracted_metadata = []
     if args.extract:
@@ -701,8 +991,12 @@ def main():
         # If we've extracted files, use those paths, otherwise use original files
         files_to_visualize = [m["output_path"] for m in extracted_metadata] if extracted_metadata else filtered_files
         
-        for file in files_to_visualize:
-            visualize_midi(file, viz_dir)
+        create_visualizations(files_to_visualize, viz_dir, 1)
+    
+    # Thumbnail atlas for the REAPER browser
+    if args.atlas:
+        files_to_render = [m["output_path"] for m in extracted_metadata] if extracted_metadata else filtered_files
+        create_thumbnail_atlas(files_to_render, args.atlas, 1)
     
     # Prepare for REAPER if requested
     if args.prepare:
@@ -3,14 +3,65 @@ Improved section detection for JCRD format using patterns found in McGill Billbo
 - Leverages common 4/4 time patterns (4, 8, 16, 32, 64 beats)
 - Analyzes chord density for section type detection
 - Includes confidence scoring for timing boundaries
+- Follows the tempo map of the MIDI file
 """
 
+import numpy as np
+
+# detect_chord used to live here, keep it importable from this module
+from chord_recognition import beat_chroma, detect_chord, label_chroma
+
+
+def beat_grid(pm):
+    """
+    Compute the start time of every beat (quarter note) in milliseconds.
+
+    With a single tempo the grid is summed beat by beat, so beat starts are
+    bit-for-bit the times a per-beat walk through the song would visit. With
+    tempo changes each beat is placed on the tempo map.
+
+    Args:
+        pm: PrettyMIDI object
+
+    Returns:
+        Array with the start of every beat before the end of the song,
+        followed by the end of the last beat
+    """
+    change_times, tempi = pm.get_tempo_changes()
+    end_ms = pm.get_end_time() * 1000
+    if len(tempi) == 0 or np.all(tempi == tempi[0]):
+        ms_per_beat = 60000 / (tempi[0] if len(tempi) > 0 else 120)
+        edges = [0]
+        current_time = 0
+        while current_time < end_ms:
+            current_time += ms_per_beat
+            edges.append(current_time)
+        return np.array(edges, dtype=float)
+
+    change_ms = np.asarray(change_times, dtype=float) * 1000
+    change_ms[0] = 0.0
+    segment_ms_per_beat = 60000 / np.asarray(tempi, dtype=float)
+    # beat position at each tempo change
+    change_beats = np.concatenate(
+        [[0.0], np.cumsum(np.diff(change_ms) / segment_ms_per_beat[:-1])]
+    )
+    end_beat = change_beats[-1] + (end_ms - change_ms[-1]) / segment_ms_per_beat[-1]
+    beats = np.arange(int(np.ceil(end_beat)) + 1, dtype=float)
+    segment = np.searchsorted(change_beats, beats, side="right") - 1
+    return change_ms[segment] + (beats - change_beats[segment]) * segment_ms_per_beat[segment]
+
 
 def detect_sections(pm, min_beats_per_section=16):
     """
     Detect musical sections based on chord patterns and common song structure rules.
     Uses knowledge of typical 4/4 time patterns (4, 8, 16, 32, 64 beats) and chord changes.
 
+    Notes are binned into beats with a single searchsorted over the beat grid
+    and section boundaries are found in one forward pass, so the cost is
+    linear in the number of notes and chords. Section lengths are counted in
+    beats at the first tempo; with a tempo map the boundaries are placed on
+    the actual beat times.
+
     Args:
         pm: PrettyMIDI object
         min_beats_per_section: Minimum length of a section in beats (default 16)
@@ -19,36 +70,41 @@ def detect_sections(pm, min_beats_per_section=16):
         List of section dictionaries with timing and chord information
     """
     # Get tempo in BPM
-    tempo = (
-        pm.get_tempo_changes()[1][0]
-        if len(pm.get_tempo_changes()[1]) > 0
-        else 120
-    )
+    tempi = pm.get_tempo_changes()[1]
+    tempo = tempi[0] if len(tempi) > 0 else 120
     ms_per_beat = 60000 / tempo
     min_section_ms = min_beats_per_section * ms_per_beat
 
+    edges_ms = beat_grid(pm)
+    n_beats = len(edges_ms) - 1
+    if len(tempi) > 1 and not np.all(tempi == tempi[0]):
+        # Measure sections on a constant-tempo clock, report them in real time
+        clock_ms = np.arange(n_beats + 1) * ms_per_beat
+
+        def to_real_ms(clock_time):
+            return float(np.interp(clock_time, clock_ms, edges_ms))
+
+    else:
+        clock_ms = edges_ms
+
+        def to_real_ms(clock_time):
+            return clock_time
+
+    # Bin every note into the beat it starts in and label all beats at once
+    notes = [note for instrument in pm.instruments for note in instrument.notes]
+    note_starts_ms = np.array([note.start for note in notes], dtype=float) * 1000
+    note_beats = np.searchsorted(edges_ms, note_starts_ms, side="right") - 1
+    chroma, bass = beat_chroma([note.pitch for note in notes], note_beats, n_beats)
+    beat_chords = label_chroma(chroma, bass)
+
     # Extract chords and timing
     chord_list = []  # (start_ms, chord_name) tuples
-    current_time = 0
     last_chord = None
-
-    while current_time < pm.get_end_time() * 1000:  # Convert to ms
-        # Find all notes in current beat
-        notes_in_beat = []
-        for instrument in pm.instruments:
-            for note in instrument.notes:
-                note_start_ms = note.start * 1000
-                if current_time <= note_start_ms < current_time + ms_per_beat:
-                    notes_in_beat.append(note)
-
-        # Get chord name
-        chord_name = detect_chord(notes_in_beat)
+    for beat, chord_name in enumerate(beat_chords):
         if chord_name != last_chord:  # Only record chord changes
-            chord_list.append((int(current_time), chord_name))
+            chord_list.append((int(clock_ms[beat]), chord_name))
             last_chord = chord_name
 
-        current_time += ms_per_beat
-
     sections = []
     window = []
     cur_section_start = 0
@@ -81,8 +137,8 @@ def detect_sections(pm, min_beats_per_section=16):
 
         sections.append(
             {
-                "start_ms": int(start_ms),
-                "duration_ms": int(duration),
+                "start_ms": int(to_real_ms(start_ms)),
+                "duration_ms": int(to_real_ms(end_ms) - to_real_ms(start_ms)),
                 "chords": chords,
                 "sectionType": section_type,
                 "sectionFunction": get_section_function(section_type),
@@ -94,22 +150,23 @@ def detect_sections(pm, min_beats_per_section=16):
             }
         )
 
-    # Analyze chord sequence for section boundaries
+    # Analyze chord sequence for section boundaries. The next potential
+    # boundary of a later chord is never earlier, so j only moves forward.
+    j = 0
     for i, (time_ms, chord) in enumerate(chord_list):
         cur_section_chords.append(chord)
 
         # Check for section boundary conditions
         duration = time_ms - cur_section_start
         if duration >= min_section_ms:  # Minimum section length reached
-            next_boundary = None
-            for j in range(i + 1, len(chord_list)):
-                next_time = chord_list[j][0]
-                next_duration = next_time - time_ms
-                if (
-                    next_duration >= min_section_ms
-                ):  # Found next potential boundary
-                    next_boundary = next_time
-                    break
+            j = max(j, i + 1)
+            while (
+                j < len(chord_list)
+                and chord_list[j][0] - time_ms < min_section_ms
+            ):
+                j += 1
+            # Found next potential boundary
+            next_boundary = chord_list[j][0] if j < len(chord_list) else None
 
             if next_boundary:  # Valid section found
                 add_section(
@@ -137,53 +194,3 @@ def get_section_function(section_type):
         "Interlude": "Development",
     }
     return function_map.get(section_type, "Other")
-
-
-def detect_chord(notes):
-    """
-    Identify chord from a set of notes using common chord patterns
-    """
-    pitch_classes = sorted(set(n.pitch % 12 for n in notes))
-    if not pitch_classes:
-        return "N.C."  # No chord
-
-    # Define common chord shapes (as pitch class sets)
-    major_triads = {
-        (0, 4, 7): "C",
-        (1, 5, 8): "C#",
-        (2, 6, 9): "D",
-        (3, 7, 10): "D#",
-        (4, 8, 11): "E",
-        (5, 9, 0): "F",
-        (6, 10, 1): "F#",
-        (7, 11, 2): "G",
-        (8, 0, 3): "G#",
-        (9, 1, 4): "A",
-        (10, 2, 5): "A#",
-        (11, 3, 6): "B",
-    }
-    minor_triads = {
-        (0, 3, 7): "Cm",
-        (1, 4, 8): "C#m",
-        (2, 5, 9): "Dm",
-        (3, 6, 10): "D#m",
-        (4, 7, 11): "Em",
-        (5, 8, 0): "Fm",
-        (6, 9, 1): "F#m",
-        (7, 10, 2): "Gm",
-        (8, 11, 3): "G#m",
-        (9, 0, 4): "Am",
-        (10, 1, 5): "A#m",
-        (11, 2, 6): "Bm",
-    }
-
-    # Try to match with known chord shapes
-    for shape, name in major_triads.items():
-        if all(pc in pitch_classes for pc in shape):
-            return name
-    for shape, name in minor_triads.items():
-        if all(pc in pitch_classes for pc in shape):
-            return name
-
-    # If no match, return pitch classes
-    return "+".join(str(pc) for pc in pitch_classes)
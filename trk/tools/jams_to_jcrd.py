@@ -231,6 +231,137 @@ def convert_jams_to_jcrd(jams_path):
     
     return jam, jcrd
 
+def load_meta_lookup(meta_path):
+    """Load meta.csv rows keyed by their normalized jams_path"""
+    meta_lookup = {}
+    with open(meta_path, newline='', encoding='utf-8') as metaf:
+        reader = csv.DictReader(metaf)
+        for row in reader:
+            # Use jams_path as key for lookup
+            meta_lookup[os.path.normpath(row['jams_path'])] = row
+    return meta_lookup
+
+def find_meta_row(meta_lookup, input_path):
+    """Find the meta.csv row of a JAMS file, matching by path or file name"""
+    # Try to match by jams_path (normalize for Windows paths)
+    input_norm = os.path.normpath(input_path)
+    for k, v in meta_lookup.items():
+        if os.path.normpath(v['jams_path']) == input_norm or os.path.basename(v['jams_path']) == os.path.basename(input_path):
+            return v
+    return None
+
+def sanitize(s):
+    """Keep the characters of s that are safe in a file name"""
+    return ''.join(c for c in s if c.isalnum() or c in (' ', '-', '_')).rstrip()
+
+def output_path_for(jcrd, input_path, out_dir=None):
+    """Build the default 'Title_Artist.jcrd.json' output path of a JCRD"""
+    title = sanitize(jcrd.get('title', 'Unknown Title'))
+    artist = sanitize(jcrd.get('artist', 'Unknown Artist'))
+
+    # Replace spaces with underscores for better filename format
+    title = title.replace(' ', '_')
+    artist = artist.replace(' ', '_')
+
+    # Use output directory if specified, otherwise use same directory as input
+    base_dir = out_dir if out_dir else os.path.dirname(input_path)
+    return os.path.join(base_dir, f"{title}_{artist}.jcrd.json")
+
+def convert_file(input_path, output_path=None, meta_lookup=None, partition=None, out_dir=None):
+    """Convert one JAMS file, enrich it and save it as JCRD
+
+    Args:
+        input_path: path to the .jams file
+        output_path: where to save the JCRD. If None, uses output_path_for().
+        meta_lookup: rows of meta.csv, see load_meta_lookup()
+        partition: partition name (e.g., rock-corpus)
+        out_dir: directory of the default output path
+
+    Returns:
+        (output_path, jcrd) tuple
+    """
+    jam, jcrd = convert_jams_to_jcrd(input_path)
+
+    # Enrich with meta.csv if available
+    meta_row = find_meta_row(meta_lookup, input_path) if meta_lookup else None
+    if meta_row:
+        jcrd['title'] = meta_row.get('title', jcrd['title']) or jcrd['title']
+        jcrd['artist'] = meta_row.get('performers', jcrd.get('artist', 'Unknown Artist')) or jcrd.get('artist', 'Unknown Artist')
+        jcrd['release_year'] = meta_row.get('release_year', None)
+        jcrd['meta_id'] = meta_row.get('id', None)
+
+    # Add provenance
+    jcrd['source_file'] = input_path
+    jcrd['conversion_date'] = datetime.datetime.now().isoformat()
+    jcrd['partition'] = partition if partition else None
+
+    if output_path:
+        tmp_path = write_tmp(jcrd, output_path)
+        os.replace(tmp_path, output_path)
+        return output_path, jcrd
+
+    output_path = output_path_for(jcrd, input_path, out_dir)
+    # Create output directory if it doesn't exist
+    base_dir = os.path.dirname(output_path)
+    if base_dir and not os.path.exists(base_dir):
+        os.makedirs(base_dir, exist_ok=True)
+    return claim_output_path(jcrd, output_path, input_path), jcrd
+
+def write_tmp(jcrd, output_path):
+    """Write jcrd to a temporary file next to output_path and return its path"""
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            json.dump(jcrd, f, indent=2)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path
+
+def same_source(path, input_path):
+    """Check if the JCRD at path was converted from input_path"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get('source_file') == input_path
+    except (OSError, ValueError, AttributeError):
+        return False
+
+def claim_output_path(jcrd, output_path, input_path):
+    """Save jcrd under output_path, adding a numeric suffix on collisions
+
+    Default 'Title_Artist' names are not unique, and parallel batch workers
+    may pick the same one for different songs. The name is claimed with a
+    hard link, which fails if it already exists, so two processes never
+    overwrite each other's output. An existing file converted from the same
+    input is replaced instead, so re-running a batch keeps its names.
+
+    Returns:
+        the path jcrd was saved to
+    """
+    tmp_path = write_tmp(jcrd, output_path)
+    stem = output_path[:-len(".jcrd.json")]
+    candidate = output_path
+    n = 1
+    try:
+        while True:
+            try:
+                os.link(tmp_path, candidate)
+                break
+            except FileExistsError:
+                if same_source(candidate, input_path):
+                    os.replace(tmp_path, candidate)
+                    return candidate
+            n += 1
+            candidate = f"{stem}_{n}.jcrd.json"
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    if candidate != output_path:
+        print(f"Warning: {output_path} already holds another song; "
+              f"saved {input_path} as {candidate}", file=sys.stderr)
+    return candidate
+
 def main():
     parser = argparse.ArgumentParser(description="Convert a JAMS file to JCRD format, enriched with meta.csv and provenance.")
     parser.add_argument("input", help="Path to .jams file")
@@ -245,63 +376,15 @@ def main():
     meta_lookup = {}
     if args.meta:
         try:
-            with open(args.meta, newline='', encoding='utf-8') as metaf:
-                reader = csv.DictReader(metaf)
-                for row in reader:
-                    # Use jams_path as key for lookup
-                    meta_lookup[os.path.normpath(row['jams_path'])] = row
+            meta_lookup = load_meta_lookup(args.meta)
         except Exception as e:
             print(f"Warning: Could not load meta.csv: {e}")
 
     # Convert and enrich
     try:
-        jam, jcrd = convert_jams_to_jcrd(args.input)
-        
-        # Enrich with meta.csv if available
-        meta_row = None
-        if meta_lookup:
-            # Try to match by jams_path (normalize for Windows paths)
-            input_norm = os.path.normpath(args.input)
-            for k, v in meta_lookup.items():
-                if os.path.normpath(v['jams_path']) == input_norm or os.path.basename(v['jams_path']) == os.path.basename(args.input):
-                    meta_row = v
-                    break
-                    
-        if meta_row:
-            jcrd['title'] = meta_row.get('title', jcrd['title']) or jcrd['title']
-            jcrd['artist'] = meta_row.get('performers', jcrd.get('artist', 'Unknown Artist')) or jcrd.get('artist', 'Unknown Artist')
-            jcrd['release_year'] = meta_row.get('release_year', None)
-            jcrd['meta_id'] = meta_row.get('id', None)
-            
-        # Add provenance
-        jcrd['source_file'] = args.input
-        jcrd['conversion_date'] = datetime.datetime.now().isoformat()
-        jcrd['partition'] = args.partition if args.partition else None        # Determine output filename
-        output_path = args.output
-        if not output_path:
-            # Sanitize title and artist for filename
-            def sanitize(s):
-                return ''.join(c for c in s if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            
-            title = sanitize(jcrd.get('title', 'Unknown Title'))
-            artist = sanitize(jcrd.get('artist', 'Unknown Artist'))
-            
-            # Replace spaces with underscores for better filename format
-            title = title.replace(' ', '_')
-            artist = artist.replace(' ', '_')
-            
-            # Use output directory if specified, otherwise use same directory as input
-            base_dir = args.out_dir if args.out_dir else os.path.dirname(args.input)
-            
-            # Create output directory if it doesn't exist
-            if not os.path.exists(base_dir):
-                os.makedirs(base_dir, exist_ok=True)
-                
-            output_path = os.path.join(base_dir, f"{title}_{artist}.jcrd.json")
-
-        with open(output_path, "w", encoding='utf-8') as f:
-            json.dump(jcrd, f, indent=2)
-
+        output_path, jcrd = convert_file(
+            args.input, args.output, meta_lookup, args.partition, args.out_dir
+        )
         logmsg = f"SUCCESS: {args.input} -> {output_path} | title: {jcrd.get('title')} | artist: {jcrd.get('artist')} | partition: {jcrd.get('partition')}\n"
         print(f"Success! Saved JCRD to: {output_path}")
     except Exception as e:
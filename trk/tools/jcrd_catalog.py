@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+jcrd_catalog.py - Incrementally maintained SQLite catalog of the JCRD library
+
+Reads every file under database/jcrd_library once (beatles_full,
+chordonomicon, mcgill_jcrd_salami_Billboard and rock corpus all use
+slightly different layouts) and stores one row per song, section and
+chord in database/jcrd_catalog.sqlite. Later updates only re-read files
+whose size or mtime changed, and only re-index those whose md5 changed.
+
+Python API:
+
+    from jcrd_catalog import JcrdCatalog
+
+    with JcrdCatalog() as catalog:
+        catalog.update()
+        catalog.songs(key="C", tempo=(100, 130), section_type="Chorus")
+        catalog.songs(artist="beatles", corpus="beatles_full")
+        catalog.sections(song_id)
+        catalog.chords(song_id)
+
+Command line (JSON output, for the Lua tools):
+
+    python jcrd_catalog.py update
+    python jcrd_catalog.py query --key C --tempo 100 130 --section-type Chorus
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+import jcrd_io
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LIBRARY = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "database", "jcrd_library"))
+DEFAULT_CATALOG = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "database", "jcrd_catalog.sqlite"))
+JCRD_EXTENSIONS = (".json", ".jcrd")
+SCHEMA_VERSION = 3
+DEFAULT_CHUNK_SIZE = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS songs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    corpus TEXT,
+    size INTEGER,
+    mtime_ns INTEGER,
+    md5 TEXT,
+    title TEXT,
+    artist TEXT,
+    album TEXT,
+    key TEXT,
+    mode TEXT,
+    tempo REAL,
+    time_signature TEXT,
+    source TEXT,
+    duration REAL,
+    n_sections INTEGER,
+    n_chords INTEGER,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    song_id INTEGER NOT NULL REFERENCES songs(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    label TEXT,
+    section_type TEXT,
+    start REAL,
+    end REAL,
+    key TEXT,
+    mode TEXT,
+    n_chords INTEGER,
+    PRIMARY KEY (song_id, idx)
+);
+CREATE TABLE IF NOT EXISTS chords (
+    song_id INTEGER NOT NULL REFERENCES songs(id) ON DELETE CASCADE,
+    section_idx INTEGER,
+    idx INTEGER NOT NULL,
+    chord TEXT,
+    start REAL,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS songs_key ON songs (key COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS songs_tempo ON songs (tempo);
+CREATE INDEX IF NOT EXISTS songs_artist ON songs (artist COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS songs_corpus ON songs (corpus);
+CREATE INDEX IF NOT EXISTS sections_type ON sections (section_type COLLATE NOCASE, song_id);
+CREATE INDEX IF NOT EXISTS chords_song ON chords (song_id, idx);
+CREATE TABLE IF NOT EXISTS catalog_info (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+SONG_FIELDS = ["title", "artist", "album", "key", "mode", "tempo", "time_signature",
+               "source", "duration", "n_sections", "n_chords", "error"]
+SECTION_FIELDS = ["idx", "label", "section_type", "start", "end", "key", "mode", "n_chords"]
+CHORD_FIELDS = ["section_idx", "idx", "chord", "start", "duration"]
+
+
+# ---------------------------------------------------------------------------
+# Extraction: one normalized record per file, whatever its layout
+# ---------------------------------------------------------------------------
+
+def _number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _mode(value):
+    """Mode field as stored in the catalog: lowercase text or None"""
+    value = _text(value)
+    return value.lower() if value else None
+
+
+def split_key(key):
+    """Split a key string into (tonic, mode)
+
+    Accepts "C", "Key F", "A minor", "Am", "Bb:min", "B-" (music21 flat),
+    "c" (lower case minor).
+    """
+    key = _text(key)
+    if not key:
+        return None, None
+    key = re.sub(r"^key\s*[:=]?\s*", "", key, flags=re.IGNORECASE)
+    match = re.match(r"^([A-Ga-g])([#b♯♭-]?)\s*:?\s*(.*)$", key)
+    if not match:
+        return key, None
+    letter, accidental, rest = match.groups()
+    accidental = {"♯": "#", "♭": "b", "-": "b"}.get(accidental, accidental)
+    rest = rest.strip().lower()
+    if rest in ("m", "min", "minor", "aeolian"):
+        mode = "minor"
+    elif rest in ("", "maj", "major", "ionian"):
+        mode = "minor" if letter.islower() and not rest else "major"
+    else:
+        mode = rest
+    return letter.upper() + accidental, mode
+
+
+def _chord_entry(chord):
+    """Return (name, start, duration) of a chord given as text or object"""
+    if isinstance(chord, dict):
+        name = _text(chord.get("chord") or chord.get("name") or chord.get("symbol"))
+        start = _number(chord.get("start_time", chord.get("time")))
+        duration = _number(chord.get("duration"))
+        end = _number(chord.get("end_time"))
+        if duration is None and start is not None and end is not None:
+            duration = end - start
+        return name, start, duration
+    return _text(chord), None, None
+
+
+def _section_times(section):
+    """Return (start, end) of a section in seconds, or None"""
+    if "start_ms" in section:
+        start = _number(section.get("start_ms"))
+        duration = _number(section.get("duration_ms"))
+        start = start / 1000.0 if start is not None else None
+        end = start + duration / 1000.0 if start is not None and duration is not None else None
+        return start, end
+    start = _number(section.get("start_time", section.get("time", section.get("start"))))
+    end = _number(section.get("end_time", section.get("end")))
+    duration = _number(section.get("duration"))
+    if end is None and start is not None and duration is not None:
+        end = start + duration
+    return start, end
+
+
+def extract(data):
+    """Normalize a JCRD document into (song, sections, chords) rows
+
+    Returns:
+        song (dict): SONG_FIELDS values
+        sections (list): tuples of SECTION_FIELDS values
+        chords (list): tuples of CHORD_FIELDS values
+    """
+    if not isinstance(data, dict):
+        raise ValueError("JCRD document must be an object")
+    meta = data.get("metadata") if isinstance(data.get("metadata"), dict) else {}
+
+    def field(*names):
+        for source in (meta, data):
+            for name in names:
+                if source.get(name) not in (None, ""):
+                    return source[name]
+        return None
+
+    tonic, mode = split_key(field("key"))
+    song = {
+        "title": _text(field("title")),
+        "artist": _text(field("artist", "performers")),
+        "album": _text(field("album")),
+        "key": tonic,
+        "mode": _mode(field("mode")) or mode,
+        "tempo": _number(field("bpm", "tempo")),
+        "time_signature": _text(field("time_signature", "timeSignature")),
+        "source": _text(field("source", "source_format")),
+        "error": None,
+    }
+
+    sections = []
+    chords = []
+    section_keys = collections.Counter()
+    raw_sections = data.get("sections") if isinstance(data.get("sections"), list) else []
+    for i, section in enumerate(raw_sections):
+        if not isinstance(section, dict):
+            continue
+        start, end = _section_times(section)
+        section_type = _text(section.get("sectionType") or section.get("type") or section.get("name")
+                             or section.get("label") or section.get("sectionLabel"))
+        label = _text(section.get("sectionLabel") or section.get("label") or section.get("name")
+                      or section.get("id") or section_type)
+        sec_tonic, sec_mode = split_key(section.get("key"))
+        sec_mode = _mode(section.get("mode")) or sec_mode
+        if sec_tonic:
+            section_keys[(sec_tonic, sec_mode)] += 1
+        section_chords = section.get("chords") if isinstance(section.get("chords"), list) else []
+        for j, chord in enumerate(section_chords):
+            name, chord_start, duration = _chord_entry(chord)
+            chords.append((i, j, name, chord_start, duration))
+        sections.append((i, label, section_type, start, end, sec_tonic, sec_mode, len(section_chords)))
+
+    # chord lists outside sections (rock corpus layout)
+    if isinstance(data.get("chords"), list):
+        for j, chord in enumerate(data["chords"]):
+            name, chord_start, duration = _chord_entry(chord)
+            chords.append((None, j, name, chord_start, duration))
+
+    if not song["key"] and section_keys:
+        (song["key"], section_mode), _ = section_keys.most_common(1)[0]
+        song["mode"] = song["mode"] or section_mode
+
+    ends = [s[4] for s in sections if s[4] is not None]
+    ends += [c[3] + c[4] for c in chords if c[3] is not None and c[4] is not None]
+    song["duration"] = max(ends) if ends else None
+    song["n_sections"] = len(sections)
+    song["n_chords"] = len(chords)
+    return song, sections, chords
+
+
+def _read_file(path, known_md5=None):
+    """Read and extract one file, skipping the parse when its md5 is known"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    md5 = hashlib.md5(raw).hexdigest()
+    if md5 == known_md5:
+        return path, md5, None
+    try:
+        return path, md5, extract(jcrd_io.loads(raw))
+    except Exception as e:
+        song = {name: None for name in SONG_FIELDS}
+        song.update(error=f"{type(e).__name__}: {e}", n_sections=0, n_chords=0)
+        return path, md5, (song, [], [])
+
+
+def _read_chunk(jobs):
+    return [_read_file(path, known_md5) for path, known_md5 in jobs]
+
+
+def find_files(library, extensions=JCRD_EXTENSIONS):
+    """List the JCRD files of a library, sorted"""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(library):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(extensions) and not filename.startswith("."):
+                paths.append(os.path.join(dirpath, filename))
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Catalog
+# ---------------------------------------------------------------------------
+
+class JcrdCatalog:
+    """SQLite catalog of a JCRD library
+
+    Args:
+        path: SQLite file of the catalog
+        library: root of the JCRD library, its first level of directories
+            are the corpora
+    """
+
+    def __init__(self, path=DEFAULT_CATALOG, library=DEFAULT_LIBRARY):
+        self.path = path
+        self.library = os.path.abspath(library)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self.db.executescript("DROP TABLE IF EXISTS chords; DROP TABLE IF EXISTS sections; "
+                                  "DROP TABLE IF EXISTS songs; DROP TABLE IF EXISTS catalog_info;")
+        self.db.executescript(SCHEMA)
+        self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    # -- maintenance --------------------------------------------------------
+
+    def update(self, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, verbose=False):
+        """Bring the catalog up to date with the library
+
+        Files with the same size and mtime as in the catalog are not read.
+        Changed files are hashed and only re-indexed if their md5 changed.
+
+        Args:
+            workers: number of worker processes used to read files (None =
+                cpu count, 0 = read in this process)
+            chunk_size: number of files sent to a worker at once
+            verbose: print progress
+
+        Returns:
+            dict: number of files added, updated, touched (new mtime, same
+            content), unchanged and removed, and the elapsed seconds
+        """
+        start = time.perf_counter()
+        known = {row["path"]: row for row in self.db.execute("SELECT id, path, size, mtime_ns, md5 FROM songs")}
+        counts = {"added": 0, "updated": 0, "touched": 0, "unchanged": 0, "removed": 0}
+
+        jobs = []
+        stats = {}
+        seen = set()
+        for path in find_files(self.library):
+            rel_path = os.path.relpath(path, self.library).replace(os.sep, "/")
+            seen.add(rel_path)
+            stat = os.stat(path)
+            stats[path] = (rel_path, stat.st_size, stat.st_mtime_ns)
+            row = known.get(rel_path)
+            if row is not None and (row["size"], row["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                counts["unchanged"] += 1
+            else:
+                jobs.append((path, row["md5"] if row is not None else None))
+
+        removed = [row["id"] for rel_path, row in known.items() if rel_path not in seen]
+        with self.db:
+            self.db.executemany("DELETE FROM songs WHERE id = ?", [(i,) for i in removed])
+        counts["removed"] = len(removed)
+
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        executor = None
+        if workers == 0 or len(chunks) <= 1:
+            results = (_read_chunk(chunk) for chunk in chunks)
+        else:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(_read_chunk, chunks)
+        try:
+            for records in results:
+                with self.db:
+                    for path, md5, extracted in records:
+                        rel_path, size, mtime_ns = stats[path]
+                        row = known.get(rel_path)
+                        if extracted is None:
+                            self.db.execute("UPDATE songs SET size = ?, mtime_ns = ? WHERE id = ?",
+                                            (size, mtime_ns, row["id"]))
+                            counts["touched"] += 1
+                            continue
+                        self._store(rel_path, size, mtime_ns, md5, *extracted, song_id=row["id"] if row else None)
+                        counts["updated" if row else "added"] += 1
+                if verbose:
+                    print(f"{counts['added'] + counts['updated'] + counts['touched']}/{len(jobs)} files read")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO catalog_info VALUES ('library', ?)", (self.library,))
+            self.db.execute("INSERT OR REPLACE INTO catalog_info VALUES ('updated', ?)", (time.time(),))
+        if counts["removed"] or counts["added"] or counts["updated"]:
+            self.db.execute("ANALYZE")
+        counts["seconds"] = time.perf_counter() - start
+        return counts
+
+    def _store(self, rel_path, size, mtime_ns, md5, song, sections, chords, song_id=None):
+        corpus = rel_path.split("/", 1)[0] if "/" in rel_path else ""
+        values = [rel_path, corpus, size, mtime_ns, md5] + [song[name] for name in SONG_FIELDS]
+        if song_id is not None:
+            self.db.execute("DELETE FROM sections WHERE song_id = ?", (song_id,))
+            self.db.execute("DELETE FROM chords WHERE song_id = ?", (song_id,))
+            self.db.execute(
+                "UPDATE songs SET path = ?, corpus = ?, size = ?, mtime_ns = ?, md5 = ?, "
+                + ", ".join(f"{name} = ?" for name in SONG_FIELDS) + " WHERE id = ?",
+                values + [song_id])
+        else:
+            song_id = self.db.execute(
+                f"INSERT INTO songs (path, corpus, size, mtime_ns, md5, {', '.join(SONG_FIELDS)}) "
+                f"VALUES ({', '.join('?' * len(values))})", values).lastrowid
+        self.db.executemany(
+            f"INSERT INTO sections (song_id, {', '.join(SECTION_FIELDS)}) VALUES (?{', ?' * len(SECTION_FIELDS)})",
+            [(song_id,) + section for section in sections])
+        self.db.executemany(
+            f"INSERT INTO chords (song_id, {', '.join(CHORD_FIELDS)}) VALUES (?{', ?' * len(CHORD_FIELDS)})",
+            [(song_id,) + chord for chord in chords])
+
+    # -- queries ------------------------------------------------------------
+
+    def songs(self, key=None, mode=None, tempo=None, section_type=None, artist=None, title=None,
+              corpus=None, limit=None):
+        """Find songs matching all the given filters
+
+        Args:
+            key: tonic, e.g. "C" or "F#" (case-insensitive). A full key such
+                as "A minor" also sets mode.
+            mode: "major" or "minor"
+            tempo: (min, max) tempo range in bpm, either bound may be None
+            section_type: songs with at least one section of this type
+                (case-insensitive, e.g. "Chorus")
+            artist: case-insensitive substring of the artist
+            title: case-insensitive substring of the title
+            corpus: first-level directory of the library, e.g. "beatles_full"
+            limit: maximum number of songs
+
+        Returns:
+            list of dicts with the song columns, ordered by artist and title
+        """
+        where, params = [], []
+        if key:
+            tonic, key_mode = split_key(key)
+            where.append("key = ? COLLATE NOCASE")
+            params.append(tonic)
+            if key_mode and key.strip() != tonic and not mode:
+                mode = key_mode
+        if mode:
+            where.append("mode = ?")
+            params.append(mode.lower())
+        if tempo:
+            low, high = tempo
+            if low is not None:
+                where.append("tempo >= ?")
+                params.append(low)
+            if high is not None:
+                where.append("tempo <= ?")
+                params.append(high)
+        if section_type:
+            where.append("id IN (SELECT song_id FROM sections WHERE section_type = ? COLLATE NOCASE)")
+            params.append(section_type)
+        if artist:
+            where.append("artist LIKE ?")
+            params.append(f"%{artist}%")
+        if title:
+            where.append("title LIKE ?")
+            params.append(f"%{title}%")
+        if corpus:
+            where.append("corpus = ?")
+            params.append(corpus)
+        query = "SELECT * FROM songs"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY artist COLLATE NOCASE, title COLLATE NOCASE"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        return [dict(row) for row in self.db.execute(query, params)]
+
+    def song(self, path):
+        """Get a song by its path relative to the library, or None"""
+        row = self.db.execute("SELECT * FROM songs WHERE path = ?", (path.replace(os.sep, "/"),)).fetchone()
+        return dict(row) if row else None
+
+    def sections(self, song_id):
+        """Get the sections of a song, in order"""
+        return [dict(row) for row in self.db.execute(
+            "SELECT * FROM sections WHERE song_id = ? ORDER BY idx", (song_id,))]
+
+    def chords(self, song_id):
+        """Get the chords of a song, in order"""
+        return [dict(row) for row in self.db.execute(
+            "SELECT * FROM chords WHERE song_id = ? ORDER BY section_idx IS NULL, section_idx, idx", (song_id,))]
+
+    def facets(self, column):
+        """Count songs per value of a column (key, mode, corpus, artist, ...)"""
+        if column not in ("key", "mode", "corpus", "artist", "album", "time_signature", "source"):
+            raise ValueError(f"Cannot count by {column}")
+        return {row[0]: row[1] for row in self.db.execute(
+            f"SELECT {column}, COUNT(*) FROM songs GROUP BY {column} ORDER BY COUNT(*) DESC")}
+
+    def section_types(self):
+        """Count sections per section type"""
+        return {row[0]: row[1] for row in self.db.execute(
+            "SELECT section_type, COUNT(*) FROM sections GROUP BY section_type ORDER BY COUNT(*) DESC")}
+
+    def stats(self):
+        """Count songs, sections, chords and unreadable files"""
+        row = self.db.execute(
+            "SELECT COUNT(*), TOTAL(n_sections), TOTAL(n_chords), COUNT(error) FROM songs").fetchone()
+        return {"songs": row[0], "sections": int(row[1]), "chords": int(row[2]), "errors": row[3]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain and query the JCRD library catalog")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="SQLite catalog file")
+    parser.add_argument("--library", default=DEFAULT_LIBRARY, help="JCRD library root")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    update = subparsers.add_parser("update", help="Index new and changed files")
+    update.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count, 0 = no pool)")
+
+    query = subparsers.add_parser("query", help="Find songs, printed as JSON")
+    query.add_argument("--key")
+    query.add_argument("--mode", choices=["major", "minor"])
+    query.add_argument("--tempo", nargs=2, type=float, metavar=("MIN", "MAX"))
+    query.add_argument("--section-type")
+    query.add_argument("--artist")
+    query.add_argument("--title")
+    query.add_argument("--corpus")
+    query.add_argument("--limit", type=int)
+    query.add_argument("--sections", action="store_true", help="Include the sections of each song")
+
+    subparsers.add_parser("stats", help="Print catalog statistics as JSON")
+    args = parser.parse_args()
+
+    with JcrdCatalog(args.catalog, args.library) as catalog:
+        if args.command == "update":
+            counts = catalog.update(workers=args.workers)
+            print(json.dumps(counts))
+        elif args.command == "query":
+            songs = catalog.songs(key=args.key, mode=args.mode, tempo=args.tempo,
+                                  section_type=args.section_type, artist=args.artist,
+                                  title=args.title, corpus=args.corpus, limit=args.limit)
+            if args.sections:
+                for song in songs:
+                    song["sections"] = catalog.sections(song["id"])
+            json.dump(songs, sys.stdout, indent=2)
+            print()
+        else:
+            stats = catalog.stats()
+            stats["corpora"] = catalog.facets("corpus")
+            print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+jcrd_io.py - Shared reading and writing of JCRD files
+
+Every tool that loads or saves JCRD documents goes through load() and
+dump() here instead of json.load / json.dump(..., indent=2):
+
+- parsing and serializing use orjson when it is installed (several times
+  faster than the json module), the json module otherwise
+- dump() writes atomically (temp file + rename), so an interrupted run
+  never leaves a truncated file, and skips the write when the file
+  already holds the same bytes, so library-wide passes only touch the
+  files they change
+- dump() keeps the layout of the file it replaces: indented files stay
+  indented, compact (minified) files stay compact. A library converted
+  once with "jcrd_io.py compact" stays compact whatever tool rewrites it.
+
+Besides .json/.jcrd files, load() reads MessagePack documents (.msgpack,
+needs the msgpack package) and gzipped JSON (.json.gz). For moving or
+archiving whole libraries, pack() stores many documents in one gzipped
+JSON Lines shard, and iter_shard() reads them back. Packed documents
+(MessagePack and shards) drop section "rawChords" that merely repeat
+"chords", as chordonomicon files do; unpacking restores them.
+
+Usage:
+    python jcrd_io.py compact ../database/jcrd_library --recursive
+    python jcrd_io.py indent ../database/jcrd_library --recursive
+    python jcrd_io.py pack ../database/jcrd_library library.jsonl.gz --recursive
+    python jcrd_io.py unpack library.jsonl.gz restored_library/
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JCRD_EXTENSIONS = (".json", ".jcrd")
+MSGPACK_EXTENSIONS = (".msgpack", ".jcrdb")
+GZIP_EXTENSION = ".gz"
+
+# value of a packed section "rawChords" that equals its "chords"
+SAME_AS_CHORDS = True
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def loads(raw):
+    """Parse JSON bytes or text
+
+    orjson rejects NaN and Infinity, which the json module writes and
+    reads, so documents orjson cannot parse are retried with the json
+    module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _orjson_floats(data):
+    """
+    True if orjson writes every float of a document like the json module
+
+    The json module writes floats as repr() does: exponent notation below
+    1e-4 and from 1e16 on (1e-05, 1e+16), NaN and Infinity as such. orjson
+    writes 0.00001, 1e16 and null instead.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+        elif kind is float and value != 0.0 and not 1e-4 <= abs(value) < 1e16:
+            return False
+    return True
+
+
+def dumps(data, compact=False):
+    """
+    Serialize a document to JSON bytes, indented by 2 spaces unless compact
+
+    The output is byte-for-byte what json.dump(data, f, indent=2) wrote,
+    non-ASCII characters escaped, so existing files compare equal.
+    orjson differs from the json module for non-ASCII characters (written
+    unescaped), very small, very large and non-finite floats, and does not
+    serialize everything the json module does (e.g. float subclasses);
+    those documents go through the json module.
+    """
+    if orjson is not None and _orjson_floats(data):
+        options = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+        try:
+            payload = orjson.dumps(data, option=options)
+        except TypeError:
+            payload = None
+        if payload is not None and payload.isascii():
+            return payload
+    if compact:
+        return json.dumps(data, separators=(",", ":")).encode("ascii")
+    return json.dumps(data, indent=2).encode("ascii")
+
+
+def is_compact(raw):
+    """True if serialized JSON is minified rather than indented"""
+    return bool(raw) and raw[:2] not in (b"{\n", b"[\n")
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+def load(path):
+    """
+    Load a JCRD document: JSON (.json, .jcrd), gzipped JSON (.gz) or
+    MessagePack (.msgpack, .jcrdb)
+
+    Raises OSError when the file cannot be read and ValueError when it is
+    not a valid document, like json.load.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(MSGPACK_EXTENSIONS):
+        return unpack_document(_msgpack().unpackb(raw))
+    if path.endswith(GZIP_EXTENSION):
+        raw = gzip.decompress(raw)
+    return loads(raw)
+
+
+def write_bytes(path, payload):
+    """Write bytes atomically (temp file + rename)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def dump(data, path, compact=None):
+    """
+    Save a JCRD document atomically, in the format of the file extension
+
+    Args:
+        compact: minified instead of indented JSON; None keeps the layout
+            of the existing file (indented for new files)
+
+    Returns:
+        True if the file was written, False if it already held the same
+        content
+    """
+    path = os.fspath(path)
+    gzipped = path.endswith(GZIP_EXTENSION)
+    if path.endswith(MSGPACK_EXTENSIONS):
+        payload = _msgpack().packb(pack_document(data))
+    else:
+        if compact is None:
+            compact = _existing_is_compact(path, gzipped)
+        payload = dumps(data, compact)
+        if gzipped:
+            payload = gzip.compress(payload, mtime=0)
+    if _same_content(path, payload):
+        return False
+    write_bytes(path, payload)
+    return True
+
+
+def _existing_is_compact(path, gzipped):
+    try:
+        with (gzip.open if gzipped else open)(path, "rb") as f:
+            return is_compact(f.read(2))
+    except OSError:
+        return False
+
+
+def _same_content(path, payload):
+    # the size check avoids reading files that certainly changed
+    try:
+        if os.path.getsize(path) != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except OSError:
+        return False
+
+
+def _msgpack():
+    if msgpack is None:
+        raise ImportError("MessagePack files need the msgpack package (pip install msgpack)")
+    return msgpack
+
+
+# ---------------------------------------------------------------------------
+# Packed storage
+# ---------------------------------------------------------------------------
+
+def pack_document(data):
+    """Copy of a document without section rawChords that repeat chords"""
+    sections = data.get("sections") if isinstance(data, dict) else None
+    if not isinstance(sections, list):
+        return data
+    packed_sections = []
+    for section in sections:
+        if isinstance(section, dict) and "rawChords" in section and section["rawChords"] == section.get("chords"):
+            section = dict(section, rawChords=SAME_AS_CHORDS)
+        packed_sections.append(section)
+    return dict(data, sections=packed_sections)
+
+
+def unpack_document(data):
+    """Restore the rawChords removed by pack_document (in place)"""
+    if isinstance(data, dict) and isinstance(data.get("sections"), list):
+        for section in data["sections"]:
+            if isinstance(section, dict) and section.get("rawChords") is SAME_AS_CHORDS:
+                section["rawChords"] = list(section.get("chords", []))
+    return data
+
+
+def pack(items, path):
+    """
+    Store (name, document) pairs in a gzipped JSON Lines shard, written
+    atomically; returns the number of documents
+    """
+    lines = [dumps({"name": name, "data": pack_document(data)}, compact=True) for name, data in items]
+    write_bytes(path, gzip.compress(b"\n".join(lines) + b"\n" if lines else b"", mtime=0))
+    return len(lines)
+
+
+def iter_shard(path):
+    """Yield the (name, document) pairs of a shard written by pack()"""
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                entry = loads(line)
+                yield entry["name"], unpack_document(entry["data"])
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def find_files(directory, recursive=False):
+    """JCRD files of a directory (or the file itself), sorted"""
+    if os.path.isfile(directory):
+        return [directory]
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        if not recursive:
+            dirnames.clear()
+        dirnames.sort()
+        paths.extend(os.path.join(dirpath, filename) for filename in sorted(filenames)
+                     if filename.endswith(JCRD_EXTENSIONS) and not filename.startswith("."))
+    return paths
+
+
+def rewrite(paths, compact):
+    """Rewrite files compact or indented; returns (written, failed)"""
+    written = failed = 0
+    for path in paths:
+        try:
+            written += dump(load(path), path, compact=compact)
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"❌ {os.path.basename(path)}: {e}")
+    return written, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert and pack JCRD files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in (("compact", "Rewrite files as minified JSON"),
+                               ("indent", "Rewrite files as indented JSON")):
+        command_parser = subparsers.add_parser(command, help=help_text)
+        command_parser.add_argument("directory", help="Folder of .jcrd files")
+        command_parser.add_argument("--recursive", action="store_true", help="Also process sub folders")
+    pack_parser = subparsers.add_parser("pack", help="Store files in a gzipped JSON Lines shard")
+    pack_parser.add_argument("directory", help="Folder of .jcrd files")
+    pack_parser.add_argument("shard", help="Shard file (.jsonl.gz)")
+    pack_parser.add_argument("--recursive", action="store_true", help="Also process sub folders")
+    unpack_parser = subparsers.add_parser("unpack", help="Write the files of a shard to a folder")
+    unpack_parser.add_argument("shard", help="Shard file (.jsonl.gz)")
+    unpack_parser.add_argument("directory", help="Output folder")
+    unpack_parser.add_argument("--compact", action="store_true", help="Write minified JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command in ("compact", "indent"):
+        paths = find_files(args.directory, args.recursive)
+        written, failed = rewrite(paths, args.command == "compact")
+        print(f"Rewrote {written} of {len(paths)} files in {time.perf_counter() - start:.1f}s ({failed} failed)")
+        return 1 if failed else 0
+
+    if args.command == "pack":
+        root = args.directory if os.path.isdir(args.directory) else os.path.dirname(args.directory)
+        paths = find_files(args.directory, args.recursive)
+        count = pack(((os.path.relpath(path, root), load(path)) for path in paths), args.shard)
+        print(f"Packed {count} files into {args.shard} ({os.path.getsize(args.shard)} bytes) "
+              f"in {time.perf_counter() - start:.1f}s")
+        return 0
+
+    count = 0
+    for name, data in iter_shard(args.shard):
+        path = os.path.join(args.directory, name)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        dump(data, path, compact=args.compact)
+        count += 1
+    print(f"Unpacked {count} files to {args.directory} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+TOOLBOX:
+name: JCRD Pipeline
+description: Runs a chain of toolbox stages (validate, add key, add Roman numerals, scan ready, export MIDI) over .jcrd files, reading and writing every file once.
+arguments:
+  --directory: Folder of .jcrd files (default: mcgill_jcrd/)
+  --stages: Comma separated stages, in order (default: validate,key,roman,ready)
+  --recursive: Also process sub folders
+  --jobs: Number of worker processes (default: CPU count, 1 = no pool)
+  --overwrite: Recompute keys and Roman numerals that are already present
+  --profile: Key profile for the key stage (default: aarden)
+  --table: Roman numeral figure table (default: data/cache/roman_figures.json)
+  --output_ready: Folder to copy export-ready files to (ready stage)
+  --output_midi: Folder for .mid files (midi stage, default: export/midi/)
+  --output_log: Report file (default: none)
+
+Chaining the scripts in tool_chain_runner.lua reads and re-writes every
+file once per script. Here each file is loaded once, the document is
+handed from stage to stage in memory, and it is written back once
+through jcrd_io (atomically, only if its content changed). Files are processed in chunks
+on a process pool.
+
+Stages (toolbox script in brackets):
+
+    validate  schema and consistency checks, reported only  (validate_jcrd_structure.py)
+    key       estimated key for songs without one          (add_key_estimation.py)
+    roman     Roman numerals for sections without them     (add_roman_numerals.py)
+    ready     export readiness, optional copy of the file   (scan_ready_for_export.py)
+    midi      block-chord MIDI file of the song             (export_jcrd_to_midi.py)
+"""
+
+import argparse
+import functools
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import add_roman_numerals
+import jcrd_io
+from add_key_estimation import (DEFAULT_PROFILE, PROFILES, chord_durations, estimate_key_from_chords,
+                                list_files, map_chunks)
+
+DEFAULT_STAGES = "validate,key,roman,ready"
+VALIDATE_CHECKS = ("schema", "required", "structure", "logic")
+
+
+# ---------------------------------------------------------------------------
+# Stages
+#
+# A stage takes the loaded document and the file's context (path, options,
+# "copies": extra paths the final document is written to) and returns
+# (changed, message). Stages import their tool lazily, so a chain does not
+# need the dependencies of stages it does not use.
+# ---------------------------------------------------------------------------
+
+def validate_stage(data, context):
+    import jcrd_validation
+    from validate_jcrd_structure import _format
+
+    errors = jcrd_validation.validate_data(data, VALIDATE_CHECKS)
+    if errors:
+        return False, "invalid: " + "; ".join(_format(error) for error in errors)
+    return False, "valid"
+
+
+def key_stage(data, context):
+    options = context["options"]
+    if data.get("key") and not options.overwrite:
+        return False, f"key {data['key']}"
+    symbols, durations = chord_durations(data)
+    data["key"] = estimate_key_from_chords(symbols, durations, options.profile)
+    return True, f"added key {data['key']}"
+
+
+def roman_stage(data, context):
+    if add_roman_numerals.annotate_data(data, context["options"].overwrite):
+        return True, "added Roman numerals"
+    return False, "Roman numerals present"
+
+
+def ready_stage(data, context):
+    from scan_ready_for_export import is_ready
+
+    ready, issues = is_ready(data)
+    if not ready:
+        return False, "not ready: " + "; ".join(issues)
+    output_ready = context["options"].output_ready
+    if output_ready:
+        context["copies"].append(os.path.join(output_ready, os.path.basename(context["path"])))
+    return False, "ready"
+
+
+def midi_stage(data, context):
+    from export_jcrd_to_midi import create_midi_from_jcrd
+
+    output_midi = context["options"].output_midi
+    os.makedirs(output_midi, exist_ok=True)
+    out_path = os.path.join(output_midi, os.path.splitext(os.path.basename(context["path"]))[0] + ".mid")
+    create_midi_from_jcrd(data, out_path)
+    return False, f"exported {os.path.basename(out_path)}"
+
+
+STAGES = {
+    "validate": validate_stage,
+    "key": key_stage,
+    "roman": roman_stage,
+    "ready": ready_stage,
+    "midi": midi_stage,
+}
+
+
+def parse_stages(text):
+    """Stage names of a comma separated list, checked against STAGES"""
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    return names
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+def run_file(path, stages, options):
+    """
+    Run the stages on one file: one read, at most one write
+
+    Returns:
+        (path, written, [(stage, message)], error)
+    """
+    try:
+        data = jcrd_io.load(path)
+    except (OSError, ValueError) as e:
+        return path, False, [], str(e)
+
+    context = {"path": path, "options": options, "copies": []}
+    changed = False
+    messages = []
+    for name in stages:
+        try:
+            stage_changed, message = STAGES[name](data, context)
+        except Exception as e:
+            return path, False, messages, f"{name} stage failed: {e}"
+        changed = changed or stage_changed
+        messages.append((name, message))
+
+    try:
+        written = changed and jcrd_io.dump(data, path)
+        for copy_path in context["copies"]:
+            os.makedirs(os.path.dirname(copy_path), exist_ok=True)
+            jcrd_io.dump(data, copy_path)
+    except OSError as e:
+        return path, False, messages, str(e)
+    return path, written, messages, None
+
+
+def run_chunk(paths, stages, options):
+    """
+    Run the stages on a chunk of files
+
+    Returns:
+        (list of run_file results, Roman numeral figures analyzed by this chunk)
+    """
+    results = [run_file(path, stages, options) for path in paths]
+    return results, add_roman_numerals.take_new_figures()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a chain of toolbox stages over .jcrd files")
+    parser.add_argument("--directory", default="mcgill_jcrd", help="Folder of .jcrd files")
+    parser.add_argument("--stages", default=DEFAULT_STAGES,
+                        help=f"Comma separated stages, in order ({', '.join(STAGES)})")
+    parser.add_argument("--recursive", action="store_true", help="Also process sub folders")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Number of worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Recompute keys and Roman numerals that are already present")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="Key profile for the key stage")
+    parser.add_argument("--table", default=add_roman_numerals.DEFAULT_TABLE,
+                        help="Roman numeral figure table")
+    parser.add_argument("--output_ready", default=None, help="Folder to copy export-ready files to")
+    parser.add_argument("--output_midi", default=os.path.join("export", "midi"), help="Folder for .mid files")
+    parser.add_argument("--output_log", default=None, help="Report file")
+    args = parser.parse_args()
+
+    try:
+        stages = parse_stages(args.stages)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    figures = known = None
+    if "roman" in stages:
+        figures = add_roman_numerals.load_figure_table(args.table)
+        known = len(figures)
+        add_roman_numerals.use_figure_table(figures)
+
+    paths = list_files(args.directory, args.recursive)
+    run = functools.partial(run_chunk, stages=stages, options=args)
+
+    written = failed = 0
+    log_lines = []
+    for results, new_figures in map_chunks(run, paths, args.jobs, initializer=add_roman_numerals.use_figure_table,
+                                           initargs=(figures if figures is not None else {},)):
+        if figures is not None:
+            figures.update(new_figures)
+        for path, file_written, messages, error in results:
+            filename = os.path.basename(path)
+            line = f"{filename} → " + "; ".join(f"{name}: {message}" for name, message in messages)
+            if error:
+                failed += 1
+                line = f"❌ {line}{'; ' if messages else ''}{error}"
+            else:
+                written += file_written
+                line = f"✅ {line}"
+            print(line)
+            log_lines.append(line)
+
+    if figures is not None and len(figures) > known:
+        add_roman_numerals.save_figure_table(figures, args.table)
+    summary = (f"Ran {', '.join(stages)} on {len(paths)} files in {time.perf_counter() - start:.1f}s: "
+               f"{written} written, {failed} failed")
+    print(summary)
+    if args.output_log:
+        with open(args.output_log, "w") as log:
+            log.write("\n".join(log_lines + [summary]))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+jcrd_validation.py - Shared, compiled validation for JCRD files
+
+One place for the JCRD checks used by the batch converters and the
+validate_jcrd_* scripts:
+
+- "schema": tools/jcrd.schema.json, checked by a jsonschema validator
+  built once per process
+- "required": required fields and section layout, without type checks
+- "structure": missing key, no sections, sections without chords
+- "logic": empty title or artist, duplicate section ids, negative or
+  empty section timing, non-monotonic beat_times, chords/romanNumerals
+  length mismatch
+- "fields": fields expected by the current format (key, beat_times,
+  section romanNumerals and tags)
+
+Whole libraries are validated on a process pool with iter_validate(),
+which yields one result record per file:
+
+    {"path": ..., "valid": bool, "errors": [{"check", "path", "message"}],
+     "cached": bool}
+
+With a cache file, files whose size and mtime are unchanged since the
+last run (with the same schema and checks) are not validated again.
+
+Usage:
+    python jcrd_validation.py ../database/jcrd_library --format jsonl
+"""
+
+import argparse
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import sys
+
+import jsonschema
+
+import jcrd_io
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_PATH = os.path.join(SCRIPT_DIR, "jcrd.schema.json")
+DEFAULT_LIBRARY = os.path.join(SCRIPT_DIR, "..", "database", "jcrd_library")
+CACHE_NAME = ".jcrd_validation_cache.json"
+JCRD_EXTENSIONS = (".json", ".jcrd")
+DEFAULT_CHECKS = ("schema", "logic")
+DEFAULT_CHUNK_SIZE = 64
+# part of the cache key: bump whenever a check changes what it reports
+CHECKS_VERSION = 2
+
+
+def _error(check, path, message):
+    return {"check": check, "path": path, "message": message}
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator(schema_path=SCHEMA_PATH):
+    """Load a JCRD schema and build a reusable validator
+
+    The validator maps a document to its list of (path, message) errors.
+    The result is cached, so the schema is read and checked once per
+    process and schema path.
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema)
+    return lambda data: [(tuple(e.absolute_path), e.message) for e in validator.iter_errors(data)]
+
+
+def schema_errors(data, schema_path=SCHEMA_PATH):
+    """Check data against the JCRD schema"""
+    errors = []
+    for path, message in sorted(get_validator(schema_path)(data), key=lambda e: e[0]):
+        errors.append(_error("schema", "/".join(str(p) for p in path), message))
+    return errors
+
+
+def required_errors(data, schema_path=SCHEMA_PATH):
+    """Check required fields and section layout"""
+    errors = []
+    if not data.get("title"):
+        errors.append(_error("required", "title", "Missing title"))
+    if not data.get("artist"):
+        errors.append(_error("required", "artist", "Missing artist"))
+    sections = data.get("sections")
+    if not isinstance(sections, list):
+        errors.append(_error("required", "sections", "Missing or invalid sections array"))
+        return errors
+    for i, section in enumerate(sections):
+        if not isinstance(section, dict):
+            errors.append(_error("required", f"sections/{i}", f"Section {i+1} is not an object"))
+            continue
+        for field in ("start_ms", "duration_ms"):
+            if field not in section:
+                errors.append(_error("required", f"sections/{i}/{field}", f"Section {i+1} missing {field}"))
+        if not isinstance(section.get("chords"), list):
+            errors.append(_error("required", f"sections/{i}/chords", f"Section {i+1} missing chords[]"))
+    return errors
+
+
+def structure_errors(data, schema_path=SCHEMA_PATH):
+    """Check that a file has a key, sections and chords in every section"""
+    errors = []
+    if "key" not in data:
+        errors.append(_error("structure", "key", "Missing key"))
+    sections = data.get("sections")
+    if sections == []:
+        errors.append(_error("structure", "sections", "No sections"))
+    for i, section in enumerate(sections if isinstance(sections, list) else []):
+        if isinstance(section, dict) and section.get("chords") == []:
+            errors.append(_error("structure", f"sections/{i}/chords", f"Section {i+1} has no chords"))
+    return errors
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def logic_errors(data, schema_path=SCHEMA_PATH):
+    """Check consistency that the schema cannot express"""
+    errors = []
+    for field in ("title", "artist"):
+        if data.get(field) == "":
+            errors.append(_error("logic", field, f"Empty {field} field"))
+    section_ids = set()
+    sections = data.get("sections")
+    for i, section in enumerate(sections if isinstance(sections, list) else []):
+        if not isinstance(section, dict):
+            continue
+        section_id = section.get("id", "")
+        if section_id in section_ids:
+            errors.append(_error("logic", f"sections/{i}/id", f"Duplicate section ID: {section_id}"))
+        section_ids.add(section_id)
+
+        start_ms = section.get("start_ms", 0)
+        if _is_number(start_ms) and start_ms < 0:
+            errors.append(_error("logic", f"sections/{i}/start_ms",
+                                 f"Section {section_id} has negative start_ms: {start_ms}"))
+        duration_ms = section.get("duration_ms", 0)
+        if _is_number(duration_ms) and duration_ms <= 0:
+            errors.append(_error("logic", f"sections/{i}/duration_ms",
+                                 f"Section {section_id} has zero or negative duration_ms: {duration_ms}"))
+
+        chords = section.get("chords", [])
+        roman = section.get("romanNumerals", [])
+        if roman and isinstance(chords, list) and isinstance(roman, list) and len(roman) != len(chords):
+            errors.append(_error("logic", f"sections/{i}/romanNumerals",
+                                 f"Section {section_id} mismatch chords/romanNumerals"))
+
+    beat_times = data.get("beat_times", [])
+    if beat_times and not isinstance(beat_times, list):
+        errors.append(_error("logic", "beat_times", "beat_times present but malformed"))
+    elif beat_times:
+        for i in range(1, len(beat_times)):
+            previous, time = beat_times[i - 1], beat_times[i]
+            if _is_number(previous) and _is_number(time) and time <= previous:
+                errors.append(_error("logic", f"beat_times/{i}",
+                                     f"Non-monotonic beat_times at index {i}: {time} <= {previous}"))
+    return errors
+
+
+def field_errors(data, schema_path=SCHEMA_PATH):
+    """Check the fields expected by the current JCRD format"""
+    errors = []
+    if "key" not in data:
+        errors.append(_error("fields", "key", "Missing 'key' field (required in new schema)"))
+    if "beat_times" not in data:
+        errors.append(_error("fields", "beat_times", "Missing 'beat_times' array (required in new schema)"))
+    sections = data.get("sections")
+    for i, section in enumerate(sections if isinstance(sections, list) else []):
+        if not isinstance(section, dict):
+            continue
+        section_id = section.get("id", "")
+        for field in ("romanNumerals", "tags"):
+            if field not in section:
+                errors.append(_error("fields", f"sections/{i}/{field}",
+                                     f"Section {section_id} missing '{field}' array (required in new schema)"))
+    return errors
+
+
+#: Available checks, by name
+CHECKS = {
+    "schema": schema_errors,
+    "required": required_errors,
+    "structure": structure_errors,
+    "logic": logic_errors,
+    "fields": field_errors,
+}
+
+
+def validate_data(data, checks=DEFAULT_CHECKS, schema_path=SCHEMA_PATH):
+    """Run checks on a loaded JCRD document and return the list of errors"""
+    if not isinstance(data, dict):
+        return [_error("schema", "", "JCRD document must be an object")]
+    errors = []
+    for check in checks:
+        errors.extend(CHECKS[check](data, schema_path))
+    return errors
+
+
+def validate_file(path, checks=DEFAULT_CHECKS, schema_path=SCHEMA_PATH):
+    """Validate one JCRD file and return its result record"""
+    try:
+        data = jcrd_io.load(path)
+        errors = validate_data(data, checks, schema_path)
+    except ValueError as e:
+        errors = [_error("parse", "", f"Invalid JSON: {e}")]
+    except OSError as e:
+        errors = [_error("parse", "", f"Error: {e}")]
+    return {"path": path, "valid": not errors, "errors": errors, "cached": False}
+
+
+def _validate_chunk(paths, checks, schema_path):
+    return [validate_file(path, checks, schema_path) for path in paths]
+
+
+def find_jcrd_files(root, extensions=JCRD_EXTENSIONS, recursive=True):
+    """List JCRD files under a directory, sorted"""
+    if os.path.isfile(root):
+        return [root]
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if not recursive:
+            dirnames.clear()
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(extensions) and not filename.startswith("."):
+                paths.append(os.path.join(dirpath, filename))
+    return paths
+
+
+def _cache_key(checks, schema_path):
+    with open(schema_path, "rb") as f:
+        schema_hash = hashlib.md5(f.read()).hexdigest()
+    return {"schema": schema_hash, "checks": sorted(checks), "checks_version": CHECKS_VERSION}
+
+
+def load_cache(cache_path, checks=DEFAULT_CHECKS, schema_path=SCHEMA_PATH):
+    """Load cached results, or an empty cache if the schema or checks changed"""
+    key = _cache_key(checks, schema_path)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get("version") != 1 or cache.get("key") != key:
+        cache = {"version": 1, "key": key, "files": {}}
+    return cache
+
+
+def save_cache(cache, cache_path):
+    """Write the cache atomically"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        # dumps uses the C encoder, dump does not
+        f.write(json.dumps(cache))
+    os.replace(tmp_path, cache_path)
+
+
+def iter_validate(paths, checks=DEFAULT_CHECKS, schema_path=SCHEMA_PATH, workers=None,
+                  chunk_size=DEFAULT_CHUNK_SIZE, cache_path=None):
+    """Validate files in parallel, yielding result records as they complete
+
+    Args:
+        paths: JCRD files to validate
+        checks: names of the checks to run, see CHECKS
+        schema_path: JCRD schema for the "schema" check
+        workers: number of worker processes (None = cpu count, 0 = run in
+            this process)
+        chunk_size: number of files sent to a worker at once
+        cache_path: JSON file of previous results. Unchanged files are
+            reported from it (with "cached": True) instead of being
+            validated again, and it is updated with the new results.
+
+    Yields:
+        one result record per file, cached ones first, then in the order
+        of paths
+    """
+    for check in checks:
+        if check not in CHECKS:
+            raise ValueError(f"Unknown check {check}, use some of {sorted(CHECKS)}")
+
+    cache = load_cache(cache_path, checks, schema_path) if cache_path else None
+    stats = {}
+    todo = []
+    for path in paths:
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+            stats[path] = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            stats[path] = None
+        entry = cache["files"].get(key) if cache else None
+        if entry and stats[path] and entry[:2] == stats[path]:
+            yield {"path": path, "valid": not entry[2], "errors": entry[2], "cached": True}
+        else:
+            todo.append(path)
+
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    n_cached = len(cache["files"]) if cache is not None else 0
+    try:
+        if workers == 0 or len(chunks) <= 1:
+            results = (_validate_chunk(chunk, checks, schema_path) for chunk in chunks)
+            executor = None
+        else:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            futures = [executor.submit(_validate_chunk, chunk, checks, schema_path) for chunk in chunks]
+            # in submission order, so the stream is deterministic
+            results = (future.result() for future in futures)
+        for records in results:
+            for record in records:
+                if cache is not None and stats[record["path"]]:
+                    cache["files"][os.path.abspath(record["path"])] = stats[record["path"]] + [record["errors"]]
+                yield record
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if cache is not None:
+            # drop deleted files
+            files = {k: v for k, v in cache["files"].items() if os.path.exists(k)}
+            if todo or len(files) != n_cached:
+                cache["files"] = files
+                save_cache(cache, cache_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a JCRD library against the schema")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_LIBRARY],
+                        help="JCRD files or directories (default: database/jcrd_library)")
+    parser.add_argument("--schema", default=SCHEMA_PATH, help="Path to JCRD schema file")
+    parser.add_argument("--checks", nargs="+", default=list(DEFAULT_CHECKS), choices=sorted(CHECKS),
+                        help="Checks to run")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count, 0 = no pool)")
+    parser.add_argument("--cache", default=None,
+                        help=f"Results cache for incremental runs (default: {CACHE_NAME} in the first directory)")
+    parser.add_argument("--no-cache", action="store_true", help="Validate every file again")
+    parser.add_argument("--format", choices=["text", "jsonl"], default="text",
+                        help="text: invalid files and a summary; jsonl: one JSON record per file")
+    parser.add_argument("--all", action="store_true", help="In text format, also list valid files")
+    args = parser.parse_args()
+
+    paths = []
+    for root in args.paths:
+        paths.extend(find_jcrd_files(root))
+    cache_path = None
+    if not args.no_cache:
+        directories = [p for p in args.paths if os.path.isdir(p)]
+        cache_path = args.cache or (os.path.join(directories[0], CACHE_NAME) if directories else None)
+
+    counts = {"valid": 0, "invalid": 0, "cached": 0}
+    for record in iter_validate(paths, args.checks, args.schema, args.workers, cache_path=cache_path):
+        counts["valid" if record["valid"] else "invalid"] += 1
+        counts["cached"] += record["cached"]
+        if args.format == "jsonl":
+            print(json.dumps(record))
+        elif not record["valid"]:
+            print(f"❌ {record['path']}")
+            for error in record["errors"][:5]:
+                print(f"   - [{error['check']}] {error['path'] or '/'}: {error['message']}")
+            if len(record["errors"]) > 5:
+                print(f"   - ... and {len(record['errors']) - 5} more issues")
+        elif args.all:
+            print(f"✅ {record['path']}")
+
+    summary = (f"Checked {len(paths)} files: {counts['valid']} valid, {counts['invalid']} invalid "
+               f"({counts['cached']} unchanged since the last run)")
+    print(summary, file=sys.stderr if args.format == "jsonl" else sys.stdout)
+    return 0 if counts["invalid"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 # merge_sections_to_song.py
-import json, sys, os
+import sys, os
 from pathlib import Path
 import argparse
 
+import jcrd_io
+
 def merge_sections(paths, output):
     full_song = {
         "title": "Untitled Composition",
@@ -13,15 +15,13 @@ def merge_sections(paths, output):
 
     time_cursor = 0
     for path in paths:
-        with open(path) as f:
-            data = json.load(f)
-            for section in data.get("sections", []):
-                section["start_ms"] = time_cursor
-                time_cursor += section.get("duration_ms", 4000)
-                full_song["sections"].append(section)
+        data = jcrd_io.load(path)
+        for section in data.get("sections", []):
+            section["start_ms"] = time_cursor
+            time_cursor += section.get("duration_ms", 4000)
+            full_song["sections"].append(section)
 
-    with open(output, "w") as f:
-        json.dump(full_song, f, indent=2)
+    jcrd_io.dump(full_song, output)
     print(f"✅ Merged {len(paths)} sections → {output}")
 
 def parse_args():
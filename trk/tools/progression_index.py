@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""
+progression_index.py - Transposition-invariant chord progression search
+
+Indexes every chord sequence of the JCRD catalog (see jcrd_catalog.py) by
+chord 3-grams whose roots are taken relative to the first chord, so
+"C G Am", "D A Bm" and "I V vi" all share one posting list. The index is
+stored next to the catalog in the same SQLite file and updated
+incrementally: only songs whose md5 changed in the catalog are re-indexed.
+
+Chords are reduced to a root and a triad quality (major, minor,
+diminished, augmented); sevenths, extensions and bass notes are ignored,
+and repeated chords are collapsed, so "C C G G" is searched as "C G".
+Chord names (C, Am, F#m7, Bb:maj, Fsmin) and Roman numerals (I, vi, bVII,
+V7/V, viix7) are both understood, in the library and in queries.
+
+Query syntax: chords separated by spaces, commas or dashes, "?" matches
+any single chord:
+
+    I V vi IV
+    C G Am F
+    ii ? I
+
+Match modes:
+
+    relative  any transposition (default)
+    key       Roman numerals relative to the key of the section or song
+    exact     chord names at their written pitch
+
+Usage:
+
+    python progression_index.py update
+    python progression_index.py search "I V vi IV" --limit 20
+    python progression_index.py search "C G Am F" --match exact --json
+"""
+
+import argparse
+import array
+import collections
+import functools
+import json
+import os
+import re
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from jcrd_catalog import DEFAULT_CATALOG, SCHEMA_VERSION as CATALOG_SCHEMA_VERSION, JcrdCatalog, split_key
+
+NGRAM = 3
+MATCH_MODES = ("relative", "key", "exact")
+
+MAJOR, MINOR, DIMINISHED, AUGMENTED = range(4)
+QUALITY_SUFFIXES = ["", "m", "o", "+"]
+BREAK = 255
+
+PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+ROMAN_DEGREES = {"I": 0, "II": 2, "III": 4, "IV": 5, "V": 7, "VI": 9, "VII": 11}
+NO_CHORD = {"N", "NC", "N.C.", "X", "R"}
+
+CHORD_NAME = re.compile(r"^([A-G])(#|b|♯|♭|s(?!us))?((?:[:mM0-9(/+o°øh]|dim|aug|sus|add|alt|no).*)?$")
+# figures in the rock corpus notation: d(ominant), s(us), h(alf-diminished),
+# x/o (diminished), inversions and applied chords
+ROMAN = re.compile(r"^([b#♭♯]*)(VII|VI|V|IV|III|II|I|vii|vi|v|iv|iii|ii|i)([dshxo°ø+#b0-9]*)(?:/(.+))?$")
+KEY_CHANGE = re.compile(r"^\[([A-Ga-g][#b♯♭-]?)\]$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progression_songs (
+    song_id INTEGER PRIMARY KEY,
+    path TEXT,
+    md5 TEXT
+);
+CREATE TABLE IF NOT EXISTS progression_sequences (
+    id INTEGER PRIMARY KEY,
+    song_id INTEGER NOT NULL,
+    section_idx INTEGER,
+    tonic INTEGER,
+    to_abs INTEGER,
+    tokens BLOB,
+    chord_idx BLOB
+);
+CREATE INDEX IF NOT EXISTS progression_sequences_song ON progression_sequences (song_id);
+CREATE TABLE IF NOT EXISTS progression_ngrams (
+    gram INTEGER NOT NULL,
+    seq_id INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    PRIMARY KEY (gram, seq_id, pos)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS progression_info (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Chord parsing
+# ---------------------------------------------------------------------------
+
+def _accidentals(text):
+    return sum(1 if c in "#♯s" else -1 for c in text)
+
+
+def _quality(figure, default=MAJOR):
+    figure = figure.lstrip(":")
+    if figure.startswith(("dim", "hdim", "o", "°", "ø", "x", "h")):
+        return DIMINISHED
+    if figure.startswith(("aug", "+")):
+        return AUGMENTED
+    if figure.startswith(("min", "m")) and not figure.startswith("maj"):
+        return MINOR
+    if figure.startswith(("maj", "M")):
+        return MAJOR
+    return default
+
+
+def _parse_roman(text):
+    match = ROMAN.match(text)
+    if not match:
+        return None
+    accidentals, numeral, figure, applied = match.groups()
+    degree = ROMAN_DEGREES[numeral.upper()] + _accidentals(accidentals)
+    quality = _quality(figure, MINOR if numeral.islower() else MAJOR)
+    if applied:
+        # applied chord, e.g. V7/V: degree of the target plus the numeral
+        target = _parse_roman(applied)
+        if target is None:
+            return None
+        degree += target[0]
+    return degree % 12, quality
+
+
+@functools.lru_cache(maxsize=None)
+def parse_chord(text):
+    """Parse a chord name or Roman numeral
+
+    Returns:
+        (pitch_class, quality, is_roman) where pitch_class is the degree above
+        the tonic for Roman numerals, or None if text is not a chord
+    """
+    if not text:
+        return None
+    text = text.strip()
+    match = CHORD_NAME.match(text)
+    if match:
+        letter, accidental, figure = match.groups()
+        pitch_class = (PITCH_CLASSES[letter] + _accidentals(accidental or "")) % 12
+        return pitch_class, _quality((figure or "").split("/", 1)[0]), False
+    roman = _parse_roman(text)
+    if roman:
+        return roman + (True,)
+    return None
+
+
+def _key_pitch_class(key):
+    tonic, _ = split_key(key)
+    parsed = parse_chord(tonic) if tonic else None
+    return parsed[0] if parsed and not parsed[2] else -1
+
+
+def format_chord(token):
+    """Format a (pitch_class, quality) token as a chord name"""
+    names = ["C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B"]
+    return names[token[0]] + QUALITY_SUFFIXES[token[1]]
+
+
+def build_sequence(chords, key=None):
+    """Turn chord texts into collapsed tokens
+
+    Args:
+        chords: list of (chord index, chord text)
+        key: key of the sequence, used to place Roman numerals and to find
+            the tonic of chord names
+
+    Returns:
+        tokens (bytes): pitch_class * 4 + quality per chord, BREAK where a
+            no-chord symbol interrupts the progression
+        chord_idx (array): chord index of each token
+        tonic (int): pitch class of the tonic in the token frame, or -1
+        to_abs (int): pitch class to add to get written pitches, or -1
+    """
+    key_pc = _key_pitch_class(key) if key else -1
+    tokens = bytearray()
+    chord_idx = array.array("I")
+    roman = None
+    shift = 0
+    for idx, text in chords:
+        text = (text or "").strip()
+        if text in NO_CHORD:
+            if tokens and tokens[-1] != BREAK:
+                tokens.append(BREAK)
+                chord_idx.append(idx)
+            continue
+        key_change = KEY_CHANGE.match(text)
+        if key_change:
+            new_key = _key_pitch_class(key_change.group(1))
+            if key_pc < 0:
+                key_pc = new_key
+            elif new_key >= 0:
+                shift = (new_key - key_pc) % 12
+            continue
+        parsed = parse_chord(text)
+        if parsed is None:
+            # repeat marks, bar lines and comments
+            continue
+        pitch_class, quality, is_roman = parsed
+        if roman is None:
+            roman = is_roman
+        if is_roman:
+            pitch_class = (pitch_class + shift) % 12
+        token = pitch_class * 4 + quality
+        if tokens and tokens[-1] == token:
+            continue
+        tokens.append(token)
+        chord_idx.append(idx)
+    if tokens and tokens[-1] == BREAK:
+        del tokens[-1]
+        chord_idx.pop()
+    if roman:
+        return bytes(tokens), chord_idx, 0, key_pc
+    return bytes(tokens), chord_idx, key_pc, 0
+
+
+def ngram_code(tokens):
+    """Transposition-invariant code of a run of NGRAM tokens"""
+    base = tokens[0] >> 2
+    code = 0
+    for i, token in enumerate(tokens):
+        code |= (((((token >> 2) - base) % 12) << 2) | (token & 3)) << (6 * i)
+    return code
+
+
+def iter_ngrams(tokens):
+    """Yield (position, code) of every n-gram without a break"""
+    for pos in range(len(tokens) - NGRAM + 1):
+        window = tokens[pos:pos + NGRAM]
+        if BREAK not in window:
+            yield pos, ngram_code(window)
+
+
+def parse_query(query):
+    """Parse a progression query into tokens, None for "?" wildcards
+
+    Returns:
+        (tokens, is_roman) where each token is a (pitch_class, quality) pair
+    """
+    tokens = []
+    roman = set()
+    for text in re.split(r"[\s,–—-]+", query.strip()):
+        if not text:
+            continue
+        if text in ("?", "*"):
+            tokens.append(None)
+            continue
+        parsed = parse_chord(text)
+        if parsed is None:
+            raise ValueError(f"Cannot parse chord {text!r} in {query!r}")
+        token = parsed[:2]
+        roman.add(parsed[2])
+        if tokens and tokens[-1] == token:
+            continue
+        tokens.append(token)
+    if not any(tokens):
+        raise ValueError(f"Query {query!r} has no chords")
+    if len(roman) > 1:
+        raise ValueError(f"Query {query!r} mixes chord names and Roman numerals")
+    return tokens, roman.pop()
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class ProgressionIndex:
+    """Chord progression index stored in a JCRD catalog
+
+    Args:
+        catalog: JcrdCatalog whose database holds the index
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.db = catalog.db
+        self.db.executescript(SCHEMA)
+
+    def update(self, verbose=False):
+        """Index songs that are new or changed in the catalog
+
+        Returns:
+            dict: number of songs indexed, removed and unchanged, and the
+            elapsed seconds
+        """
+        start = time.perf_counter()
+        self._check_catalog_schema()
+        current = {row[0]: (row[1], row[2]) for row in self.db.execute("SELECT id, path, md5 FROM songs")}
+        indexed = {row[0]: (row[1], row[2]) for row in
+                   self.db.execute("SELECT song_id, path, md5 FROM progression_songs")}
+        stale = [song_id for song_id, state in indexed.items() if current.get(song_id) != state]
+        new = [song_id for song_id, state in current.items() if indexed.get(song_id) != state]
+
+        with self.db:
+            for song_id in stale:
+                self._remove(song_id)
+        for i in range(0, len(new), 500):
+            with self.db:
+                self._add(new[i:i + 500])
+            if verbose:
+                print(f"{min(i + 500, len(new))}/{len(new)} songs indexed")
+        if stale or new:
+            self.db.execute("ANALYZE progression_ngrams")
+        return {
+            "indexed": len(new),
+            "removed": len(set(stale) - set(new)),
+            "unchanged": len(current) - len(new),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _check_catalog_schema(self):
+        """Clear the index if it was built from another catalog schema
+
+        A catalog rebuilt for a new schema can give changed chords or keys
+        the same song ids and md5s, so the per-song check would miss them.
+        """
+        row = self.db.execute("SELECT value FROM progression_info WHERE name = 'catalog_schema'").fetchone()
+        if row is not None and row[0] == str(CATALOG_SCHEMA_VERSION):
+            return
+        with self.db:
+            self.db.execute("DELETE FROM progression_ngrams")
+            self.db.execute("DELETE FROM progression_sequences")
+            self.db.execute("DELETE FROM progression_songs")
+            self.db.execute("INSERT OR REPLACE INTO progression_info VALUES ('catalog_schema', ?)",
+                            (str(CATALOG_SCHEMA_VERSION),))
+
+    def _remove(self, song_id):
+        rows = self.db.execute("SELECT id, tokens FROM progression_sequences WHERE song_id = ?", (song_id,)).fetchall()
+        for seq_id, tokens in rows:
+            self.db.executemany(
+                "DELETE FROM progression_ngrams WHERE gram = ? AND seq_id = ? AND pos = ?",
+                [(code, seq_id, pos) for pos, code in iter_ngrams(tokens)])
+        self.db.execute("DELETE FROM progression_sequences WHERE song_id = ?", (song_id,))
+        self.db.execute("DELETE FROM progression_songs WHERE song_id = ?", (song_id,))
+
+    def _add(self, song_ids):
+        marks = ", ".join("?" * len(song_ids))
+        songs = {row[0]: row for row in self.db.execute(
+            f"SELECT id, path, md5, key FROM songs WHERE id IN ({marks})", song_ids)}
+        section_keys = {(row[0], row[1]): row[2] for row in self.db.execute(
+            f"SELECT song_id, idx, key FROM sections WHERE song_id IN ({marks}) AND key IS NOT NULL", song_ids)}
+        sequences = collections.defaultdict(list)
+        for song_id, section_idx, idx, chord in self.db.execute(
+                f"SELECT song_id, section_idx, idx, chord FROM chords WHERE song_id IN ({marks}) "
+                f"ORDER BY song_id, section_idx, idx", song_ids):
+            sequences[song_id, section_idx].append((idx, chord))
+
+        postings = []
+        for (song_id, section_idx), chords in sequences.items():
+            key = section_keys.get((song_id, section_idx)) or songs[song_id][3]
+            tokens, chord_idx, tonic, to_abs = build_sequence(chords, key)
+            if not tokens:
+                continue
+            seq_id = self.db.execute(
+                "INSERT INTO progression_sequences (song_id, section_idx, tonic, to_abs, tokens, chord_idx) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (song_id, section_idx, tonic, to_abs, tokens, chord_idx.tobytes())).lastrowid
+            postings.extend((code, seq_id, pos) for pos, code in iter_ngrams(tokens))
+        self.db.executemany("INSERT OR IGNORE INTO progression_ngrams VALUES (?, ?, ?)", postings)
+        self.db.executemany("INSERT OR REPLACE INTO progression_songs VALUES (?, ?, ?)",
+                            [(song_id, row[1], row[2]) for song_id, row in songs.items()])
+
+    # -- search -------------------------------------------------------------
+
+    def search(self, query, match="relative", limit=None):
+        """Find a progression in the library
+
+        Args:
+            query: chords separated by spaces, e.g. "I V vi IV" or "C G Am F",
+                "?" matches any chord
+            match: "relative" (any transposition), "key" (Roman numerals
+                relative to the key) or "exact" (chord names as written)
+            limit: maximum number of matches
+
+        Returns:
+            list of dicts with song_id, path, title, artist, section (index,
+            or None for chords outside sections), section_label, offset (chord
+            index where the match starts) and end (chord index of its last
+            chord), ordered by song and position
+        """
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode {match}, use one of {MATCH_MODES}")
+        tokens, roman = parse_query(query)
+        if match == "key" and not roman:
+            raise ValueError("Key matches need a query in Roman numerals")
+        if match == "exact" and roman:
+            raise ValueError("Exact matches need a query in chord names")
+
+        candidates = self._candidates(tokens)
+        if candidates is None:
+            # no n-gram to look up, scan every sequence for the query in any key
+            pattern = _scan_pattern(tokens)
+            rows = self.db.execute("SELECT id, song_id, section_idx, tonic, to_abs, tokens, chord_idx "
+                                   "FROM progression_sequences ORDER BY song_id, section_idx")
+            candidates = []
+            for row in rows:
+                starts = [m.start() for m in pattern.finditer(row[5])]
+                if starts:
+                    candidates.append((row, starts))
+
+        matches = []
+        for row, starts in candidates:
+            seq_id, song_id, section_idx, tonic, to_abs, seq_tokens, chord_idx = row
+            chord_idx = array.array("I", chord_idx)
+            for start in starts:
+                if _matches(seq_tokens, start, tokens, match, tonic, to_abs):
+                    matches.append({
+                        "song_id": song_id,
+                        "section": section_idx,
+                        "offset": chord_idx[start],
+                        "end": chord_idx[start + len(tokens) - 1],
+                    })
+                    if limit and len(matches) >= limit:
+                        return self._describe(matches)
+        return self._describe(matches)
+
+    def _candidates(self, tokens):
+        """Sequences and start positions sharing the rarest n-gram of tokens
+
+        Returns None if the query has no run of NGRAM chords without "?".
+        """
+        windows = []
+        for offset in range(len(tokens) - NGRAM + 1):
+            window = tokens[offset:offset + NGRAM]
+            if None not in window:
+                code = ngram_code([pc * 4 + quality for pc, quality in window])
+                count = self.db.execute("SELECT COUNT(*) FROM progression_ngrams WHERE gram = ?", (code,)).fetchone()[0]
+                windows.append((count, offset, code))
+        if not windows:
+            return None
+        _, offset, code = min(windows)
+        starts = collections.defaultdict(list)
+        for seq_id, pos in self.db.execute("SELECT seq_id, pos FROM progression_ngrams WHERE gram = ?", (code,)):
+            if pos >= offset:
+                starts[seq_id].append(pos - offset)
+
+        candidates = []
+        seq_ids = list(starts)
+        for i in range(0, len(seq_ids), 900):
+            chunk = seq_ids[i:i + 900]
+            candidates.extend(self.db.execute(
+                "SELECT id, song_id, section_idx, tonic, to_abs, tokens, chord_idx FROM progression_sequences "
+                f"WHERE id IN ({', '.join('?' * len(chunk))})", chunk))
+        candidates.sort(key=lambda row: (row[1], row[2] if row[2] is not None else -1))
+        return [(row, starts[row[0]]) for row in candidates]
+
+    def _describe(self, matches):
+        song_ids = sorted({m["song_id"] for m in matches})
+        songs, labels, bounds, starts = {}, {}, collections.defaultdict(list), {}
+        for i in range(0, len(song_ids), 900):
+            chunk = song_ids[i:i + 900]
+            marks = ", ".join("?" * len(chunk))
+            for row in self.db.execute(f"SELECT id, path, title, artist FROM songs WHERE id IN ({marks})", chunk):
+                songs[row[0]] = row[1:]
+            for song_id, idx, label, start, end in self.db.execute(
+                    f"SELECT song_id, idx, label, start, end FROM sections WHERE song_id IN ({marks}) "
+                    f"ORDER BY song_id, idx", chunk):
+                labels[song_id, idx] = label
+                bounds[song_id].append((start, end, idx))
+        unsectioned = sorted({m["song_id"] for m in matches if m["section"] is None})
+        for i in range(0, len(unsectioned), 900):
+            chunk = unsectioned[i:i + 900]
+            starts.update(((row[0], row[1]), row[2]) for row in self.db.execute(
+                f"SELECT song_id, idx, start FROM chords WHERE section_idx IS NULL "
+                f"AND song_id IN ({', '.join('?' * len(chunk))})", chunk))
+
+        for m in matches:
+            song_id = m["song_id"]
+            if m["section"] is None:
+                # chords listed outside the sections, find the section by time
+                chord_start = starts.get((song_id, m["offset"]))
+                if chord_start is not None:
+                    m["section"] = next((idx for start, end, idx in bounds[song_id]
+                                         if start is not None and end is not None and start <= chord_start < end), None)
+            path, title, artist = songs[song_id]
+            m.update(path=path, title=title, artist=artist, section_label=labels.get((song_id, m["section"])))
+        return matches
+
+
+def _scan_pattern(tokens):
+    """Regular expression finding tokens in any transposition, "?" included"""
+    alternatives = []
+    for shift in range(12):
+        parts = []
+        for token in tokens:
+            if token is None:
+                parts.append(rb"[^\xff]")
+            else:
+                parts.append(re.escape(bytes([(token[0] + shift) % 12 * 4 + token[1]])))
+        alternatives.append(b"".join(parts))
+    # lookahead so that overlapping matches are all found
+    return re.compile(b"(?=" + b"|".join(alternatives) + b")")
+
+
+def _matches(seq_tokens, start, tokens, match, tonic, to_abs):
+    if start < 0 or start + len(tokens) > len(seq_tokens):
+        return False
+    if match == "key" and tonic < 0 or match == "exact" and to_abs < 0:
+        return False
+    base = None
+    for i, token in enumerate(tokens):
+        value = seq_tokens[start + i]
+        if value == BREAK:
+            return False
+        if token is None:
+            continue
+        pitch_class, quality = token
+        if value & 3 != quality:
+            return False
+        root = value >> 2
+        if match == "key":
+            ok = (root - tonic) % 12 == pitch_class
+        elif match == "exact":
+            ok = (root + to_abs) % 12 == pitch_class
+        else:
+            if base is None:
+                base = (root - pitch_class) % 12
+            ok = (root - base) % 12 == pitch_class
+        if not ok:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search chord progressions in the JCRD library")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="SQLite catalog file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    update = subparsers.add_parser("update", help="Update the catalog and the progression index")
+    update.add_argument("--no-catalog-update", action="store_true",
+                        help="Only index what the catalog already holds")
+
+    search = subparsers.add_parser("search", help="Find a progression")
+    search.add_argument("query", help='Chords, e.g. "I V vi IV" or "C G Am F", "?" matches any chord')
+    search.add_argument("--match", choices=MATCH_MODES, default="relative")
+    search.add_argument("--limit", type=int)
+    search.add_argument("--json", action="store_true", help="Print matches as JSON")
+    args = parser.parse_args()
+
+    with JcrdCatalog(args.catalog) as catalog:
+        index = ProgressionIndex(catalog)
+        if args.command == "update":
+            if not args.no_catalog_update:
+                print(json.dumps(catalog.update()))
+            print(json.dumps(index.update()))
+            return
+
+        start = time.perf_counter()
+        matches = index.search(args.query, args.match, args.limit)
+        elapsed = time.perf_counter() - start
+        if args.json:
+            json.dump(matches, sys.stdout, indent=2)
+            print()
+            return
+        for m in matches:
+            section = m["section_label"] or m["section"]
+            print(f"{m['artist']} - {m['title']} [{section}] chord {m['offset']}  ({m['path']})")
+        print(f"\n{len(matches)} matches in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,42 @@
 -- NOTE: ImGui argument errors are handled by the enhanced virtual environment mock. Static analysis errors for ImGui calls can be ignored in this environment.
 -- run_python_tool.lua
--- Launches a Python script from the REAPER environment with specified arguments
+-- Launches a Python script from the REAPER environment with specified arguments.
+-- The script runs in the persistent toolbox worker (toolbox_worker.py) when
+-- toolbox_client.lua is installed next to this file, which also starts the
+-- worker for later calls; otherwise every call starts a new python process.
+
+local client_path = (debug.getinfo(1, "S").source:match("^@(.*[/\\])") or "") .. "toolbox_client.lua"
+if not toolbox_client and reaper.file_exists(client_path) then
+    dofile(client_path)
+end
 
 function run_python_tool(script_name, args_table)
     local python_path = "python"  -- Adjust this path if using a virtual environment
     local script_dir = reaper.GetResourcePath() .. "/Scripts/jcrd_toolbox/"
     local script_path = script_dir .. script_name
-    local args = ""
 
-    for key, value in pairs(args_table) do
-        args = args .. string.format(' --%s "%s"', key, tostring(value))
-    end
+    local success
+    if toolbox_client then
+        toolbox_client.start(script_dir .. "toolbox_worker.py", python_path)
+        reaper.ShowConsoleMsg("Running: " .. toolbox_client.command(script_path, args_table, python_path) .. "\n")
+        local output
+        success, output = toolbox_client.run(script_path, args_table, python_path)
+        if output and output ~= "" then
+            reaper.ShowConsoleMsg(output)
+        end
+    else
+        local args = ""
+        for key, value in pairs(args_table) do
+            args = args .. string.format(' --%s "%s"', key, tostring(value))
+        end
 
-    local command = string.format('"%s" "%s"%s', python_path, script_path, args)
-    reaper.ShowConsoleMsg("Running: " .. command .. "\n")
-    local result = os.execute(command)
+        local command = string.format('"%s" "%s"%s', python_path, script_path, args)
+        reaper.ShowConsoleMsg("Running: " .. command .. "\n")
+        local result = os.execute(command)
+        success = result == true or result == 0
+    end
 
-    if result == 0 then
+    if success then
         reaper.ShowConsoleMsg("✅ " .. script_name .. " completed successfully.\n")
     else
         reaper.ShowConsoleMsg("❌ " .. script_name .. " failed.\n")
@@ -9,7 +9,7 @@ arguments:
 """
 
 import os
-import json
+import jcrd_io
 import argparse
 import shutil
 
@@ -63,12 +63,11 @@ def main():
             continue
 
         path = os.path.join(args.directory, fname)
-        with open(path, "r") as f:
-            try:
-                jcrd = json.load(f)
-            except Exception as e:
-                log_lines.append(f"❌ {fname} → failed to parse: {e}")
-                continue
+        try:
+            jcrd = jcrd_io.load(path)
+        except ValueError as e:
+            log_lines.append(f"❌ {fname} → failed to parse: {e}")
+            continue
 
         ready, issues = is_ready(jcrd)
         if ready:
@@ -3,10 +3,10 @@
 simple_validate.py - Simple validation script for JCRD files against the schema
 """
 
-import json
-import jsonschema
 import sys
 
+import jcrd_validation
+
 def main():
     if len(sys.argv) != 3:
         print("Usage: simple_validate.py <schema_path> <jcrd_path>")
@@ -16,18 +16,16 @@ def main():
     jcrd_path = sys.argv[2]
     
     try:
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-            
-        with open(jcrd_path, 'r', encoding='utf-8') as f:
-            jcrd = json.load(f)
-            
-        jsonschema.validate(instance=jcrd, schema=schema)
-        print(f"Validation successful! {jcrd_path} is a valid JCRD file.")
-        return 0
+        record = jcrd_validation.validate_file(jcrd_path, ("schema",), schema_path)
     except Exception as e:
         print(f"Validation failed: {e}")
         return 1
+    if record["valid"]:
+        print(f"Validation successful! {jcrd_path} is a valid JCRD file.")
+        return 0
+    error = record["errors"][0]
+    print(f"Validation failed: {error['message']} (at /{error['path']})")
+    return 1
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -16,6 +16,8 @@ from pathlib import Path
 import sys
 from difflib import SequenceMatcher
 
+import jcrd_io
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -116,8 +118,7 @@ def normalize_section_label(label):
 def standardize_jcrd_file(jcrd_path, mappings, dry_run=False):
     """Standardize section labels in a JCRD file."""
     try:
-        with open(jcrd_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jcrd_io.load(jcrd_path)
 
         # Check if we need to add/update section letters
         sections = data.get("sections", [])
@@ -187,8 +188,7 @@ def standardize_jcrd_file(jcrd_path, mappings, dry_run=False):
 
         # Save the updated file
         if updated > 0 and not dry_run:
-            with open(jcrd_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            jcrd_io.dump(data, jcrd_path)
             logging.info(
                 f"Updated {jcrd_path} with {updated} standardized section elements"
             )
@@ -1,18 +1,40 @@
 -- NOTE: ImGui argument errors are handled by the enhanced virtual environment mock. Static analysis errors for ImGui calls can be ignored in this environment.
 -- tool_chain_runner.lua
--- Executes a chain of tools with specified arguments and logs results to REAPER's console
+-- Executes a chain of tools with specified arguments and logs results to REAPER's console.
+-- The tools run in the persistent toolbox worker (toolbox_worker.py) when
+-- toolbox_client.lua is installed next to this file; otherwise every tool
+-- starts a new python process.
+
+local script_dir = debug.getinfo(1, "S").source:match("^@(.*[/\\])") or ""
+if not toolbox_client and reaper.file_exists(script_dir .. "toolbox_client.lua") then
+    dofile(script_dir .. "toolbox_client.lua")
+end
 
 function run_tool_chain(tool_chain)
-    for i, tool in ipairs(tool_chain) do
-        local command = "python " .. tool.script
-        for key, value in pairs(tool.args) do
-            command = command .. string.format(" --%s \"%s\"", key, value)
-        end
+    if toolbox_client then
+        toolbox_client.start(script_dir .. "toolbox_worker.py")
+    end
 
+    for i, tool in ipairs(tool_chain) do
         reaper.ShowConsoleMsg(string.format("🚀 Running tool %d/%d: %s\n", i, #tool_chain, tool.script))
-        local result = os.execute(command)
 
-        if result == 0 then
+        local success
+        if toolbox_client then
+            local output
+            success, output = toolbox_client.run(tool.script, tool.args)
+            if output and output ~= "" then
+                reaper.ShowConsoleMsg(output)
+            end
+        else
+            local command = "python " .. tool.script
+            for key, value in pairs(tool.args) do
+                command = command .. string.format(" --%s \"%s\"", key, value)
+            end
+            local result = os.execute(command)
+            success = result == true or result == 0
+        end
+
+        if success then
             reaper.ShowConsoleMsg(string.format("✅ Tool %d completed successfully: %s\n", i, tool.script))
         else
             reaper.ShowConsoleMsg(string.format("❌ Tool %d failed: %s\n", i, tool.script))
@@ -30,4 +52,9 @@ local tool_chain = {
 }
 
 run_tool_chain(tool_chain)
+
+-- The same chain in one pass over the files (each file read and written once):
+run_tool_chain({
+    { script = "jcrd_pipeline.py", args = { directory = "datasets/mcgill/", stages = "validate,key,midi", output_midi = "export/midi/" } }
+})
 ]]
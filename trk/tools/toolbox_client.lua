@@ -0,0 +1,262 @@
+-- toolbox_client.lua
+-- Runs toolbox scripts in the persistent Python worker (tools/toolbox_worker.py)
+-- instead of starting a new interpreter for every call, and falls back to
+-- spawning python when no worker is running.
+--
+-- The worker describes itself in trk_toolbox_worker.json in the temp
+-- directory. Requests go over LuaSocket when it is installed, otherwise over
+-- the worker's named pipes (macOS/Linux), which plain io.open can use.
+--
+-- Usage:
+--   dofile(script_dir .. "toolbox_client.lua")
+--   local ok, output = toolbox_client.run("add_key_estimation.py", { directory = "mcgill_jcrd/" })
+
+toolbox_client = toolbox_client or {}
+
+local STATE_FILE_NAME = "trk_toolbox_worker.json"
+-- seconds without heartbeat before the worker counts as gone: about twice
+-- the worker's HEARTBEAT_INTERVAL (2 s), so the blocking pipe opens of
+-- send_pipe are not attempted long after a worker died
+local HEARTBEAT_TIMEOUT = 5
+local IS_WINDOWS = package.config:sub(1, 1) == "\\"
+
+-- JSON -----------------------------------------------------------------------
+
+local ESCAPES = { ['"'] = '\\"', ['\\'] = '\\\\', ['\n'] = '\\n', ['\r'] = '\\r', ['\t'] = '\\t' }
+
+local function encode(value)
+  local kind = type(value)
+  if kind == "string" then
+    return '"' .. value:gsub('[%c"\\]', function(c)
+      return ESCAPES[c] or string.format("\\u%04x", c:byte())
+    end) .. '"'
+  elseif kind == "number" then
+    return string.format("%.14g", value)
+  elseif kind == "boolean" then
+    return tostring(value)
+  elseif kind == "table" then
+    local items = {}
+    if #value > 0 then
+      for _, item in ipairs(value) do
+        items[#items + 1] = encode(item)
+      end
+      return "[" .. table.concat(items, ",") .. "]"
+    end
+    for key, item in pairs(value) do
+      items[#items + 1] = encode(tostring(key)) .. ":" .. encode(item)
+    end
+    return "{" .. table.concat(items, ",") .. "}"
+  end
+  return "null"
+end
+
+local function utf8_char(code)
+  local floor = math.floor
+  if code < 0x80 then
+    return string.char(code)
+  elseif code < 0x800 then
+    return string.char(0xC0 + floor(code / 0x40), 0x80 + code % 0x40)
+  elseif code < 0x10000 then
+    return string.char(0xE0 + floor(code / 0x1000), 0x80 + floor(code / 0x40) % 0x40, 0x80 + code % 0x40)
+  end
+  return string.char(0xF0 + floor(code / 0x40000), 0x80 + floor(code / 0x1000) % 0x40,
+                     0x80 + floor(code / 0x40) % 0x40, 0x80 + code % 0x40)
+end
+
+local UNESCAPES = { b = "\b", f = "\f", n = "\n", r = "\r", t = "\t" }
+local decode_value
+
+local function decode_string(text, pos)
+  local parts = {}
+  pos = pos + 1
+  while true do
+    local stop = text:find('["\\]', pos)
+    if not stop then error("unterminated string") end
+    parts[#parts + 1] = text:sub(pos, stop - 1)
+    if text:sub(stop, stop) == '"' then
+      return table.concat(parts), stop + 1
+    end
+    local escape = text:sub(stop + 1, stop + 1)
+    if escape == "u" then
+      local code = tonumber(text:sub(stop + 2, stop + 5), 16)
+      pos = stop + 6
+      -- surrogate pair
+      if code >= 0xD800 and code < 0xDC00 and text:sub(pos, pos + 1) == "\\u" then
+        local low = tonumber(text:sub(pos + 2, pos + 5), 16)
+        code = 0x10000 + (code - 0xD800) * 0x400 + (low - 0xDC00)
+        pos = pos + 6
+      end
+      parts[#parts + 1] = utf8_char(code)
+    else
+      parts[#parts + 1] = UNESCAPES[escape] or escape
+      pos = stop + 2
+    end
+  end
+end
+
+local function skip(text, pos)
+  return text:find("[^%s]", pos) or #text + 1
+end
+
+decode_value = function(text, pos)
+  pos = skip(text, pos)
+  local c = text:sub(pos, pos)
+  if c == '"' then
+    return decode_string(text, pos)
+  elseif c == "{" or c == "[" then
+    local result, is_object = {}, c == "{"
+    pos = skip(text, pos + 1)
+    if text:sub(pos, pos) == (is_object and "}" or "]") then
+      return result, pos + 1
+    end
+    while true do
+      local key
+      if is_object then
+        key, pos = decode_string(text, skip(text, pos))
+        pos = skip(text, pos) + 1  -- ":"
+      end
+      local item
+      item, pos = decode_value(text, pos)
+      if is_object then result[key] = item else result[#result + 1] = item end
+      pos = skip(text, pos)
+      local separator = text:sub(pos, pos)
+      pos = pos + 1
+      if separator ~= "," then
+        return result, pos
+      end
+    end
+  end
+  if text:sub(pos, pos + 3) == "true" then
+    return true, pos + 4
+  elseif text:sub(pos, pos + 4) == "false" then
+    return false, pos + 5
+  elseif text:sub(pos, pos + 3) == "null" then
+    return nil, pos + 4
+  end
+  local number = text:match("^-?%d+%.?%d*[eE]?[-+]?%d*", pos)
+  if not number or number == "" then error("invalid JSON at " .. pos) end
+  return tonumber(number), pos + #number
+end
+
+function toolbox_client.decode(text)
+  local ok, value = pcall(decode_value, text, 1)
+  if ok then return value end
+  return nil
+end
+
+toolbox_client.encode = encode
+
+-- Worker ---------------------------------------------------------------------
+
+local function temp_dir()
+  -- same lookup order as Python's tempfile.gettempdir()
+  local dir = os.getenv("TMPDIR") or os.getenv("TEMP") or os.getenv("TMP") or "/tmp"
+  return (dir:gsub("[/\\]+$", ""))
+end
+
+-- State of a live worker, or nil
+function toolbox_client.state()
+  local file = io.open(temp_dir() .. "/" .. STATE_FILE_NAME, "r")
+  if not file then return nil end
+  local state = toolbox_client.decode(file:read("*a"))
+  file:close()
+  if not state or not state.heartbeat or os.time() - state.heartbeat > HEARTBEAT_TIMEOUT then
+    return nil
+  end
+  return state
+end
+
+local function socket_module()
+  local ok, socket = pcall(require, "socket")
+  return ok and socket or nil
+end
+
+local function send_socket(state, line)
+  local socket = socket_module()
+  if not socket or not state.port then return nil end
+  local client = socket.connect("127.0.0.1", state.port)
+  if not client then return nil end
+  client:send(line)
+  local response = client:receive("*l")
+  client:close()
+  return response
+end
+
+local function send_pipe(state, line, id)
+  if not state.pipe_in or not state.pipe_out then return nil end
+  local pipe = io.open(state.pipe_in, "w")
+  if not pipe then return nil end
+  pipe:write(line)
+  pipe:close()
+  local reply = io.open(state.pipe_out, "r")
+  if not reply then return nil end
+  -- skip replies left behind by clients that gave up
+  local response
+  repeat
+    response = reply:read("*l")
+    local decoded = response and toolbox_client.decode(response)
+  until not response or (decoded and decoded.id == id)
+  reply:close()
+  return response
+end
+
+-- Call a worker method; returns the result, or nil and an error message
+function toolbox_client.call(method, params)
+  local state = toolbox_client.state()
+  if not state then return nil, "no toolbox worker running" end
+  params = params or {}
+  params.token = state.token
+  -- ids must not repeat across scripts, which all share the worker's pipes
+  local id = string.format("%d-%d-%d", os.time(), math.floor(os.clock() * 1000000), math.random(1, 1000000000))
+  local line = encode({ jsonrpc = "2.0", id = id, method = method, params = params }) .. "\n"
+  local response = send_socket(state, line) or send_pipe(state, line, id)
+  if not response then return nil, "toolbox worker did not answer" end
+  local decoded = toolbox_client.decode(response)
+  if not decoded then return nil, "invalid response from toolbox worker" end
+  if decoded.error then return nil, decoded.error.message end
+  return decoded.result
+end
+
+-- Command line of the spawn fallback
+function toolbox_client.command(script, args, python_path)
+  local command = string.format('"%s" "%s"', python_path or "python", script)
+  for key, value in pairs(args or {}) do
+    if value == true then
+      command = command .. string.format(" --%s", key)
+    elseif value ~= false then
+      command = command .. string.format(' --%s "%s"', key, tostring(value))
+    end
+  end
+  return command
+end
+
+-- Start a worker in the background unless one is running; returns true
+-- when a worker is already available. Nothing is started when this Lua
+-- could not reach it: the named pipes need macOS/Linux, so on Windows the
+-- worker is only used with LuaSocket. An idle worker exits by itself.
+function toolbox_client.start(worker_script, python_path)
+  if toolbox_client.state() then return true end
+  if IS_WINDOWS and not socket_module() then return false end
+  local command = string.format('"%s" "%s" serve', python_path or "python", worker_script)
+  if IS_WINDOWS then
+    os.execute('start "" /B ' .. command)
+  else
+    os.execute(command .. " > /dev/null 2>&1 &")
+  end
+  return false
+end
+
+-- Run a toolbox script with arguments { name = value } (true = flag).
+-- Returns success and the output of the tool (nil when it ran in a new
+-- python process, whose output goes to the system console).
+function toolbox_client.run(script, args, python_path)
+  local result = toolbox_client.call("run", { script = script, args = args or {} })
+  if result then
+    return result.exit_code == 0, (result.stdout or "") .. (result.stderr or "")
+  end
+  local status = os.execute(toolbox_client.command(script, args, python_path))
+  -- Lua 5.1 returns the exit code, Lua 5.2+ true on success
+  return status == true or status == 0, nil
+end
+
+return toolbox_client
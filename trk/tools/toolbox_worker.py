@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+toolbox_worker.py - Long-lived Python worker for the REAPER toolbox
+
+Running a toolbox script from REAPER used to start a new interpreter and
+import numpy, pretty_midi, music21 and mirdata on every click. The worker
+imports them once, together with the toolbox scripts listed in the
+toolbox_entry_*.json manifests, and then runs tools in-process on request:
+a script with a main() function is imported once and its main() called
+with the request arguments as sys.argv, other scripts are executed as
+__main__. Output and exit code are captured and returned; scripts are
+re-imported when their file changes.
+
+Requests are JSON-RPC 2.0 objects, one per line, on two local transports:
+
+- TCP on 127.0.0.1 (for LuaSocket and Python clients)
+- a pair of named pipes (FIFOs, POSIX only) that plain REAPER Lua can open
+  with io.open: write one request line to the .in pipe, read one response
+  line from the .out pipe
+
+The worker describes itself in trk_toolbox_worker.json in the temp
+directory (pid, port, pipes, token, heartbeat). Every request must carry
+the token from that file; the heartbeat is refreshed every few seconds so
+clients can tell a live worker from a stale file. toolbox_client.lua is
+the Lua client, it falls back to spawning python when no worker runs.
+A worker that gets no request for --idle-timeout seconds (default 30
+minutes) shuts itself down.
+
+Methods:
+
+    ping                                    -> {"pid", "uptime"}
+    list_tools                              -> {tool name: manifest}
+    run {"tool" | "script", "args", "cwd"}  -> {"exit_code", "stdout", "stderr", "seconds"}
+    shutdown
+
+Command line:
+
+    python toolbox_worker.py serve [--idle-timeout 1800]
+    python toolbox_worker.py status
+    python toolbox_worker.py run add_key_estimation --directory mcgill_jcrd
+    python toolbox_worker.py stop
+"""
+
+import argparse
+import contextlib
+import glob
+import importlib
+import importlib.util
+import io
+import json
+import os
+import runpy
+import secrets
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+STATE_FILE = os.path.join(tempfile.gettempdir(), "trk_toolbox_worker.json")
+PRELOAD_MODULES = ("numpy", "pretty_midi", "music21", "mirdata")
+HEARTBEAT_INTERVAL = 2.0
+DEFAULT_IDLE_TIMEOUT = 1800.0
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+UNAUTHORIZED = -32001
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def load_manifests(tools_dir=SCRIPT_DIR):
+    """Toolbox manifests by tool name (toolbox_entry_<name>.json)"""
+    manifests = {}
+    for path in sorted(glob.glob(os.path.join(tools_dir, "toolbox_entry_*.json"))):
+        name = os.path.basename(path)[len("toolbox_entry_"):-len(".json")]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifests[name] = json.load(f)
+        except (OSError, ValueError):
+            continue
+    return manifests
+
+
+def build_argv(args):
+    """
+    Command line arguments of a request
+
+    args is either a list of strings, passed as is, or a dict
+    {"directory": "x", "recursive": true}, turned into --directory x
+    --recursive (false and null values are left out).
+    """
+    if args is None:
+        return []
+    if isinstance(args, list):
+        return [str(arg) for arg in args]
+    if not isinstance(args, dict):
+        raise RpcError(INVALID_PARAMS, "args must be a list or an object")
+    argv = []
+    for key, value in args.items():
+        if value is None or value is False:
+            continue
+        argv.append(key if key.startswith("-") else f"--{key}")
+        if value is not True:
+            argv.append(str(value))
+    return argv
+
+
+class ToolRunner:
+    """Runs toolbox scripts in this process, one at a time"""
+
+    def __init__(self, tools_dir=SCRIPT_DIR):
+        self.tools_dir = tools_dir
+        self.manifests = load_manifests(tools_dir)
+        # script path -> (mtime_ns, module or None for scripts without main())
+        self.modules = {}
+        self.lock = threading.Lock()
+
+    def script_path(self, tool=None, script=None):
+        if tool is not None:
+            manifest = self.manifests.get(tool)
+            if manifest is None:
+                raise RpcError(INVALID_PARAMS, f"Unknown tool: {tool}")
+            script = manifest.get("script")
+        if not script:
+            raise RpcError(INVALID_PARAMS, "Missing tool or script")
+        path = script if os.path.isabs(script) else os.path.join(self.tools_dir, script)
+        if not os.path.isfile(path):
+            raise RpcError(INVALID_PARAMS, f"Script not found: {script}")
+        return os.path.abspath(path)
+
+    def _module(self, path):
+        """The imported module of a script with a main(), or None"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self.modules.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        module = None
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            source = f.read()
+        # scripts without main() do their work at import time
+        if "def main(" in source:
+            name = os.path.splitext(os.path.basename(path))[0]
+            module = sys.modules.get(name)
+            if cached is not None or getattr(module, "__file__", None) != path:
+                spec = importlib.util.spec_from_file_location(name, path)
+                module = importlib.util.module_from_spec(spec)
+                # register under the script name so sibling imports share it
+                sys.modules[name] = module
+                spec.loader.exec_module(module)
+        self.modules[path] = (mtime_ns, module)
+        return module
+
+    def preload(self, modules=PRELOAD_MODULES, verbose=False):
+        """Import the heavy libraries and every toolbox script with a main()"""
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                if verbose:
+                    print(f"Not preloaded: {name} ({e})")
+        for tool in self.manifests:
+            try:
+                self._module(self.script_path(tool=tool))
+            except Exception as e:
+                if verbose:
+                    print(f"Not preloaded: {tool} ({e})")
+
+    def run(self, path, argv, cwd=None):
+        """
+        Run a script as if started with python <path> <argv>
+
+        Returns:
+            dict with exit_code, stdout, stderr and seconds
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        start = time.perf_counter()
+        with self.lock:
+            saved_argv, saved_cwd = sys.argv, os.getcwd()
+            sys.argv = [path] + argv
+            exit_code = 0
+            try:
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    try:
+                        if cwd:
+                            os.chdir(cwd)
+                        module = self._module(path)
+                        if module is not None:
+                            # scripts that end with sys.exit(main()) return their exit code
+                            result = module.main()
+                            if isinstance(result, int):
+                                exit_code = result
+                        else:
+                            runpy.run_path(path, run_name="__main__")
+                    except SystemExit as e:
+                        if isinstance(e.code, int):
+                            exit_code = e.code
+                        elif e.code is not None:
+                            print(e.code, file=sys.stderr)
+                            exit_code = 1
+                    except BaseException:
+                        traceback.print_exc()
+                        exit_code = 1
+            finally:
+                sys.argv = saved_argv
+                os.chdir(saved_cwd)
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "seconds": time.perf_counter() - start,
+        }
+
+
+class ToolboxWorker:
+    """JSON-RPC front end of a ToolRunner"""
+
+    def __init__(self, runner, token):
+        self.runner = runner
+        self.token = token
+        self.started = self.last_request = time.time()
+        self.stopped = threading.Event()
+
+    def idle_for(self):
+        """Seconds since the last request, 0 while a tool is running"""
+        if self.runner.lock.locked():
+            return 0.0
+        return time.time() - self.last_request
+
+    def handle(self, request):
+        """Answer one decoded request; returns the response object"""
+        request_id = request.get("id") if isinstance(request, dict) else None
+        self.last_request = time.time()
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RpcError(INVALID_REQUEST, "Invalid request")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            if not secrets.compare_digest(str(params.get("token", "")), self.token):
+                raise RpcError(UNAUTHORIZED, "Invalid token")
+            result = self.dispatch(request["method"], params)
+            self.last_request = time.time()
+        except RpcError as e:
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": e.code, "message": str(e)}}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def handle_line(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "Parse error"}}
+        else:
+            response = self.handle(request)
+        return json.dumps(response, ensure_ascii=False) + "\n"
+
+    def dispatch(self, method, params):
+        if method == "ping":
+            return {"pid": os.getpid(), "uptime": time.time() - self.started}
+        if method == "list_tools":
+            return self.runner.manifests
+        if method == "run":
+            path = self.runner.script_path(params.get("tool"), params.get("script"))
+            return self.runner.run(path, build_argv(params.get("args")), params.get("cwd"))
+        if method == "shutdown":
+            self.stopped.set()
+            return {"pid": os.getpid()}
+        raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+class _TcpHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(self.server.worker.handle_line(line.decode("utf-8")).encode("utf-8"))
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve_pipes(worker, pipe_in, pipe_out):
+    """
+    Answer request lines written to pipe_in on pipe_out, one at a time
+
+    The worker keeps both FIFOs open for reading and writing, so pipe_in
+    never reaches end of file between clients and a reply is buffered in
+    pipe_out even before its client has opened it. A client that gave up
+    leaves its reply behind; clients skip replies whose id is not theirs.
+    """
+    requests = open(os.open(pipe_in, os.O_RDWR), "r", encoding="utf-8")
+    replies = open(os.open(pipe_out, os.O_RDWR), "w", encoding="utf-8")
+    with requests, replies:
+        for line in requests:
+            if worker.stopped.is_set():
+                break
+            if line.strip():
+                replies.write(worker.handle_line(line))
+                replies.flush()
+
+
+def _write_state(state):
+    tmp_path = f"{STATE_FILE}.{os.getpid()}.tmp"
+    with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def read_state():
+    """State of the running worker, or None"""
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def serve(port=0, pipes=True, preload=True, verbose=True, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """
+    Run the worker until it is asked to shut down, or until it has had no
+    request for idle_timeout seconds (None or 0 = never)
+    """
+    state = read_state()
+    if state and time.time() - state.get("heartbeat", 0) < 3 * HEARTBEAT_INTERVAL:
+        raise SystemExit(f"A toolbox worker is already running (pid {state.get('pid')})")
+
+    runner = ToolRunner()
+    if preload:
+        start = time.perf_counter()
+        runner.preload(verbose=verbose)
+        if verbose:
+            print(f"Preloaded {len(runner.modules)} tools in {time.perf_counter() - start:.1f}s")
+    worker = ToolboxWorker(runner, secrets.token_hex(16))
+
+    server = _TcpServer(("127.0.0.1", port), _TcpHandler)
+    server.worker = worker
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    state = {"pid": os.getpid(), "port": server.server_address[1], "token": worker.token}
+    if pipes and hasattr(os, "mkfifo"):
+        base = os.path.join(tempfile.gettempdir(), f"trk_toolbox_worker_{os.getpid()}")
+        state["pipe_in"], state["pipe_out"] = base + ".in", base + ".out"
+        for path in (state["pipe_in"], state["pipe_out"]):
+            os.mkfifo(path, 0o600)
+        threading.Thread(target=serve_pipes, args=(worker, state["pipe_in"], state["pipe_out"]),
+                         daemon=True).start()
+
+    state["heartbeat"] = time.time()
+    _write_state(state)
+    if verbose:
+        print(f"Toolbox worker {os.getpid()} listening on 127.0.0.1:{state['port']}")
+    try:
+        while not worker.stopped.wait(HEARTBEAT_INTERVAL):
+            if idle_timeout and worker.idle_for() > idle_timeout:
+                if verbose:
+                    print(f"No request for {idle_timeout:.0f}s, shutting down")
+                break
+            state["heartbeat"] = time.time()
+            _write_state(state)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        if (read_state() or {}).get("pid") == os.getpid():
+            os.remove(STATE_FILE)
+        for path in (state.get("pipe_in"), state.get("pipe_out")):
+            if path and os.path.exists(path):
+                os.remove(path)
+
+
+def call(method, params=None, timeout=None):
+    """Send one request to the running worker over TCP and return its result"""
+    state = read_state()
+    if state is None:
+        raise ConnectionError("No toolbox worker is running")
+    request = {"jsonrpc": "2.0", "id": 1, "method": method,
+               "params": dict(params or {}, token=state["token"])}
+    with socket.create_connection(("127.0.0.1", state["port"]), timeout=timeout) as sock:
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as f:
+            response = json.loads(f.readline())
+    if "error" in response:
+        raise RpcError(response["error"]["code"], response["error"]["message"])
+    return response["result"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent worker for the toolbox scripts")
+    subparsers = parser.add_subparsers(dest="command")
+    serve_parser = subparsers.add_parser("serve", help="Run the worker (default)")
+    serve_parser.add_argument("--port", type=int, default=0, help="TCP port (default: any free port)")
+    serve_parser.add_argument("--no-pipes", action="store_true", help="Do not create the named pipes")
+    serve_parser.add_argument("--no-preload", action="store_true", help="Import tools on first use")
+    serve_parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                              help="Shut down after this many seconds without a request (0 = never)")
+    subparsers.add_parser("status", help="Show the running worker")
+    subparsers.add_parser("stop", help="Stop the running worker")
+    run_parser = subparsers.add_parser("run", help="Run a tool in the worker")
+    run_parser.add_argument("tool", help="Tool name (toolbox_entry_<name>.json) or script path")
+    run_parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments of the tool")
+    args = parser.parse_args()
+
+    if args.command in (None, "serve"):
+        serve(getattr(args, "port", 0), not getattr(args, "no_pipes", False),
+              not getattr(args, "no_preload", False), idle_timeout=getattr(args, "idle_timeout", DEFAULT_IDLE_TIMEOUT))
+        return
+    try:
+        if args.command == "status":
+            print(json.dumps(dict(call("ping", timeout=5), **{"port": read_state()["port"]}), indent=2))
+        elif args.command == "stop":
+            call("shutdown", timeout=5)
+        else:
+            if os.path.isfile(args.tool):
+                target = {"script": os.path.abspath(args.tool)}
+            else:
+                target = {"script": args.tool} if args.tool.endswith(".py") else {"tool": args.tool}
+            result = call("run", dict(target, args=args.args, cwd=os.getcwd()))
+            sys.stdout.write(result["stdout"])
+            sys.stderr.write(result["stderr"])
+            sys.exit(result["exit_code"])
+    except (OSError, RpcError) as e:
+        print(f"Toolbox worker error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ follow the standardized structure with section support and forward compatibility
 """
 
 import os
-import json
+import jcrd_io
 import logging
 import argparse
 from pathlib import Path
@@ -91,8 +91,7 @@ def normalize_chord_name(chord):
 def update_jcrd_file(file_path, dry_run=False):
     """Update a JCRD file to follow the new schema."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jcrd_io.load(file_path)
 
         # Track changes made to the file
         changes = []
@@ -180,8 +179,7 @@ def update_jcrd_file(file_path, dry_run=False):
 
         # If we made any changes, save the file
         if changes and not dry_run:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            jcrd_io.dump(data, file_path)
             logging.info(f"Updated {file_path} with {len(changes)} changes")
             for change in changes:
                 logging.debug(f"  - {change}")
@@ -7,10 +7,11 @@
 #   --default-bpm: Default BPM if missing
 #   --default-beats: Default beats per section if missing
 
-import json
 from pathlib import Path
 from datetime import datetime
 
+import jcrd_io
+
 VALID_SECTION_TYPES = {
     "Verse",
     "Chorus",
@@ -73,8 +74,7 @@ def validate_and_fix_jcrd(
         for file_path in json_files:
             print(f"Processing JSON file: {file_path}")
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = jcrd_io.load(file_path)
 
                 changed = False
                 bpm = data.get("bpm", default_bpm)
@@ -186,8 +186,7 @@ def validate_and_fix_jcrd(
                     data["processed_by"] = "validate_jcrd.py"
                     data["fixed_at"] = datetime.utcnow().isoformat() + "Z"
                     output_path = output_dir / file_path.name
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        json.dump(data, f, indent=2)
+                    jcrd_io.dump(data, output_path)
                     report.append(
                         f"[{file_path.name}] FIXED and saved to {output_path}"
                     )
@@ -7,36 +7,14 @@ arguments:
 """
 
 import os
-import json
 import argparse
 
+import jcrd_validation
 
-def validate_jcrd_file(filepath):
-    errors = []
-    try:
-        with open(filepath, "r") as f:
-            data = json.load(f)
-
-        if "title" not in data or not data["title"]:
-            errors.append("Missing title")
-        if "artist" not in data or not data["artist"]:
-            errors.append("Missing artist")
-        if "sections" not in data or not isinstance(data["sections"], list):
-            errors.append("Missing or invalid sections array")
-        else:
-            for i, section in enumerate(data["sections"]):
-                if "start_ms" not in section:
-                    errors.append(f"Section {i+1} missing start_ms")
-                if "duration_ms" not in section:
-                    errors.append(f"Section {i+1} missing duration_ms")
-                if "chords" not in section or not isinstance(
-                    section["chords"], list
-                ):
-                    errors.append(f"Section {i+1} missing chords[]")
-    except Exception as e:
-        errors.append(f"Parse error: {e}")
 
-    return errors
+def validate_jcrd_file(filepath):
+    record = jcrd_validation.validate_file(filepath, ("required",))
+    return [error["message"] for error in record["errors"]]
 
 
 def main():
@@ -46,19 +24,23 @@ def main():
         default="mcgill_jcrd",
         help="Directory containing .jcrd files",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 0 = no pool)",
+    )
     args = parser.parse_args()
 
-    files = [f for f in os.listdir(args.directory) if f.endswith(".json")]
-    total = len(files)
+    paths = jcrd_validation.find_jcrd_files(args.directory, (".json",), recursive=False)
+    total = len(paths)
     broken = 0
 
-    for filename in sorted(files):
-        path = os.path.join(args.directory, filename)
-        issues = validate_jcrd_file(path)
-        if issues:
-            print(f"❌ {filename}")
-            for issue in issues:
-                print(f"   - {issue}")
+    for record in jcrd_validation.iter_validate(paths, ("required",), workers=args.workers):
+        if not record["valid"]:
+            print(f"❌ {os.path.relpath(record['path'], args.directory)}")
+            for error in record["errors"]:
+                print(f"   - {error['message']}")
             broken += 1
 
     print(f"\n✅ Checked {total} files. {broken} issue(s) found.")
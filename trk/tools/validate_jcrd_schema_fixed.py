@@ -12,7 +12,8 @@ import logging
 import argparse
 from pathlib import Path
 import sys
-import jsonschema
+
+import jcrd_validation
 
 # Setup logging
 logging.basicConfig(
@@ -24,128 +25,34 @@ logging.basicConfig(
     ],
 )
 
-# Define the JSON schema for validation
-JCRD_SCHEMA = {
-    "type": "object",
-    "required": ["title", "artist", "bpm", "sections"],
-    "properties": {
-        "title": {"type": "string"},
-        "artist": {"type": "string"},
-        "bpm": {"type": "number"},
-        "key": {"type": "string"},
-        "source": {"type": "string"},
-        "beat_times": {"type": "array", "items": {"type": "number"}},
-        "sections": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "required": ["id", "start_ms", "duration_ms", "chords"],
-                "properties": {
-                    "id": {"type": "string"},
-                    "start_ms": {"type": "number"},
-                    "duration_ms": {"type": "number"},
-                    "chords": {"type": "array", "items": {"type": "string"}},
-                    "romanNumerals": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                    },
-                    "tags": {"type": "array", "items": {"type": "string"}},
-                    "sectionLabel": {"type": "string"},
-                    "sectionLetter": {"type": "string"},
-                },
-                "additionalProperties": True,
-            },
-        },
-    },
-    "additionalProperties": True,
-}
+# Schema, logical and current-format checks, see jcrd_validation.py
+CHECKS = ("schema", "logic", "fields")
+
+
+def _log_record(record):
+    """Log a jcrd_validation result and return (valid, errors)"""
+    file_path = record["path"]
+    errors = [error["message"] for error in record["errors"]]
+    schema = [e for e in record["errors"] if e["check"] in ("schema", "parse")]
+    if schema:
+        logging.error(
+            f"{file_path}: Schema validation failed - {schema[0]['message']}"
+        )
+    elif errors:
+        logging.warning(
+            f"{file_path}: Schema valid but found {len(errors)} logical errors"
+        )
+        for error in errors:
+            logging.warning(f"  - {error}")
+    return record["valid"], errors
 
 
 def validate_jcrd_file(file_path):
     """Validate a single JCRD file against the schema."""
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        jsonschema.validate(instance=data, schema=JCRD_SCHEMA)
-
-        # Additional validation beyond the schema
-        errors = []
-
-        # Check for empty required fields
-        if not data.get("title"):
-            errors.append("Empty title field")
-        if not data.get("artist"):
-            errors.append("Empty artist field")
-
-        # Check for new schema requirements
-        if "key" not in data:
-            errors.append("Missing 'key' field (required in new schema)")
-        if "beat_times" not in data:
-            errors.append(
-                "Missing 'beat_times' array (required in new schema)"
-            )
+    return _log_record(jcrd_validation.validate_file(str(file_path), CHECKS))
 
-        # Check for valid section IDs
-        section_ids = set()
-        for i, section in enumerate(data.get("sections", [])):
-            section_id = section.get("id", "")
-            if section_id in section_ids:
-                errors.append(f"Duplicate section ID: {section_id}")
-            section_ids.add(section_id)
-
-            # Check for negative or invalid times
-            if section.get("start_ms", 0) < 0:
-                errors.append(
-                    f"Section {section_id} has negative start_ms: {section.get('start_ms')}"
-                )
-            if section.get("duration_ms", 0) <= 0:
-                errors.append(
-                    f"Section {section_id} has zero or negative duration_ms: {section.get('duration_ms')}"
-                )
-
-            # Check for romanNumerals field
-            if "romanNumerals" not in section:
-                errors.append(
-                    f"Section {section_id} missing 'romanNumerals' array (required in new schema)"
-                )
-
-            # Check for tags field
-            if "tags" not in section:
-                errors.append(
-                    f"Section {section_id} missing 'tags' array (required in new schema)"
-                )
-
-        # Check for valid beat_times if present
-        beat_times = data.get("beat_times", [])
-        if beat_times:
-            for i, time in enumerate(beat_times):
-                if i > 0 and time <= beat_times[i - 1]:
-                    errors.append(
-                        f"Non-monotonic beat_times at index {i}: {time} <= {beat_times[i-1]}"
-                    )
-
-        if errors:
-            logging.warning(
-                f"{file_path}: Schema valid but found {len(errors)} logical errors"
-            )
-            for error in errors:
-                logging.warning(f"  - {error}")
-            return False, errors
-
-        return True, []
-    except json.JSONDecodeError as e:
-        logging.error(f"{file_path}: Invalid JSON - {e}")
-        return False, [f"Invalid JSON: {e}"]
-    except jsonschema.exceptions.ValidationError as e:
-        logging.error(f"{file_path}: Schema validation failed - {e.message}")
-        return False, [f"Schema validation failed: {e.message}"]
-    except Exception as e:
-        logging.error(f"{file_path}: Error - {e}")
-        return False, [f"Error: {e}"]
-
-
-def validate_all_jcrd_files(directory):
+
+def validate_all_jcrd_files(directory, workers=None, cache_path=None):
     """Validate all JCRD files in a directory."""
     total_files = 0
     valid_files = 0
@@ -153,19 +60,19 @@ def validate_all_jcrd_files(directory):
 
     issues = {}
 
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.endswith(".json"):
-                total_files += 1
-                file_path = os.path.join(root, filename)
-
-                valid, errors = validate_jcrd_file(file_path)
-                if valid:
-                    valid_files += 1
-                    logging.info(f"{file_path}: Valid")
-                else:
-                    invalid_files += 1
-                    issues[file_path] = errors
+    paths = jcrd_validation.find_jcrd_files(str(directory), (".json",))
+    for record in jcrd_validation.iter_validate(
+        paths, CHECKS, workers=workers, cache_path=cache_path
+    ):
+        total_files += 1
+        file_path = record["path"]
+        valid, errors = _log_record(record)
+        if valid:
+            valid_files += 1
+            logging.info(f"{file_path}: Valid")
+        else:
+            invalid_files += 1
+            issues[file_path] = errors
 
     logging.info(
         f"Processed {total_files} files: {valid_files} valid, {invalid_files} invalid"
@@ -198,6 +105,17 @@ def main():
     parser.add_argument(
         "--file", type=str, help="Single JCRD file to validate"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 0 = no pool)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        help="Results cache, only files changed since the last run are validated",
+    )
     args = parser.parse_args()
 
     if args.verbose:
@@ -234,7 +152,7 @@ def main():
 
         logging.info(f"Validating JCRD files in {jcrd_dir}")
         valid_files, invalid_files, total_files = validate_all_jcrd_files(
-            jcrd_dir
+            jcrd_dir, args.workers, args.cache
         )
 
         # Print summary
@@ -7,51 +7,24 @@ arguments:
 """
 
 import os
-import json
 import argparse
 
+import jcrd_validation
 
-def validate_file(path):
-    try:
-        with open(path, "r") as f:
-            data = json.load(f)
-
-        filename = os.path.basename(path)
-        results = []
+# Schema, required fields, key/sections/chords and consistency, see jcrd_validation.py
+CHECKS = ("schema", "required", "structure", "logic")
 
-        if not data.get("title"):
-            results.append("missing title")
-        if not data.get("artist"):
-            results.append("missing artist")
-        if not isinstance(data.get("bpm"), (int, float)):
-            results.append("invalid bpm")
-        if "key" not in data:
-            results.append("missing key")
-
-        sections = data.get("sections", [])
-        if not sections:
-            results.append("no sections")
-        else:
-            for i, sec in enumerate(sections):
-                if "start_ms" not in sec or "duration_ms" not in sec:
-                    results.append(f"section {i} missing timing")
-                chords = sec.get("chords", [])
-                if not chords:
-                    results.append(f"section {i} has no chords")
-                roman = sec.get("romanNumerals", [])
-                if roman and len(roman) != len(chords):
-                    results.append(
-                        f"section {i} mismatch chords/romanNumerals"
-                    )
 
-        beat_times = data.get("beat_times", [])
-        if beat_times and not isinstance(beat_times, list):
-            results.append("beat_times present but malformed")
+def validate_file(path):
+    record = jcrd_validation.validate_file(path, CHECKS)
+    filename = os.path.basename(path)
+    return filename, [_format(error) for error in record["errors"]]
 
-        return filename, results
 
-    except Exception as e:
-        return os.path.basename(path), [f"exception: {e}"]
+def _format(error):
+    if error["path"]:
+        return f"{error['path']}: {error['message']}"
+    return error["message"]
 
 
 def main():
@@ -63,18 +36,30 @@ def main():
         default="mcgill_jcrd",
         help="Folder containing .jcrd files",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 0 = no pool)",
+    )
     args = parser.parse_args()
 
-    files = [f for f in os.listdir(args.directory) if f.endswith(".json")]
-    print(f"Validating {len(files)} files...\n")
+    paths = jcrd_validation.find_jcrd_files(
+        args.directory, (".json",), recursive=False
+    )
+    print(f"Validating {len(paths)} files...\n")
 
-    for fname in sorted(files):
-        path = os.path.join(args.directory, fname)
-        filename, issues = validate_file(path)
-        if not issues:
+    for record in jcrd_validation.iter_validate(
+        paths, CHECKS, workers=args.workers
+    ):
+        filename = os.path.basename(record["path"])
+        if record["valid"]:
             print(f"✅ {filename}")
         else:
-            print(f"❌ {filename} → " + "; ".join(issues))
+            print(
+                f"❌ {filename} → "
+                + "; ".join(_format(error) for error in record["errors"])
+            )
 
 
 if __name__ == "__main__":